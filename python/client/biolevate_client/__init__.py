@@ -13,7 +13,6 @@
     Do not edit the class manually.
 """  # noqa: E501
 
-
 __version__ = "1.0.0"
 
 # Define package exports
@@ -106,95 +105,197 @@ __all__ = [
     "UserIdExternal",
 ]
 
-# import apis into sdk package
-from biolevate_client.api.collections_api import CollectionsApi as CollectionsApi
-from biolevate_client.api.extraction_api import ExtractionApi as ExtractionApi
-from biolevate_client.api.files_api import FilesApi as FilesApi
-from biolevate_client.api.provider_items_api import ProviderItemsApi as ProviderItemsApi
-from biolevate_client.api.providers_api import ProvidersApi as ProvidersApi
-from biolevate_client.api.question_answering_api import QuestionAnsweringApi as QuestionAnsweringApi
+# Lazy imports (patched, see tools/patch-lazy-imports.py)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+_LAZY_IMPORTS = {
+    "CollectionsApi": "biolevate_client.api.collections_api",
+    "ExtractionApi": "biolevate_client.api.extraction_api",
+    "FilesApi": "biolevate_client.api.files_api",
+    "ProviderItemsApi": "biolevate_client.api.provider_items_api",
+    "ProvidersApi": "biolevate_client.api.providers_api",
+    "QuestionAnsweringApi": "biolevate_client.api.question_answering_api",
+    "ApiResponse": "biolevate_client.api_response",
+    "ApiClient": "biolevate_client.api_client",
+    "Configuration": "biolevate_client.configuration",
+    "OpenApiException": "biolevate_client.exceptions",
+    "ApiTypeError": "biolevate_client.exceptions",
+    "ApiValueError": "biolevate_client.exceptions",
+    "ApiKeyError": "biolevate_client.exceptions",
+    "ApiAttributeError": "biolevate_client.exceptions",
+    "ApiException": "biolevate_client.exceptions",
+    "AddFileToCollectionRequest": "biolevate_client.models.add_file_to_collection_request",
+    "AnnotationId": "biolevate_client.models.annotation_id",
+    "BboxDto": "biolevate_client.models.bbox_dto",
+    "CollectionId": "biolevate_client.models.collection_id",
+    "CollectionViewId": "biolevate_client.models.collection_view_id",
+    "ConfirmUploadRequest": "biolevate_client.models.confirm_upload_request",
+    "CreateCollectionRequest": "biolevate_client.models.create_collection_request",
+    "CreateExtractRequest": "biolevate_client.models.create_extract_request",
+    "CreateFileRequest": "biolevate_client.models.create_file_request",
+    "CreateItemRequest": "biolevate_client.models.create_item_request",
+    "CreateQARequest": "biolevate_client.models.create_qa_request",
+    "DataValue": "biolevate_client.models.data_value",
+    "DownloadUrlResponse": "biolevate_client.models.download_url_response",
+    "EliseAnnotation": "biolevate_client.models.elise_annotation",
+    "EliseAnnotationConfig": "biolevate_client.models.elise_annotation_config",
+    "EliseAnnotationData": "biolevate_client.models.elise_annotation_data",
+    "EliseCollectionInfo": "biolevate_client.models.elise_collection_info",
+    "EliseDocumentStatement": "biolevate_client.models.elise_document_statement",
+    "EliseDocumentStatementAllOfPositions": "biolevate_client.models.elise_document_statement_all_of_positions",
+    "EliseExternalDocumentStatement": "biolevate_client.models.elise_external_document_statement",
+    "EliseFileInfo": "biolevate_client.models.elise_file_info",
+    "EliseFullDocumentStatement": "biolevate_client.models.elise_full_document_statement",
+    "EliseKnowledgeStatement": "biolevate_client.models.elise_knowledge_statement",
+    "EliseMetaInput": "biolevate_client.models.elise_meta_input",
+    "EliseMetaResult": "biolevate_client.models.elise_meta_result",
+    "EliseOntology": "biolevate_client.models.elise_ontology",
+    "EliseOntologyMeta": "biolevate_client.models.elise_ontology_meta",
+    "EliseQAResult": "biolevate_client.models.elise_qa_result",
+    "EliseQuestionInput": "biolevate_client.models.elise_question_input",
+    "EliseReviewComment": "biolevate_client.models.elise_review_comment",
+    "EliseWebStatement": "biolevate_client.models.elise_web_statement",
+    "EntityId": "biolevate_client.models.entity_id",
+    "ExpectedAnswerTypeDto": "biolevate_client.models.expected_answer_type_dto",
+    "ExtractJobInputs": "biolevate_client.models.extract_job_inputs",
+    "ExtractJobOutputs": "biolevate_client.models.extract_job_outputs",
+    "FSProviderAzureConfigExternal": "biolevate_client.models.fs_provider_azure_config_external",
+    "FSProviderConfigurationExternal": "biolevate_client.models.fs_provider_configuration_external",
+    "FSProviderExternal": "biolevate_client.models.fs_provider_external",
+    "FSProviderExternalConfig": "biolevate_client.models.fs_provider_external_config",
+    "FSProviderGCSConfigExternal": "biolevate_client.models.fs_provider_gcs_config_external",
+    "FSProviderLeanearConfigExternal": "biolevate_client.models.fs_provider_leanear_config_external",
+    "FSProviderLocalConfigExternal": "biolevate_client.models.fs_provider_local_config_external",
+    "FSProviderS3ConfigExternal": "biolevate_client.models.fs_provider_s3_config_external",
+    "FSProviderSFTPConfigExternal": "biolevate_client.models.fs_provider_sftp_config_external",
+    "FSProviderSharepointOnlineConfigExternal": "biolevate_client.models.fs_provider_sharepoint_online_config_external",
+    "FileId": "biolevate_client.models.file_id",
+    "FilesInput": "biolevate_client.models.files_input",
+    "ItemReference": "biolevate_client.models.item_reference",
+    "Job": "biolevate_client.models.job",
+    "LibItemIndexationInfos": "biolevate_client.models.lib_item_indexation_infos",
+    "ListItemsResponse": "biolevate_client.models.list_items_response",
+    "PageDataEliseCollectionInfo": "biolevate_client.models.page_data_elise_collection_info",
+    "PageDataEliseFileInfo": "biolevate_client.models.page_data_elise_file_info",
+    "PageDataFSProviderExternal": "biolevate_client.models.page_data_fs_provider_external",
+    "PageDataJob": "biolevate_client.models.page_data_job",
+    "PolicyId": "biolevate_client.models.policy_id",
+    "PolicyIdExternal": "biolevate_client.models.policy_id_external",
+    "PositionBboxDto": "biolevate_client.models.position_bbox_dto",
+    "PositionCellDto": "biolevate_client.models.position_cell_dto",
+    "PositionDto": "biolevate_client.models.position_dto",
+    "PositionLineDto": "biolevate_client.models.position_line_dto",
+    "ProviderId": "biolevate_client.models.provider_id",
+    "ProviderIdExternal": "biolevate_client.models.provider_id_external",
+    "ProviderItem": "biolevate_client.models.provider_item",
+    "QAJobInputs": "biolevate_client.models.qa_job_inputs",
+    "QAJobOutputs": "biolevate_client.models.qa_job_outputs",
+    "UpdateCollectionRequest": "biolevate_client.models.update_collection_request",
+    "UploadUrlRequest": "biolevate_client.models.upload_url_request",
+    "UploadUrlResponse": "biolevate_client.models.upload_url_response",
+    "UserId": "biolevate_client.models.user_id",
+    "UserIdExternal": "biolevate_client.models.user_id_external",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
-# import ApiClient
-from biolevate_client.api_response import ApiResponse as ApiResponse
-from biolevate_client.api_client import ApiClient as ApiClient
-from biolevate_client.configuration import Configuration as Configuration
-from biolevate_client.exceptions import OpenApiException as OpenApiException
-from biolevate_client.exceptions import ApiTypeError as ApiTypeError
-from biolevate_client.exceptions import ApiValueError as ApiValueError
-from biolevate_client.exceptions import ApiKeyError as ApiKeyError
-from biolevate_client.exceptions import ApiAttributeError as ApiAttributeError
-from biolevate_client.exceptions import ApiException as ApiException
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# import models into sdk package
-from biolevate_client.models.add_file_to_collection_request import AddFileToCollectionRequest as AddFileToCollectionRequest
-from biolevate_client.models.annotation_id import AnnotationId as AnnotationId
-from biolevate_client.models.bbox_dto import BboxDto as BboxDto
-from biolevate_client.models.collection_id import CollectionId as CollectionId
-from biolevate_client.models.collection_view_id import CollectionViewId as CollectionViewId
-from biolevate_client.models.confirm_upload_request import ConfirmUploadRequest as ConfirmUploadRequest
-from biolevate_client.models.create_collection_request import CreateCollectionRequest as CreateCollectionRequest
-from biolevate_client.models.create_extract_request import CreateExtractRequest as CreateExtractRequest
-from biolevate_client.models.create_file_request import CreateFileRequest as CreateFileRequest
-from biolevate_client.models.create_item_request import CreateItemRequest as CreateItemRequest
-from biolevate_client.models.create_qa_request import CreateQARequest as CreateQARequest
-from biolevate_client.models.data_value import DataValue as DataValue
-from biolevate_client.models.download_url_response import DownloadUrlResponse as DownloadUrlResponse
-from biolevate_client.models.elise_annotation import EliseAnnotation as EliseAnnotation
-from biolevate_client.models.elise_annotation_config import EliseAnnotationConfig as EliseAnnotationConfig
-from biolevate_client.models.elise_annotation_data import EliseAnnotationData as EliseAnnotationData
-from biolevate_client.models.elise_collection_info import EliseCollectionInfo as EliseCollectionInfo
-from biolevate_client.models.elise_document_statement import EliseDocumentStatement as EliseDocumentStatement
-from biolevate_client.models.elise_document_statement_all_of_positions import EliseDocumentStatementAllOfPositions as EliseDocumentStatementAllOfPositions
-from biolevate_client.models.elise_external_document_statement import EliseExternalDocumentStatement as EliseExternalDocumentStatement
-from biolevate_client.models.elise_file_info import EliseFileInfo as EliseFileInfo
-from biolevate_client.models.elise_full_document_statement import EliseFullDocumentStatement as EliseFullDocumentStatement
-from biolevate_client.models.elise_knowledge_statement import EliseKnowledgeStatement as EliseKnowledgeStatement
-from biolevate_client.models.elise_meta_input import EliseMetaInput as EliseMetaInput
-from biolevate_client.models.elise_meta_result import EliseMetaResult as EliseMetaResult
-from biolevate_client.models.elise_ontology import EliseOntology as EliseOntology
-from biolevate_client.models.elise_ontology_meta import EliseOntologyMeta as EliseOntologyMeta
-from biolevate_client.models.elise_qa_result import EliseQAResult as EliseQAResult
-from biolevate_client.models.elise_question_input import EliseQuestionInput as EliseQuestionInput
-from biolevate_client.models.elise_review_comment import EliseReviewComment as EliseReviewComment
-from biolevate_client.models.elise_web_statement import EliseWebStatement as EliseWebStatement
-from biolevate_client.models.entity_id import EntityId as EntityId
-from biolevate_client.models.expected_answer_type_dto import ExpectedAnswerTypeDto as ExpectedAnswerTypeDto
-from biolevate_client.models.extract_job_inputs import ExtractJobInputs as ExtractJobInputs
-from biolevate_client.models.extract_job_outputs import ExtractJobOutputs as ExtractJobOutputs
-from biolevate_client.models.fs_provider_azure_config_external import FSProviderAzureConfigExternal as FSProviderAzureConfigExternal
-from biolevate_client.models.fs_provider_configuration_external import FSProviderConfigurationExternal as FSProviderConfigurationExternal
-from biolevate_client.models.fs_provider_external import FSProviderExternal as FSProviderExternal
-from biolevate_client.models.fs_provider_external_config import FSProviderExternalConfig as FSProviderExternalConfig
-from biolevate_client.models.fs_provider_gcs_config_external import FSProviderGCSConfigExternal as FSProviderGCSConfigExternal
-from biolevate_client.models.fs_provider_leanear_config_external import FSProviderLeanearConfigExternal as FSProviderLeanearConfigExternal
-from biolevate_client.models.fs_provider_local_config_external import FSProviderLocalConfigExternal as FSProviderLocalConfigExternal
-from biolevate_client.models.fs_provider_s3_config_external import FSProviderS3ConfigExternal as FSProviderS3ConfigExternal
-from biolevate_client.models.fs_provider_sftp_config_external import FSProviderSFTPConfigExternal as FSProviderSFTPConfigExternal
-from biolevate_client.models.fs_provider_sharepoint_online_config_external import FSProviderSharepointOnlineConfigExternal as FSProviderSharepointOnlineConfigExternal
-from biolevate_client.models.file_id import FileId as FileId
-from biolevate_client.models.files_input import FilesInput as FilesInput
-from biolevate_client.models.item_reference import ItemReference as ItemReference
-from biolevate_client.models.job import Job as Job
-from biolevate_client.models.lib_item_indexation_infos import LibItemIndexationInfos as LibItemIndexationInfos
-from biolevate_client.models.list_items_response import ListItemsResponse as ListItemsResponse
-from biolevate_client.models.page_data_elise_collection_info import PageDataEliseCollectionInfo as PageDataEliseCollectionInfo
-from biolevate_client.models.page_data_elise_file_info import PageDataEliseFileInfo as PageDataEliseFileInfo
-from biolevate_client.models.page_data_fs_provider_external import PageDataFSProviderExternal as PageDataFSProviderExternal
-from biolevate_client.models.page_data_job import PageDataJob as PageDataJob
-from biolevate_client.models.policy_id import PolicyId as PolicyId
-from biolevate_client.models.policy_id_external import PolicyIdExternal as PolicyIdExternal
-from biolevate_client.models.position_bbox_dto import PositionBboxDto as PositionBboxDto
-from biolevate_client.models.position_cell_dto import PositionCellDto as PositionCellDto
-from biolevate_client.models.position_dto import PositionDto as PositionDto
-from biolevate_client.models.position_line_dto import PositionLineDto as PositionLineDto
-from biolevate_client.models.provider_id import ProviderId as ProviderId
-from biolevate_client.models.provider_id_external import ProviderIdExternal as ProviderIdExternal
-from biolevate_client.models.provider_item import ProviderItem as ProviderItem
-from biolevate_client.models.qa_job_inputs import QAJobInputs as QAJobInputs
-from biolevate_client.models.qa_job_outputs import QAJobOutputs as QAJobOutputs
-from biolevate_client.models.update_collection_request import UpdateCollectionRequest as UpdateCollectionRequest
-from biolevate_client.models.upload_url_request import UploadUrlRequest as UploadUrlRequest
-from biolevate_client.models.upload_url_response import UploadUrlResponse as UploadUrlResponse
-from biolevate_client.models.user_id import UserId as UserId
-from biolevate_client.models.user_id_external import UserIdExternal as UserIdExternal
 
+if _TYPE_CHECKING:
+    from biolevate_client.api.collections_api import CollectionsApi as CollectionsApi
+    from biolevate_client.api.extraction_api import ExtractionApi as ExtractionApi
+    from biolevate_client.api.files_api import FilesApi as FilesApi
+    from biolevate_client.api.provider_items_api import ProviderItemsApi as ProviderItemsApi
+    from biolevate_client.api.providers_api import ProvidersApi as ProvidersApi
+    from biolevate_client.api.question_answering_api import QuestionAnsweringApi as QuestionAnsweringApi
+    from biolevate_client.api_response import ApiResponse as ApiResponse
+    from biolevate_client.api_client import ApiClient as ApiClient
+    from biolevate_client.configuration import Configuration as Configuration
+    from biolevate_client.exceptions import OpenApiException as OpenApiException
+    from biolevate_client.exceptions import ApiTypeError as ApiTypeError
+    from biolevate_client.exceptions import ApiValueError as ApiValueError
+    from biolevate_client.exceptions import ApiKeyError as ApiKeyError
+    from biolevate_client.exceptions import ApiAttributeError as ApiAttributeError
+    from biolevate_client.exceptions import ApiException as ApiException
+    from biolevate_client.models.add_file_to_collection_request import AddFileToCollectionRequest as AddFileToCollectionRequest
+    from biolevate_client.models.annotation_id import AnnotationId as AnnotationId
+    from biolevate_client.models.bbox_dto import BboxDto as BboxDto
+    from biolevate_client.models.collection_id import CollectionId as CollectionId
+    from biolevate_client.models.collection_view_id import CollectionViewId as CollectionViewId
+    from biolevate_client.models.confirm_upload_request import ConfirmUploadRequest as ConfirmUploadRequest
+    from biolevate_client.models.create_collection_request import CreateCollectionRequest as CreateCollectionRequest
+    from biolevate_client.models.create_extract_request import CreateExtractRequest as CreateExtractRequest
+    from biolevate_client.models.create_file_request import CreateFileRequest as CreateFileRequest
+    from biolevate_client.models.create_item_request import CreateItemRequest as CreateItemRequest
+    from biolevate_client.models.create_qa_request import CreateQARequest as CreateQARequest
+    from biolevate_client.models.data_value import DataValue as DataValue
+    from biolevate_client.models.download_url_response import DownloadUrlResponse as DownloadUrlResponse
+    from biolevate_client.models.elise_annotation import EliseAnnotation as EliseAnnotation
+    from biolevate_client.models.elise_annotation_config import EliseAnnotationConfig as EliseAnnotationConfig
+    from biolevate_client.models.elise_annotation_data import EliseAnnotationData as EliseAnnotationData
+    from biolevate_client.models.elise_collection_info import EliseCollectionInfo as EliseCollectionInfo
+    from biolevate_client.models.elise_document_statement import EliseDocumentStatement as EliseDocumentStatement
+    from biolevate_client.models.elise_document_statement_all_of_positions import EliseDocumentStatementAllOfPositions as EliseDocumentStatementAllOfPositions
+    from biolevate_client.models.elise_external_document_statement import EliseExternalDocumentStatement as EliseExternalDocumentStatement
+    from biolevate_client.models.elise_file_info import EliseFileInfo as EliseFileInfo
+    from biolevate_client.models.elise_full_document_statement import EliseFullDocumentStatement as EliseFullDocumentStatement
+    from biolevate_client.models.elise_knowledge_statement import EliseKnowledgeStatement as EliseKnowledgeStatement
+    from biolevate_client.models.elise_meta_input import EliseMetaInput as EliseMetaInput
+    from biolevate_client.models.elise_meta_result import EliseMetaResult as EliseMetaResult
+    from biolevate_client.models.elise_ontology import EliseOntology as EliseOntology
+    from biolevate_client.models.elise_ontology_meta import EliseOntologyMeta as EliseOntologyMeta
+    from biolevate_client.models.elise_qa_result import EliseQAResult as EliseQAResult
+    from biolevate_client.models.elise_question_input import EliseQuestionInput as EliseQuestionInput
+    from biolevate_client.models.elise_review_comment import EliseReviewComment as EliseReviewComment
+    from biolevate_client.models.elise_web_statement import EliseWebStatement as EliseWebStatement
+    from biolevate_client.models.entity_id import EntityId as EntityId
+    from biolevate_client.models.expected_answer_type_dto import ExpectedAnswerTypeDto as ExpectedAnswerTypeDto
+    from biolevate_client.models.extract_job_inputs import ExtractJobInputs as ExtractJobInputs
+    from biolevate_client.models.extract_job_outputs import ExtractJobOutputs as ExtractJobOutputs
+    from biolevate_client.models.fs_provider_azure_config_external import FSProviderAzureConfigExternal as FSProviderAzureConfigExternal
+    from biolevate_client.models.fs_provider_configuration_external import FSProviderConfigurationExternal as FSProviderConfigurationExternal
+    from biolevate_client.models.fs_provider_external import FSProviderExternal as FSProviderExternal
+    from biolevate_client.models.fs_provider_external_config import FSProviderExternalConfig as FSProviderExternalConfig
+    from biolevate_client.models.fs_provider_gcs_config_external import FSProviderGCSConfigExternal as FSProviderGCSConfigExternal
+    from biolevate_client.models.fs_provider_leanear_config_external import FSProviderLeanearConfigExternal as FSProviderLeanearConfigExternal
+    from biolevate_client.models.fs_provider_local_config_external import FSProviderLocalConfigExternal as FSProviderLocalConfigExternal
+    from biolevate_client.models.fs_provider_s3_config_external import FSProviderS3ConfigExternal as FSProviderS3ConfigExternal
+    from biolevate_client.models.fs_provider_sftp_config_external import FSProviderSFTPConfigExternal as FSProviderSFTPConfigExternal
+    from biolevate_client.models.fs_provider_sharepoint_online_config_external import FSProviderSharepointOnlineConfigExternal as FSProviderSharepointOnlineConfigExternal
+    from biolevate_client.models.file_id import FileId as FileId
+    from biolevate_client.models.files_input import FilesInput as FilesInput
+    from biolevate_client.models.item_reference import ItemReference as ItemReference
+    from biolevate_client.models.job import Job as Job
+    from biolevate_client.models.lib_item_indexation_infos import LibItemIndexationInfos as LibItemIndexationInfos
+    from biolevate_client.models.list_items_response import ListItemsResponse as ListItemsResponse
+    from biolevate_client.models.page_data_elise_collection_info import PageDataEliseCollectionInfo as PageDataEliseCollectionInfo
+    from biolevate_client.models.page_data_elise_file_info import PageDataEliseFileInfo as PageDataEliseFileInfo
+    from biolevate_client.models.page_data_fs_provider_external import PageDataFSProviderExternal as PageDataFSProviderExternal
+    from biolevate_client.models.page_data_job import PageDataJob as PageDataJob
+    from biolevate_client.models.policy_id import PolicyId as PolicyId
+    from biolevate_client.models.policy_id_external import PolicyIdExternal as PolicyIdExternal
+    from biolevate_client.models.position_bbox_dto import PositionBboxDto as PositionBboxDto
+    from biolevate_client.models.position_cell_dto import PositionCellDto as PositionCellDto
+    from biolevate_client.models.position_dto import PositionDto as PositionDto
+    from biolevate_client.models.position_line_dto import PositionLineDto as PositionLineDto
+    from biolevate_client.models.provider_id import ProviderId as ProviderId
+    from biolevate_client.models.provider_id_external import ProviderIdExternal as ProviderIdExternal
+    from biolevate_client.models.provider_item import ProviderItem as ProviderItem
+    from biolevate_client.models.qa_job_inputs import QAJobInputs as QAJobInputs
+    from biolevate_client.models.qa_job_outputs import QAJobOutputs as QAJobOutputs
+    from biolevate_client.models.update_collection_request import UpdateCollectionRequest as UpdateCollectionRequest
+    from biolevate_client.models.upload_url_request import UploadUrlRequest as UploadUrlRequest
+    from biolevate_client.models.upload_url_response import UploadUrlResponse as UploadUrlResponse
+    from biolevate_client.models.user_id import UserId as UserId
+    from biolevate_client.models.user_id_external import UserIdExternal as UserIdExternal
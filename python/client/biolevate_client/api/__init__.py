@@ -1,10 +1,36 @@
 # flake8: noqa
 
-# import apis into api package
-from biolevate_client.api.collections_api import CollectionsApi
-from biolevate_client.api.extraction_api import ExtractionApi
-from biolevate_client.api.files_api import FilesApi
-from biolevate_client.api.provider_items_api import ProviderItemsApi
-from biolevate_client.api.providers_api import ProvidersApi
-from biolevate_client.api.question_answering_api import QuestionAnsweringApi
+# Lazy imports (patched, see tools/patch-lazy-imports.py)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
 
+_LAZY_IMPORTS = {
+    "CollectionsApi": "biolevate_client.api.collections_api",
+    "ExtractionApi": "biolevate_client.api.extraction_api",
+    "FilesApi": "biolevate_client.api.files_api",
+    "ProviderItemsApi": "biolevate_client.api.provider_items_api",
+    "ProvidersApi": "biolevate_client.api.providers_api",
+    "QuestionAnsweringApi": "biolevate_client.api.question_answering_api",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if _TYPE_CHECKING:
+    from biolevate_client.api.collections_api import CollectionsApi
+    from biolevate_client.api.extraction_api import ExtractionApi
+    from biolevate_client.api.files_api import FilesApi
+    from biolevate_client.api.provider_items_api import ProviderItemsApi
+    from biolevate_client.api.providers_api import ProvidersApi
+    from biolevate_client.api.question_answering_api import QuestionAnsweringApi
@@ -1,3 +1,4 @@
+# Awaitable deserialization (patched, see tools/patch-async-deserialize.py)
 """
     Biolevate API
 
@@ -113,10 +114,10 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -188,7 +189,7 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -408,10 +409,10 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -477,7 +478,7 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -689,10 +690,10 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -759,7 +760,7 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -952,10 +953,10 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1022,7 +1023,7 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1242,10 +1243,10 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1332,7 +1333,7 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1591,10 +1592,10 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1675,7 +1676,7 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1915,10 +1916,10 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1989,7 +1990,7 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -2194,10 +2195,10 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -2269,7 +2270,7 @@ class CollectionsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1,3 +1,4 @@
+# Awaitable deserialization (patched, see tools/patch-async-deserialize.py)
 """
     Biolevate API
 
@@ -107,10 +108,10 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -177,7 +178,7 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -390,10 +391,10 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -460,7 +461,7 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -660,10 +661,10 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -730,7 +731,7 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -930,10 +931,10 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1000,7 +1001,7 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1200,10 +1201,10 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1270,7 +1271,7 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1480,10 +1481,10 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1560,7 +1561,7 @@ class ExtractionApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1,3 +1,4 @@
+# Awaitable deserialization (patched, see tools/patch-async-deserialize.py)
 """
     Biolevate API
 
@@ -105,10 +106,10 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -175,7 +176,7 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -388,10 +389,10 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -458,7 +459,7 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -651,10 +652,10 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -721,7 +722,7 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -921,10 +922,10 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -991,7 +992,7 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1207,10 +1208,10 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1293,7 +1294,7 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1531,10 +1532,10 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1601,7 +1602,7 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1798,10 +1799,10 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1872,7 +1873,7 @@ class FilesApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1,3 +1,4 @@
+# Awaitable deserialization (patched, see tools/patch-async-deserialize.py)
 """
     Biolevate API
 
@@ -111,10 +112,10 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -184,7 +185,7 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -407,10 +408,10 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -481,7 +482,7 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -702,10 +703,10 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -780,7 +781,7 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1002,10 +1003,10 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1076,7 +1077,7 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1288,10 +1289,10 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1361,7 +1362,7 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1596,10 +1597,10 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -1682,7 +1683,7 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1927,10 +1928,10 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -2006,7 +2007,7 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -2243,10 +2244,10 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -2320,7 +2321,7 @@ class ProviderItemsApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -1,3 +1,4 @@
+# Awaitable deserialization (patched, see tools/patch-async-deserialize.py)
 """
     Biolevate API
 
@@ -103,10 +104,10 @@ class ProvidersApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -173,7 +174,7 @@ class ProvidersApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
@@ -387,10 +388,10 @@ class ProvidersApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return (await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
-        ).data
+        )).data
 
 
     @validate_call
@@ -471,7 +472,7 @@ class ProvidersApi:
             _request_timeout=_request_timeout
         )
         await response_data.read()
-        return self.api_client.response_deserialize(
+        return await self.api_client.response_deserialize_async(
             response_data=response_data,
             response_types_map=_response_types_map,
         )
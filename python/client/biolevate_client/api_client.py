@@ -335,6 +335,21 @@ class ApiClient:
             raw_data = response_data.data
         )
 
+    # Awaitable deserialization (patched, see tools/patch-async-deserialize.py)
+    async def response_deserialize_async(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Optional[Dict[str, ApiResponseT]]=None
+    ) -> ApiResponse[ApiResponseT]:
+        """Deserializes response into an object, awaitably.
+
+        Deserializes inline; subclasses may deserialize off the event loop.
+        :param response_data: RESTResponse object to be deserialized.
+        :param response_types_map: dict of response types.
+        :return: ApiResponse
+        """
+        return self.response_deserialize(response_data, response_types_map)
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
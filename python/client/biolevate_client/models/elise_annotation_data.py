@@ -28,6 +28,8 @@ from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
 ELISEANNOTATIONDATA_ONE_OF_SCHEMAS = ["EliseDocumentStatement", "EliseExternalDocumentStatement", "EliseFullDocumentStatement", "EliseKnowledgeStatement", "EliseReviewComment", "EliseWebStatement"]
+ELISEANNOTATIONDATA_DISCRIMINATOR = "type"
+ELISEANNOTATIONDATA_DISCRIMINATOR_MAPPING = {"DOCUMENT_STATEMENT": EliseDocumentStatement, "ENTIRE_DOCUMENT_STATEMENT": EliseFullDocumentStatement, "EXTERNAL_DOCUMENT_STATEMENT": EliseExternalDocumentStatement, "KNOWLEDGE_STATEMENT": EliseKnowledgeStatement, "REVIEW_STATEMENT": EliseReviewComment, "WEB_STATEMENT": EliseWebStatement}
 
 class EliseAnnotationData(BaseModel):
     """
@@ -110,11 +112,20 @@ class EliseAnnotationData(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Dispatch on the discriminator (patched, see tools/patch-oneof-discriminator.py)
+        klass = ELISEANNOTATIONDATA_DISCRIMINATOR_MAPPING.get(obj.get("type")) if isinstance(obj, dict) and isinstance(obj.get("type"), str) else None
+        if klass is not None:
+            return cls.model_construct(actual_instance=klass.from_dict(obj))
         return cls.from_json(json.dumps(obj))
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
+        # Dispatch on the discriminator (patched, see tools/patch-oneof-discriminator.py)
+        obj = json.loads(json_str)
+        if isinstance(obj, dict) and isinstance(obj.get("type"), str) and obj["type"] in ELISEANNOTATIONDATA_DISCRIMINATOR_MAPPING:
+            return cls.from_dict(obj)
+
         instance = cls.model_construct()
         error_messages = []
         match = 0
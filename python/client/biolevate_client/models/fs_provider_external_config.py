@@ -29,6 +29,8 @@ from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
 FSPROVIDEREXTERNALCONFIG_ONE_OF_SCHEMAS = ["FSProviderAzureConfigExternal", "FSProviderGCSConfigExternal", "FSProviderLeanearConfigExternal", "FSProviderLocalConfigExternal", "FSProviderS3ConfigExternal", "FSProviderSFTPConfigExternal", "FSProviderSharepointOnlineConfigExternal"]
+FSPROVIDEREXTERNALCONFIG_DISCRIMINATOR = "type"
+FSPROVIDEREXTERNALCONFIG_DISCRIMINATOR_MAPPING = {"AZURE": FSProviderAzureConfigExternal, "GCS": FSProviderGCSConfigExternal, "LEANEAR": FSProviderLeanearConfigExternal, "LOCAL": FSProviderLocalConfigExternal, "S3": FSProviderS3ConfigExternal, "SFTP": FSProviderSFTPConfigExternal, "SHAREPOINT_ONLINE": FSProviderSharepointOnlineConfigExternal}
 
 class FSProviderExternalConfig(BaseModel):
     """
@@ -121,11 +123,20 @@ class FSProviderExternalConfig(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Dispatch on the discriminator (patched, see tools/patch-oneof-discriminator.py)
+        klass = FSPROVIDEREXTERNALCONFIG_DISCRIMINATOR_MAPPING.get(obj.get("type")) if isinstance(obj, dict) and isinstance(obj.get("type"), str) else None
+        if klass is not None:
+            return cls.model_construct(actual_instance=klass.from_dict(obj))
         return cls.from_json(json.dumps(obj))
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
+        # Dispatch on the discriminator (patched, see tools/patch-oneof-discriminator.py)
+        obj = json.loads(json_str)
+        if isinstance(obj, dict) and isinstance(obj.get("type"), str) and obj["type"] in FSPROVIDEREXTERNALCONFIG_DISCRIMINATOR_MAPPING:
+            return cls.from_dict(obj)
+
         instance = cls.model_construct()
         error_messages = []
         match = 0
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark the deserialization of large responses.
+
+Compares the generated ``ApiClient.response_deserialize`` with the one of
+the SDK client, validating and trusted (``trusted_responses=True``), on a
+page of files and on a list of annotations.
+
+Usage:
+    python benchmarks/deserialize.py [--items 10000] [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+import uuid
+from typing import Any
+
+import httpx
+
+from biolevate._api_client import ApiClient
+from biolevate_client import ApiClient as GeneratedApiClient
+from biolevate_client import Configuration
+from biolevate_client.rest import RESTResponse
+
+
+def file_info(index: int) -> dict[str, Any]:
+    return {
+        "id": {"id": str(uuid.uuid4()), "entityType": "FILE"},
+        "createdTime": 1708123456789 + index,
+        "owner": {"id": "user-123"},
+        "name": f"report-{index}.pdf",
+        "indexed": True,
+        "path": f"/reports/{index}",
+        "size": 123456,
+    }
+
+
+def annotation(index: int) -> dict[str, Any]:
+    return {
+        "id": {"id": str(uuid.uuid4()), "entityType": "ANNOTATION"},
+        "type": "DOCUMENT_STATEMENT",
+        "status": "VALID",
+        "data": {
+            "type": "DOCUMENT_STATEMENT",
+            "documentName": f"report-{index}.pdf",
+            "content": "Biolevate is a leading company in document intelligence.",
+            "positions": [{"type": "BBOX", "pageNumber": 1, "x": 0, "y": 0, "width": 100, "height": 20}],
+        },
+    }
+
+
+def response(payload: Any) -> RESTResponse:
+    content = json.dumps(payload).encode()
+    rest_response = RESTResponse(httpx.Response(200, content=content, headers={"Content-Type": "application/json"}))
+    rest_response.data = content
+    return rest_response
+
+
+def measure(client: GeneratedApiClient, payload: Any, response_type: str, runs: int) -> float:
+    """Return the median time in milliseconds to deserialize a response."""
+    timings = []
+    for _ in range(runs):
+        rest_response = response(payload)
+        start = time.perf_counter()
+        client.response_deserialize(rest_response, {"200": response_type})
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000, help="Items per response")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    cases = {
+        "PageDataEliseFileInfo": {
+            "data": [file_info(i) for i in range(args.items)],
+            "totalPages": 1,
+            "totalElements": args.items,
+            "hasNext": False,
+        },
+        "List[EliseAnnotation]": [annotation(i) for i in range(args.items)],
+    }
+    configuration = Configuration(host="https://api.biolevate.com")
+    generated = GeneratedApiClient(configuration)
+    clients = {"sdk": ApiClient(configuration), "trusted": ApiClient(configuration, trusted=True)}
+
+    print(f"{'response type':<25} {'generated':>12}" + "".join(f" {label:>20}" for label in clients))
+    for response_type, payload in cases.items():
+        before = measure(generated, payload, response_type, args.runs)
+        line = f"{response_type:<25} {before:9.1f} ms"
+        for client in clients.values():
+            after = measure(client, payload, response_type, args.runs)
+            line += f" {after:9.1f} ms ({before / after:4.1f}x)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
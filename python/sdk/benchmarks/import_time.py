@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Benchmark the time the SDK imports take in a fresh interpreter.
+
+Exits with status 1 when the median time of a statement exceeds its budget,
+so the benchmark guards against import-time regressions; the unit tests run
+it as well (``tests/unit/test_imports.py``).
+
+Usage:
+    python benchmarks/import_time.py [--runs 20] [--budget-scale 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+BUDGETS_MS = {
+    "import biolevate": 50.0,
+    # Mostly asyncio and httpx, which the client needs anyway.
+    "from biolevate import BiolevateClient": 250.0,
+    # Mostly pydantic, which every model needs anyway.
+    "from biolevate import File": 300.0,
+}
+"""Budget in milliseconds of each measured statement."""
+
+STATEMENTS = {
+    **{statement: statement for statement in BUDGETS_MS},
+    "import biolevate_client.models (every model)": (
+        "import biolevate_client.models as m; [getattr(m, name) for name in m._LAZY_IMPORTS]"
+    ),
+}
+
+
+def measure(statement: str, runs: int) -> float:
+    """Return the median time in milliseconds of a statement run in fresh interpreters."""
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    timings = [
+        float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout)
+        for _ in range(runs)
+    ]
+    return statistics.median(timings) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="Interpreters started per statement")
+    parser.add_argument(
+        "--budget-scale", type=float, default=1.0, help="Factor applied to every budget (e.g. 2 on slow machines)"
+    )
+    args = parser.parse_args()
+
+    results = {label: measure(statement, args.runs) for label, statement in STATEMENTS.items()}
+    for label, elapsed in results.items():
+        budget = BUDGETS_MS.get(label)
+        suffix = f"  (budget {budget * args.budget_scale:.0f} ms)" if budget is not None else ""
+        print(f"{label:<50} {elapsed:8.1f} ms{suffix}")
+
+    failed = False
+    for statement, budget in BUDGETS_MS.items():
+        budget *= args.budget_scale
+        if results[statement] > budget:
+            print(f"FAIL: '{statement}' took {results[statement]:.1f} ms, budget is {budget:.1f} ms")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
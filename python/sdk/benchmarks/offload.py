@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark the event loop stalls caused by decoding large responses.
+
+Decodes a large page of files and a large list of annotations with the SDK
+client while a coroutine ticks every millisecond, and reports the decoding
+time and the longest the ticker was kept waiting: inline, in the default
+thread pool and in a process pool.
+
+Usage:
+    python benchmarks/offload.py [--items 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+from deserialize import annotation, file_info, response
+
+from biolevate._api_client import ApiClient
+from biolevate._transport import TransportStats
+from biolevate_client import Configuration
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def measure(client: ApiClient, payload: Any, response_type: str) -> tuple[float, float]:
+    """Return the time to decode a response and the longest event loop stall, in milliseconds."""
+    rest_response = response(payload)
+    lags: list[float] = []
+    stop = asyncio.Event()
+    task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    await client.response_deserialize_async(rest_response, {"200": response_type})
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await task
+    return elapsed * 1000, max(lags) * 1000
+
+
+def client(threshold: int | None, executor: Executor | None = None) -> ApiClient:
+    api_client = ApiClient(
+        Configuration(host="https://api.biolevate.com"),
+        offload_threshold=threshold,
+        offload_executor=executor,
+    )
+    api_client.rest_client.stats = TransportStats()
+    return api_client
+
+
+async def run(items: int) -> None:
+    cases = {
+        "PageDataEliseFileInfo": {"data": [file_info(i) for i in range(items)], "totalPages": 1, "hasNext": False},
+        "List[EliseAnnotation]": [annotation(i) for i in range(items)],
+    }
+    with ProcessPoolExecutor(1) as processes:
+        # Start the worker and import the client in it before measuring.
+        await client(0, processes).response_deserialize_async(response([]), {"200": "List[EliseAnnotation]"})
+        clients = {"inline": client(None), "thread": client(0), "process": client(0, processes)}
+
+        print(f"{'response type':<25} {'mode':<8} {'decoding':>12} {'max stall':>12}")
+        for response_type, payload in cases.items():
+            for label, api_client in clients.items():
+                elapsed, stall = await measure(api_client, payload, response_type)
+                print(f"{response_type:<25} {label:<8} {elapsed:9.1f} ms {stall:9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=20_000, help="Items per response")
+    args = parser.parse_args()
+    asyncio.run(run(args.items))
+
+
+if __name__ == "__main__":
+    main()
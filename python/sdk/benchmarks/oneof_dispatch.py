@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark the deserialization of oneOf models (annotations, positions).
+
+Compares the discriminator dispatch added by
+``tools/patch-oneof-discriminator.py`` with the generated behavior, which
+tries every candidate schema of each oneOf in turn (reproduced here, since
+the patched client no longer runs it for known discriminator values).
+
+Usage:
+    python benchmarks/oneof_dispatch.py [--items 2000] [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any
+
+from deserialize import annotation
+
+from biolevate_client.models import EliseAnnotation, EliseAnnotationData, EliseDocumentStatementAllOfPositions
+
+ONE_OF_MODELS = [EliseAnnotationData, EliseDocumentStatementAllOfPositions]
+
+
+def try_every_schema(cls: Any) -> classmethod[Any, Any, Any]:
+    """Return the generated from_dict of a oneOf model, without dispatch."""
+    module = sys.modules[cls.__module__]
+    prefix = cls.__name__.upper()
+    candidates = [getattr(module, name) for name in getattr(module, f"{prefix}_ONE_OF_SCHEMAS")]
+
+    def from_dict(obj: Any) -> Any:
+        json_str = json.dumps(obj)
+        instance = cls.model_construct()
+        for candidate in candidates:
+            try:
+                instance.actual_instance = candidate.from_json(json_str)
+            except ValueError:
+                continue
+        return instance
+
+    return classmethod(lambda _cls, obj: from_dict(obj))
+
+
+@contextmanager
+def generated_behavior():
+    """Temporarily restore the generated oneOf deserialization."""
+    patched = {cls: cls.__dict__["from_dict"] for cls in ONE_OF_MODELS}
+    for cls in ONE_OF_MODELS:
+        cls.from_dict = try_every_schema(cls)
+    try:
+        yield
+    finally:
+        for cls, from_dict in patched.items():
+            cls.from_dict = from_dict
+
+
+def measure(payload: list[dict[str, Any]], runs: int) -> float:
+    """Return the median time in milliseconds to build the annotations of a payload."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for item in payload:
+            EliseAnnotation.from_dict(item)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=2000, help="Annotations per response")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    payload = [annotation(i) for i in range(args.items)]
+    with generated_behavior():
+        before = measure(payload, args.runs)
+    after = measure(payload, args.runs)
+    print(f"{args.items} annotations: every schema {before:.1f} ms, dispatch {after:.1f} ms ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
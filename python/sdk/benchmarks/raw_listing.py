@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark the CPU and memory cost of listing files as models, dicts or records.
+
+Decodes a page of files the way ``FilesResource.list`` does with its
+default models, ``raw=True`` and ``fields=[...]``, and reports the time
+taken and the memory held by the items.
+
+Usage:
+    python benchmarks/raw_listing.py [--items 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from deserialize import file_info
+
+from biolevate._decoders import decoder_for
+from biolevate.raw import RawPage, projector
+
+FIELDS = ["id", "name", "provider_id", "last_indexation_infos.status"]
+
+
+def measure(decode: Callable[[bytes], list[Any]], body: bytes) -> tuple[float, float]:
+    """Return the time in milliseconds and the memory in MiB taken by the decoded items."""
+    start = time.perf_counter()
+    decode(body)
+    elapsed = time.perf_counter() - start
+
+    # Traced separately, as tracing slows allocations down.
+    tracemalloc.start()
+    items = decode(body)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return elapsed * 1000, memory / (1 << 20)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100_000, help="Files listed")
+    args = parser.parse_args()
+
+    payload = {"data": [file_info(i) for i in range(args.items)], "totalPages": 1, "hasNext": False}
+    body = json.dumps(payload).encode()
+    decode_page = decoder_for("PageDataEliseFileInfo")
+    project = projector("EliseFileInfo", FIELDS)
+
+    modes: dict[str, Callable[[bytes], list[Any]]] = {
+        "models": lambda raw: decode_page(raw).data,
+        "raw=True": lambda raw: RawPage.from_json(json.loads(raw)).data,
+        "fields=[...]": lambda raw: RawPage.from_json(json.loads(raw), project).data,
+    }
+    for label, decode in modes.items():
+        elapsed, memory = measure(decode, body)
+        print(f"{label:<14} {elapsed:9.1f} ms {memory:9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark the peak memory of reading a large list of annotations.
+
+Compares reading the whole body and building every annotation, as
+``get_job_annotations`` does, with parsing the body incrementally and
+building one annotation at a time, as ``iter_job_annotations`` does. The
+body is generated chunk by chunk, like a response received from the network.
+
+Usage:
+    python benchmarks/streaming_annotations.py [--items 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+
+from deserialize import annotation
+
+from biolevate._json_stream import JSONArrayParser
+from biolevate_client.models import EliseAnnotation
+
+CHUNK_SIZE = 64 * 1024
+
+
+def body(items: int) -> Iterator[bytes]:
+    """Generate the JSON body of a list of annotations, chunk by chunk."""
+    chunk = bytearray(b"[")
+    for index in range(items):
+        if index:
+            chunk += b","
+        chunk += json.dumps(annotation(index)).encode()
+        if len(chunk) >= CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+    yield bytes(chunk + b"]")
+
+
+def buffered(items: int) -> int:
+    annotations = [EliseAnnotation.from_dict(item) for item in json.loads(b"".join(body(items)))]
+    return len(annotations)
+
+
+def streamed(items: int) -> int:
+    parser = JSONArrayParser()
+    count = 0
+    for chunk in body(items):
+        for item in parser.feed(chunk):
+            EliseAnnotation.from_dict(item)
+            count += 1
+    for item in parser.close():
+        EliseAnnotation.from_dict(item)
+        count += 1
+    return count
+
+
+def measure(read: Callable[[int], int], items: int) -> tuple[float, float]:
+    """Return the time in milliseconds and the peak memory in MiB taken to read the annotations."""
+    start = time.perf_counter()
+    assert read(items) == items
+    elapsed = time.perf_counter() - start
+
+    # Traced separately, as tracing slows allocations down.
+    tracemalloc.start()
+    read(items)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed * 1000, peak / (1 << 20)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=20_000, help="Annotations in the response")
+    args = parser.parse_args()
+
+    for label, read in {"buffered": buffered, "streamed": streamed}.items():
+        elapsed, peak = measure(read, args.items)
+        print(f"{label:<10} {elapsed:9.1f} ms {peak:9.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
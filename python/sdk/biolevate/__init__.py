@@ -1,43 +1,119 @@
-"""Biolevate SDK - High-level Python SDK for the Biolevate API."""
+"""Biolevate SDK - High-level Python SDK for the Biolevate API.
 
-from biolevate.client import BiolevateClient
-from biolevate.exceptions import (
-    APIError,
-    AuthenticationError,
-    BiolevateError,
-    NotFoundError,
-)
-from biolevate.models import (
-    Annotation,
-    Collection,
-    CollectionPage,
-    ExtractionJobInputs,
-    ExtractionJobOutputs,
-    ExtractionResult,
-    File,
-    FilePage,
-    Job,
-    JobPage,
-    ListItemsResponse,
-    MetaInput,
-    Ontology,
-    Provider,
-    ProviderItem,
-    ProviderPage,
-    QAJobInputs,
-    QAJobOutputs,
-    QAResult,
-    QuestionInput,
-)
+The public names are imported on first access (PEP 562), so ``import biolevate``
+only loads the modules that are actually used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from biolevate._transport import ConnectionOptions, TransportStats
+    from biolevate.cache import CacheStats, JobCache, MetadataCache
+    from biolevate.client import BiolevateClient
+    from biolevate.exceptions import (
+        APIError,
+        AuthenticationError,
+        BiolevateError,
+        IndexationError,
+        NotFoundError,
+        WaitTimeoutError,
+    )
+    from biolevate.indexation import IndexationResult
+    from biolevate.jobs import JobResult
+    from biolevate.models import (
+        Annotation,
+        Collection,
+        CollectionPage,
+        ExtractionJobInputs,
+        ExtractionJobOutputs,
+        ExtractionResult,
+        File,
+        FilePage,
+        Job,
+        JobPage,
+        ListItemsResponse,
+        MetaInput,
+        Ontology,
+        Provider,
+        ProviderItem,
+        ProviderPage,
+        QAJobInputs,
+        QAJobOutputs,
+        QAResult,
+        QuestionInput,
+    )
+    from biolevate.ratelimit import AdaptiveConcurrency, RateLimit, RateLimiter
+    from biolevate.raw import RawItemsPage, RawPage
+    from biolevate.retry import Retry, retry_policy
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "ConnectionOptions": "biolevate._transport",
+    "TransportStats": "biolevate._transport",
+    "CacheStats": "biolevate.cache",
+    "JobCache": "biolevate.cache",
+    "MetadataCache": "biolevate.cache",
+    "BiolevateClient": "biolevate.client",
+    "APIError": "biolevate.exceptions",
+    "AuthenticationError": "biolevate.exceptions",
+    "BiolevateError": "biolevate.exceptions",
+    "IndexationError": "biolevate.exceptions",
+    "NotFoundError": "biolevate.exceptions",
+    "WaitTimeoutError": "biolevate.exceptions",
+    "IndexationResult": "biolevate.indexation",
+    "JobResult": "biolevate.jobs",
+    "Annotation": "biolevate.models",
+    "Collection": "biolevate.models",
+    "CollectionPage": "biolevate.models",
+    "ExtractionJobInputs": "biolevate.models",
+    "ExtractionJobOutputs": "biolevate.models",
+    "ExtractionResult": "biolevate.models",
+    "File": "biolevate.models",
+    "FilePage": "biolevate.models",
+    "Job": "biolevate.models",
+    "JobPage": "biolevate.models",
+    "ListItemsResponse": "biolevate.models",
+    "MetaInput": "biolevate.models",
+    "Ontology": "biolevate.models",
+    "Provider": "biolevate.models",
+    "ProviderItem": "biolevate.models",
+    "ProviderPage": "biolevate.models",
+    "QAJobInputs": "biolevate.models",
+    "QAJobOutputs": "biolevate.models",
+    "QAResult": "biolevate.models",
+    "QuestionInput": "biolevate.models",
+    "AdaptiveConcurrency": "biolevate.ratelimit",
+    "RateLimit": "biolevate.ratelimit",
+    "RateLimiter": "biolevate.ratelimit",
+    "RawItemsPage": "biolevate.raw",
+    "RawPage": "biolevate.raw",
+    "Retry": "biolevate.retry",
+    "retry_policy": "biolevate.retry",
+}
+"""Module defining each public name."""
 
 __all__ = [
     # Client
     "BiolevateClient",
+    "AdaptiveConcurrency",
+    "CacheStats",
+    "ConnectionOptions",
+    "JobCache",
+    "MetadataCache",
+    "RateLimit",
+    "RateLimiter",
+    "Retry",
+    "TransportStats",
+    "retry_policy",
     # Exceptions
     "BiolevateError",
     "APIError",
     "AuthenticationError",
+    "IndexationError",
     "NotFoundError",
+    "WaitTimeoutError",
     # Providers
     "Provider",
     "ProviderPage",
@@ -46,12 +122,14 @@ __all__ = [
     # Files
     "File",
     "FilePage",
+    "IndexationResult",
     # Collections
     "Collection",
     "CollectionPage",
     # Jobs
     "Job",
     "JobPage",
+    "JobResult",
     # Extraction
     "MetaInput",
     "ExtractionResult",
@@ -65,5 +143,20 @@ __all__ = [
     # Shared
     "Annotation",
     "Ontology",
+    "RawPage",
+    "RawItemsPage",
 ]
 __version__ = "0.5.1"  # x-release-please-version
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
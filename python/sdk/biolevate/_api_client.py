@@ -0,0 +1,286 @@
+"""API client used by the SDK resources."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from biolevate._decoders import decoder_for, trusted_decoder_for
+from biolevate_client import ApiClient as GeneratedApiClient
+from biolevate_client.api_response import ApiResponse
+from biolevate_client.rest import RESTResponse
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+_COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+_CHARSET = re.compile(r"charset=([a-zA-Z\-\d]+)")
+
+
+class ApiClient(GeneratedApiClient):
+    """Generated API client with request coalescing and conditional revalidation.
+
+    With coalescing, concurrent GET requests with the same URL, headers
+    (hence the same credentials) and timeout share one HTTP request: the
+    callers that arrive while it is in flight wait for it instead of sending
+    their own, and all receive the same deserialized result.
+
+    With a revalidation cache, the responses carrying an ``ETag`` or
+    ``Last-Modified`` validator are kept, and the next identical GET is sent
+    with ``If-None-Match``/``If-Modified-Since``. When the server answers
+    ``304 Not Modified``, the kept response and its deserialized result are
+    served instead of downloading the body again.
+
+    Successful JSON responses are deserialized straight from the body bytes
+    by a decoder compiled once per response type (see
+    :func:`biolevate._decoders.decoder_for`), instead of the generated
+    string round-trip. In trusted mode, the models are built without
+    validation (see :func:`biolevate._decoders.trusted_decoder_for`).
+
+    Responses whose body is at least ``offload_threshold`` bytes are
+    decoded in an executor (the default thread pool of the event loop unless
+    ``offload_executor`` is given), so that decoding them does not stall the
+    other coroutines. Smaller responses are decoded inline, as the hop to
+    the executor would cost more than it saves.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        coalesce: bool = False,
+        revalidation_cache_size: int = 0,
+        trusted: bool = False,
+        offload_threshold: int | None = 1024 * 1024,
+        offload_executor: Executor | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            *args: Positional arguments of the generated client.
+            coalesce: Whether to coalesce identical in-flight GET requests.
+            revalidation_cache_size: Maximum number of responses kept for
+                conditional revalidation (0 disables it).
+            trusted: Whether to build the response models without validating them.
+            offload_threshold: Size in bytes of the response bodies decoded
+                off the event loop (None to always decode inline).
+            offload_executor: Executor decoding the large responses (default:
+                the default executor of the event loop).
+            **kwargs: Keyword arguments of the generated client.
+        """
+        super().__init__(*args, **kwargs)
+        self.coalesce = coalesce
+        self.revalidation_cache_size = revalidation_cache_size
+        self.trusted = trusted
+        self.offload_threshold = offload_threshold
+        self.offload_executor = offload_executor
+        self._in_flight: dict[tuple[Any, ...], asyncio.Task[RESTResponse]] = {}
+        self._validated: OrderedDict[tuple[Any, ...], RESTResponse] = OrderedDict()
+
+    async def call_api(
+        self,
+        method: str,
+        url: str,
+        header_params: dict[str, Any] | None = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Any = None,
+    ) -> RESTResponse:
+        """Send a request, joining an identical GET request already in flight."""
+        if method.upper() not in _COALESCED_METHODS or body is not None or post_params:
+            return await super().call_api(method, url, header_params, body, post_params, _request_timeout)
+
+        key = (method.upper(), url, tuple(sorted((header_params or {}).items())))
+        if not self.coalesce:
+            return await self._fetch(key, method, url, header_params, _request_timeout)
+
+        # A caller only joins a request sent with its own timeout.
+        shared = (*key, repr(_request_timeout))
+        task = self._in_flight.get(shared)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, method, url, header_params, _request_timeout))
+            task.add_done_callback(_retrieve_exception)
+            self._in_flight[shared] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(shared, None))
+        else:
+            self.rest_client.stats.coalesced += 1
+        # A cancelled caller must not cancel the request the other callers wait for.
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        key: tuple[Any, ...],
+        method: str,
+        url: str,
+        header_params: dict[str, Any] | None,
+        _request_timeout: Any,
+    ) -> RESTResponse:
+        """Send a GET request, revalidating the response kept for it if any."""
+        kept = self._validated.get(key) if self.revalidation_cache_size else None
+        headers = dict(header_params or {})
+        if kept is not None:
+            headers.update(_conditions(kept))
+
+        response = await super().call_api(method, url, headers, _request_timeout=_request_timeout)
+        # Read the body once here, as every caller reads the same response.
+        await response.read()
+
+        if kept is not None and response.status == 304:
+            self.rest_client.stats.not_modified += 1
+            self._validated.move_to_end(key)
+            return kept
+
+        response._deserialized = {}
+        if self.revalidation_cache_size:
+            self._keep(key, response)
+        return response
+
+    def _keep(self, key: tuple[Any, ...], response: RESTResponse) -> None:
+        """Keep a response for revalidation if it carries a validator."""
+        if response.status != 200 or not _conditions(response):
+            self._validated.pop(key, None)
+            return
+        self._validated[key] = response
+        self._validated.move_to_end(key)
+        while len(self._validated) > self.revalidation_cache_size:
+            self._validated.popitem(last=False)
+
+    def response_deserialize(
+        self,
+        response_data: RESTResponse,
+        response_types_map: dict[str, Any] | None = None,
+    ) -> ApiResponse[Any]:
+        """Deserialize a response, once for all the callers sharing it."""
+        shared = getattr(response_data, "_deserialized", None)
+        if shared is None:
+            return self._deserialize(response_data, response_types_map)
+
+        key = tuple(sorted((response_types_map or {}).items()))
+        result = shared.get(key)
+        if isinstance(result, asyncio.Future):
+            # Being decoded off the event loop for other callers, which cannot be awaited here.
+            return self._deserialize(response_data, response_types_map)
+        if result is None:
+            result = shared[key] = self._deserialize(response_data, response_types_map)
+        return result
+
+    async def response_deserialize_async(
+        self,
+        response_data: RESTResponse,
+        response_types_map: dict[str, Any] | None = None,
+    ) -> ApiResponse[Any]:
+        """Deserialize a response, off the event loop if its body is large."""
+        if self.offload_threshold is None or len(response_data.data or b"") < self.offload_threshold:
+            return self.response_deserialize(response_data, response_types_map)
+
+        shared = getattr(response_data, "_deserialized", None)
+        if shared is None:
+            return await self._deserialize_off_loop(response_data, response_types_map)
+
+        key = tuple(sorted((response_types_map or {}).items()))
+        result = shared.get(key)
+        if result is None:
+            result = shared[key] = asyncio.ensure_future(self._deserialize_off_loop(response_data, response_types_map))
+            result.add_done_callback(_retrieve_exception)
+        if isinstance(result, asyncio.Future):
+            # A cancelled caller must not cancel the decoding the other callers wait for.
+            result = await asyncio.shield(result)
+            shared[key] = result
+        return result
+
+    def _deserialize(
+        self,
+        response_data: RESTResponse,
+        response_types_map: dict[str, Any] | None,
+    ) -> ApiResponse[Any]:
+        """Deserialize a response with its compiled decoder, or the generated path if it has none."""
+        response_type = _response_type(response_data, response_types_map or {})
+        if response_type is not None:
+            try:
+                data = _decode(response_type, self.trusted, response_data.data)
+            except (ValidationError, ValueError, TypeError):
+                # Let the generated path deal with (or report) what the decoder rejects.
+                pass
+            else:
+                return _api_response(response_data, data)
+        return super().response_deserialize(response_data, response_types_map)
+
+    async def _deserialize_off_loop(
+        self,
+        response_data: RESTResponse,
+        response_types_map: dict[str, Any] | None,
+    ) -> ApiResponse[Any]:
+        """Deserialize a response with its compiled decoder in the offload executor."""
+        response_type = _response_type(response_data, response_types_map or {})
+        if response_type is not None:
+            loop = asyncio.get_running_loop()
+            start = time.perf_counter()
+            try:
+                data = await loop.run_in_executor(
+                    self.offload_executor, _decode, response_type, self.trusted, response_data.data
+                )
+            except (ValidationError, ValueError, TypeError):
+                pass
+            else:
+                return _api_response(response_data, data)
+            finally:
+                self.rest_client.stats.offloaded += 1
+                self.rest_client.stats.offloaded_seconds += time.perf_counter() - start
+        # Error responses and what the decoder rejects take the generated path, inline.
+        return super().response_deserialize(response_data, response_types_map)
+
+
+def _response_type(response: RESTResponse, response_types_map: dict[str, Any]) -> str | None:
+    """Return the type of a successful UTF-8 JSON response that has a compiled decoder, if any."""
+    if not 200 <= response.status <= 299 or not response.data:
+        return None
+    response_type = response_types_map.get(str(response.status)) or response_types_map.get("2XX")
+    if response_type is None:
+        return None
+    content_type = response.headers.get("content-type")
+    if content_type is not None:
+        charset = _CHARSET.search(content_type)
+        if "json" not in content_type.lower() or (charset and charset[1].lower() not in ("utf-8", "utf8")):
+            return None
+    return response_type
+
+
+def _decode(response_type: str, trusted: bool, body: bytes) -> Any:
+    """Decode a response body with the compiled decoder of its type.
+
+    A module-level function taking plain arguments, so that it can run in a
+    process pool as well as in a thread pool.
+    """
+    decoder = trusted_decoder_for(response_type) if trusted else decoder_for(response_type)
+    return decoder(body)
+
+
+def _api_response(response: RESTResponse, data: Any) -> ApiResponse[Any]:
+    return ApiResponse(
+        status_code=response.status,
+        data=data,
+        headers=response.headers,
+        raw_data=response.data,
+    )
+
+
+def _conditions(response: RESTResponse) -> dict[str, str]:
+    """Return the conditional request headers matching the validators of a response."""
+    conditions = {}
+    if etag := response.headers.get("ETag"):
+        conditions["If-None-Match"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        conditions["If-Modified-Since"] = last_modified
+    return conditions
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    """Mark the error of a shared request as retrieved, in case every caller was cancelled."""
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,33 @@
+"""Exponential backoff schedules shared by polling and retry helpers."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """Exponential backoff schedule with jitter.
+
+    Attributes:
+        initial: Delay in seconds before the first retry or poll.
+        maximum: Upper bound for any single delay.
+        multiplier: Growth factor applied after each attempt.
+        jitter: Fraction of the delay that is randomised (0 disables jitter).
+        full_jitter: Draw each delay uniformly between 0 and the capped
+            exponential value instead of only jittering its upper part.
+    """
+
+    initial: float = 0.5
+    maximum: float = 10.0
+    multiplier: float = 2.0
+    jitter: float = 0.2
+    full_jitter: bool = False
+
+    def delay(self, attempt: int) -> float:
+        """Return the delay in seconds to wait after the given 0-based attempt."""
+        ceiling = min(self.maximum, self.initial * self.multiplier**attempt)
+        if self.full_jitter:
+            return random.uniform(0, ceiling)
+        return ceiling * (1 - self.jitter * random.random())
@@ -0,0 +1,297 @@
+"""Compiled decoders turning response bodies into the generated models."""
+
+from __future__ import annotations
+
+import functools
+import json
+import re
+import sys
+import typing
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+Decoder = Callable[[bytes], Any]
+Converter = Callable[[Any], Any]
+
+# Values of these types are used as parsed from JSON by trusted decoders.
+_JSON_TYPES = frozenset({str, int, float, bool, typing.Any})
+
+_LIST_TYPE = re.compile(r"^List\[(?P<item>\w+)\]$")
+
+
+@functools.cache
+def decoder_for(response_type: str) -> Decoder | None:
+    """Return a decoder for the bodies of a generated response type.
+
+    The generated client decodes every body to ``str``, parses it with
+    ``json.loads``, resolves the type string (``"List[EliseAnnotation]"``)
+    with regular expressions and ``getattr``, then walks the data with the
+    ``from_dict`` of each model. The decoder is built once per type instead:
+    models without ``oneOf`` fields are validated by pydantic straight from
+    the bytes, the others are built with ``from_dict`` from a single
+    ``json.loads`` of the bytes.
+
+    Args:
+        response_type: A response type of the generated API, e.g.
+            ``"PageDataEliseFileInfo"`` or ``"List[EliseAnnotation]"``.
+
+    Returns:
+        The decoder, or None for the types that are not models (primitives,
+        ``bytearray``, ``file``...), which the generated client handles.
+    """
+    import biolevate_client.models
+
+    match = _LIST_TYPE.match(response_type)
+    name = match["item"] if match else response_type
+    model = getattr(biolevate_client.models, name, None)
+    if not isinstance(model, type) or not issubclass(model, BaseModel):
+        return None
+
+    if validates_natively(model):
+        if match:
+            return TypeAdapter(list[model]).validate_json  # type: ignore[valid-type]
+        return model.model_validate_json
+
+    from_dict = model.from_dict  # type: ignore[attr-defined]
+    if match:
+        return lambda raw: [from_dict(item) for item in json.loads(raw)]
+    return lambda raw: from_dict(json.loads(raw))
+
+
+@functools.cache
+def trusted_decoder_for(response_type: str) -> Decoder | None:
+    """Return a decoder building the models of a response type without validating them.
+
+    Models are built recursively the way ``model_construct`` builds them: no
+    field validator, enum check or strict type check runs, but every field
+    is converted to the type validation would give it (nested models, UUIDs,
+    datetimes...), so attribute access and ``to_dict`` return the same
+    values as for validated models. ``oneOf`` fields are built as the class
+    named by their discriminator.
+
+    Models without ``oneOf`` fields are still validated from the bytes by
+    pydantic first, which is faster than any construction in Python; they
+    are only built without validation when that validation fails (e.g. on
+    an enum value added to the API after the client was generated).
+
+    Args:
+        response_type: A response type of the generated API, e.g.
+            ``"PageDataEliseFileInfo"`` or ``"List[EliseAnnotation]"``.
+
+    Returns:
+        The decoder, or None for the types that are not models.
+    """
+    import biolevate_client.models
+
+    match = _LIST_TYPE.match(response_type)
+    name = match["item"] if match else response_type
+    model = getattr(biolevate_client.models, name, None)
+    if not isinstance(model, type) or not issubclass(model, BaseModel):
+        return None
+
+    build = _constructor(model)
+    validate = decoder_for(response_type) if validates_natively(model) else None
+
+    def decode(raw: bytes) -> Any:
+        if validate is not None:
+            try:
+                return validate(raw)
+            except ValidationError:
+                pass
+        data = json.loads(raw)
+        return [build(item) for item in data] if match else build(data)
+
+    return decode
+
+
+@functools.cache
+def converter_for(response_type: str, trusted: bool = False) -> Converter | None:
+    """Return a function building a model of a response type from its parsed JSON.
+
+    The counterpart of :func:`decoder_for` and :func:`trusted_decoder_for`
+    for values that are already parsed, such as the elements of a streamed
+    JSON array: the models are validated with their ``from_dict``, or, in
+    trusted mode, validated by pydantic when it builds them natively and
+    otherwise built without validation.
+
+    Args:
+        response_type: A model of the generated API, e.g. ``"EliseAnnotation"``.
+        trusted: Whether to build the models without validating them.
+
+    Returns:
+        The converter, or None for the types that are not models.
+    """
+    import biolevate_client.models
+
+    model = getattr(biolevate_client.models, response_type, None)
+    if not isinstance(model, type) or not issubclass(model, BaseModel):
+        return None
+    if not trusted:
+        return model.from_dict  # type: ignore[attr-defined]
+
+    build = _constructor(model)
+    if not validates_natively(model):
+        return build
+    validate = model.model_validate
+
+    def convert(obj: Any) -> Any:
+        try:
+            return validate(obj)
+        except ValidationError:
+            return build(obj)
+
+    return convert
+
+
+@functools.cache
+def _constructor(model: type[BaseModel]) -> Converter:
+    """Return a function building a model from its parsed JSON without validating it."""
+    if "actual_instance" in model.model_fields:
+        return _one_of_constructor(model)
+
+    fields = {field.alias or name: (name, _converter(field.annotation)) for name, field in model.model_fields.items()}
+    new = _new(model)
+
+    def build(obj: Any) -> Any:
+        if not isinstance(obj, dict):
+            return model.from_dict(obj)  # type: ignore[attr-defined]
+        values = {}
+        for key, value in obj.items():
+            field = fields.get(key)
+            if field is not None:
+                name, convert = field
+                values[name] = value if convert is None or value is None else convert(value)
+        return new(values)
+
+    return build
+
+
+def _new(model: type[BaseModel]) -> Converter:
+    """Return a function creating a model instance from its field values, without validation.
+
+    Equivalent to ``model_construct``, whose deep copy of every default
+    dominates the cost of building a model. The defaults of the generated
+    models are None or flat containers (the ``one_of_schemas`` of ``oneOf``
+    wrappers), which a shallow copy is enough to duplicate, and the models
+    have no private attributes, so their instances are created directly, the
+    same way ``model_construct`` does.
+    """
+    defaults: dict[str, Any] = {}
+    copied = []
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            continue
+        default = field.get_default(call_default_factory=True)
+        if isinstance(default, (set, dict, list)) and all(isinstance(v, (str, int)) for v in default):
+            copied.append(name)
+        elif default is not None and not isinstance(default, (str, int, float, bool)):
+            return lambda values: model.model_construct(**values)
+        defaults[name] = default
+    if model.__pydantic_post_init__ or model.__private_attributes__ or model.__pydantic_root_model__:
+        return lambda values: model.model_construct(**values)
+
+    new = model.__new__
+    setattr_ = object.__setattr__
+
+    def create(values: dict[str, Any]) -> BaseModel:
+        instance = new(model)
+        fields = {**defaults, **values}
+        for name in copied:
+            if name not in values:
+                fields[name] = fields[name].copy()
+        setattr_(instance, "__dict__", fields)
+        setattr_(instance, "__pydantic_fields_set__", set(values))
+        setattr_(instance, "__pydantic_extra__", None)
+        setattr_(instance, "__pydantic_private__", None)
+        return instance
+
+    return create
+
+
+def _one_of_constructor(model: type[BaseModel]) -> Converter:
+    """Return a function building a ``oneOf`` wrapper as the class named by its discriminator.
+
+    Wrappers without a discriminator (see ``tools/patch-oneof-discriminator.py``)
+    or payloads with an unknown value are validated by the generated ``from_dict``.
+    """
+    module = sys.modules[model.__module__]
+    prefix = model.__name__.upper()
+    prop = getattr(module, f"{prefix}_DISCRIMINATOR", None)
+    mapping = getattr(module, f"{prefix}_DISCRIMINATOR_MAPPING", {})
+    from_dict = model.from_dict  # type: ignore[attr-defined]
+
+    def build(obj: Any) -> Any:
+        klass = mapping.get(obj.get(prop)) if isinstance(obj, dict) and isinstance(obj.get(prop), str) else None
+        if klass is None:
+            return from_dict(obj)
+        return new({"actual_instance": _constructor(klass)(obj)})
+
+    new = _new(model)
+    return build
+
+
+def _converter(annotation: Any) -> Converter | None:
+    """Return the conversion of parsed JSON to a field type, or None when there is nothing to convert."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _converter(args[0])
+        if all(_converter(arg) is None for arg in args):
+            return None
+    elif origin is typing.Annotated:
+        return _converter(typing.get_args(annotation)[0])
+    elif origin is list:
+        item = _converter(typing.get_args(annotation)[0])
+        return None if item is None else lambda value: [item(v) if v is not None else None for v in value]
+    elif origin is dict:
+        item = _converter(typing.get_args(annotation)[1])
+        return None if item is None else lambda value: {k: item(v) if v is not None else None for k, v in value.items()}
+    elif annotation in _JSON_TYPES:
+        return None
+    elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _nested(annotation)
+    elif annotation is uuid.UUID:
+        return uuid.UUID
+    return TypeAdapter(annotation).validate_python
+
+
+def _nested(model: type[BaseModel]) -> Converter:
+    """Return the constructor of a nested model, resolved on first use so recursive models work."""
+    build: Converter | None = None
+
+    def convert(value: Any) -> Any:
+        nonlocal build
+        if build is None:
+            build = _constructor(model)
+        return build(value)
+
+    return convert
+
+
+@functools.cache
+def validates_natively(model: type[BaseModel]) -> bool:
+    """Whether pydantic validation of a model gives the same result as its ``from_dict``.
+
+    That is the case unless the model, or a model it contains, is a ``oneOf``
+    wrapper: those are filled by a hand-written ``from_json`` that pydantic
+    validation does not call.
+    """
+    if "actual_instance" in model.model_fields:
+        return False
+    return all(
+        validates_natively(nested)
+        for field in model.model_fields.values()
+        for nested in models_in(field.annotation)
+        if nested is not model
+    )
+
+
+def models_in(annotation: Any) -> list[type[BaseModel]]:
+    """Return the models referenced by a type annotation, e.g. ``Optional[List[Model]]``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    return [model for arg in typing.get_args(annotation) for model in models_in(arg)]
@@ -0,0 +1,147 @@
+"""Incremental parsing of JSON array responses.
+
+Large list responses (e.g. job annotations) are parsed element by element
+as their body is received, so that only the element being parsed and the
+current chunk of the body are held in memory, instead of the whole body
+and every element at once.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+from biolevate.raw import raise_for_status
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    import httpx
+
+    from biolevate._transport import TransportStats
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = frozenset("-+.eE0123456789")
+
+_START, _FIRST, _VALUE, _SEPARATOR, _END = range(5)
+
+
+class JSONArrayParser:
+    """Push parser of a JSON array, yielding its elements as they complete.
+
+    Feed the bytes of the document as they arrive, then close the parser::
+
+        parser = JSONArrayParser()
+        for chunk in chunks:
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
+    An element split across chunks is parsed again once the next chunk
+    arrives, so chunks should be large compared to the elements.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser before the opening bracket."""
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = _START
+
+    def feed(self, data: bytes) -> Iterator[Any]:
+        """Add the next bytes of the document.
+
+        Args:
+            data: The next bytes of the document.
+
+        Yields:
+            The elements completed by these bytes.
+
+        Raises:
+            ValueError: If the document is not a JSON array.
+        """
+        self._buffer += self._text.decode(data)
+        return self._parse(final=False)
+
+    def close(self) -> Iterator[Any]:
+        """Signal the end of the document.
+
+        Yields:
+            The elements still pending at the end of the document.
+
+        Raises:
+            ValueError: If the document is not a JSON array, or is truncated.
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        yield from self._parse(final=True)
+        if self._state != _END:
+            raise ValueError("Truncated JSON array")
+
+    def _parse(self, final: bool) -> Iterator[Any]:
+        buffer = self._buffer
+        pos = 0
+        try:
+            while True:
+                pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+                if pos == len(buffer):
+                    return
+                char = buffer[pos]
+                if self._state == _START:
+                    if char != "[":
+                        raise ValueError(f"Expected a JSON array, got {char!r}")
+                    pos += 1
+                    self._state = _FIRST
+                elif self._state in (_FIRST, _SEPARATOR) and char == "]":
+                    pos += 1
+                    self._state = _END
+                elif self._state == _SEPARATOR:
+                    if char != ",":
+                        raise ValueError(f"Expected ',' or ']' at {pos}, got {char!r}")
+                    pos += 1
+                    self._state = _VALUE
+                elif self._state in (_FIRST, _VALUE):
+                    try:
+                        value, end = self._decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError:
+                        if final:
+                            raise
+                        return
+                    # A number at the end of the buffer may continue in the next chunk.
+                    if not final and (end == len(buffer) or (char in _NUMBER and buffer[end] in _NUMBER)):
+                        return
+                    pos = end
+                    self._state = _SEPARATOR
+                    yield value
+                else:
+                    raise ValueError(f"Unexpected data after the JSON array at {pos}")
+        finally:
+            self._buffer = buffer[pos:]
+
+
+async def iter_json_array(response: httpx.Response, stats: TransportStats | None = None) -> AsyncIterator[Any]:
+    """Parse the elements of a streamed JSON array response as they arrive.
+
+    Args:
+        response: A response opened with ``httpx.AsyncClient.stream``.
+        stats: Counters to add the decoded body bytes to.
+
+    Yields:
+        The elements of the array, as parsed by ``json.loads``.
+
+    Raises:
+        ApiException: The exception of the generated client matching the
+            status of an error response.
+        ValueError: If the body is not a JSON array.
+    """
+    if not response.is_success:
+        raise_for_status(response, await response.aread())
+
+    parser = JSONArrayParser()
+    async for chunk in response.aiter_bytes():
+        if stats is not None:
+            stats.bytes_received_decoded += len(chunk)
+        for element in parser.feed(chunk):
+            yield element
+    for element in parser.close():
+        yield element
@@ -0,0 +1,88 @@
+"""Helpers for streaming items across page-numbered list endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Protocol, TypeVar
+
+T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+
+
+class Page(Protocol[T_co]):
+    """Shape shared by the generated ``PageData*`` models."""
+
+    @property
+    def data(self) -> list[T_co] | None: ...
+
+    @property
+    def total_pages(self) -> int | None: ...
+
+    @property
+    def has_next(self) -> bool | None: ...
+
+
+async def iterate_pages(
+    fetch_page: Callable[[int], Awaitable[Page[T]]],
+    start_page: int = 0,
+    concurrency: int = 2,
+) -> AsyncIterator[T]:
+    """Yield every item of a paginated endpoint, prefetching upcoming pages.
+
+    While the items of page N are being consumed, up to ``concurrency`` of the
+    following pages are already in flight. Iteration stops on the first page
+    whose ``has_next`` is false; pages requested speculatively past the end
+    are cancelled.
+
+    Args:
+        fetch_page: Coroutine function returning the page with the given index.
+        start_page: Index of the first page to fetch (0-based).
+        concurrency: Maximum number of pages fetched ahead of the consumer.
+
+    Yields:
+        Items of each page, in page order.
+
+    Raises:
+        ValueError: If ``concurrency`` is lower than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pending: deque[asyncio.Future[Page[T]]] = deque()
+    next_page = start_page
+    total_pages: int | None = None
+
+    def schedule() -> None:
+        nonlocal next_page
+        pending.append(asyncio.ensure_future(fetch_page(next_page)))
+        next_page += 1
+
+    schedule()
+    try:
+        while pending:
+            page = await pending.popleft()
+            if page.total_pages is not None:
+                total_pages = page.total_pages
+
+            if page.has_next:
+                while len(pending) < concurrency and (total_pages is None or next_page < total_pages):
+                    schedule()
+                if not pending:
+                    schedule()
+            else:
+                await _cancel(pending)
+
+            for item in page.data or []:
+                yield item
+    finally:
+        await _cancel(pending)
+
+
+async def _cancel(pending: deque[asyncio.Future[Page[T]]]) -> None:
+    """Cancel in-flight page requests and drain their results."""
+    for future in pending:
+        future.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    pending.clear()
@@ -0,0 +1,416 @@
+"""HTTP transport shared by all resources of a client."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import importlib.util
+import json
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from biolevate.retry import Retry, current_override
+from biolevate_client.rest import RESTResponse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from biolevate.ratelimit import AdaptiveConcurrency, RateLimiter
+    from biolevate_client import ApiClient
+    from biolevate_client.configuration import Configuration
+    from biolevate_client.rest import RESTClientObject
+
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+
+@dataclass(frozen=True)
+class ConnectionOptions:
+    """Connection pool, protocol and timeout settings of a client.
+
+    Attributes:
+        http2: Whether to negotiate HTTP/2, so concurrent requests share a
+            few multiplexed connections (requires ``biolevate[http2]``).
+        max_connections: Maximum number of open connections (default:
+            ``Configuration.connection_pool_maxsize``).
+        max_keepalive_connections: Maximum number of idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        connect_timeout: Seconds allowed to establish a connection.
+        read_timeout: Seconds allowed between two chunks of a response.
+        write_timeout: Seconds allowed between two chunks of a request body.
+        pool_timeout: Seconds a request may wait for a free connection.
+        prewarm_connections: Connections opened when entering the client's
+            ``async with`` block, so the first requests skip the TCP and TLS
+            handshakes.
+        compress_requests: Whether to gzip JSON request bodies (e.g. job
+            creations listing thousands of files). The API must accept
+            ``Content-Encoding: gzip``.
+        compression_threshold: Size in bytes above which a JSON request body
+            is compressed.
+    """
+
+    http2: bool = False
+    max_connections: int | None = None
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 30.0
+    connect_timeout: float | None = 30.0
+    read_timeout: float | None = 300.0
+    write_timeout: float | None = 300.0
+    pool_timeout: float | None = 300.0
+    prewarm_connections: int = 0
+    compress_requests: bool = False
+    compression_threshold: int = 16 * 1024
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        """The timeouts as an ``httpx.Timeout``."""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+@dataclass
+class TransportStats:
+    """Counters of the requests sent by a client.
+
+    Attributes:
+        requests: Number of HTTP requests sent, retries included.
+        retries: Number of requests that were retries of a failed attempt.
+        throttled_seconds: Total time requests waited for the rate limiter.
+        coalesced: Number of requests served by an identical request already
+            in flight instead of being sent.
+        not_modified: Number of requests answered ``304 Not Modified``, whose
+            kept result was served instead.
+        bytes_sent: Request body bytes sent, after compression.
+        bytes_sent_uncompressed: Request body bytes before compression.
+        bytes_received: Response body bytes received, before decompression.
+        bytes_received_decoded: Response body bytes after decompression.
+        offloaded: Number of large responses decoded off the event loop.
+        offloaded_seconds: Total time spent decoding them off the event loop.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    throttled_seconds: float = 0.0
+    coalesced: int = 0
+    not_modified: int = 0
+    bytes_sent: int = 0
+    bytes_sent_uncompressed: int = 0
+    bytes_received: int = 0
+    bytes_received_decoded: int = 0
+    offloaded: int = 0
+    offloaded_seconds: float = 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of the bytes transferred to the bytes they would take uncompressed."""
+        decoded = self.bytes_sent_uncompressed + self.bytes_received_decoded
+        return (self.bytes_sent + self.bytes_received) / decoded if decoded else 1.0
+
+
+class _MeteredResponse(RESTResponse):
+    """REST response counting the body bytes it reads."""
+
+    def __init__(self, resp: httpx.Response, stats: TransportStats) -> None:
+        super().__init__(resp)
+        self._stats = stats
+
+    async def read(self) -> bytes:
+        if self.data is None:
+            self.data = await self.response.aread()
+            self._stats.bytes_received += self.response.num_bytes_downloaded
+            self._stats.bytes_received_decoded += len(self.data)
+        return self.data
+
+
+class Transport:
+    """Drop-in replacement for the REST client of the generated API client.
+
+    Wraps the generated ``RESTClientObject``, which still builds and sends
+    the requests, and adds retries honoring ``Configuration.retries`` (the
+    generated client accepts the setting but ignores it). The policy can be
+    overridden for a block of code with :func:`biolevate.retry.retry_policy`.
+    Every attempt can also go through a rate limiter and an adaptive
+    concurrency controller. The connection pool is created from
+    :class:`ConnectionOptions` instead of the generated defaults, and can
+    compress large JSON request bodies.
+    """
+
+    def __init__(
+        self,
+        rest_client: RESTClientObject,
+        configuration: Configuration,
+        rate_limiter: RateLimiter | None = None,
+        concurrency: AdaptiveConcurrency | None = None,
+        connection: ConnectionOptions | None = None,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            rest_client: The REST client created by the generated API client.
+            configuration: The configuration of the API client.
+            rate_limiter: Limiter every request waits for before being sent.
+            concurrency: Controller of the number of requests in flight.
+            connection: Connection pool, protocol and timeout settings.
+        """
+        self._rest_client = rest_client
+        self._host = configuration.host
+        self.connection = connection or ConnectionOptions()
+        self.retry = Retry.from_config(configuration.retries)
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.stats = TransportStats()
+
+    @classmethod
+    def install(
+        cls,
+        client: ApiClient,
+        rate_limiter: RateLimiter | None = None,
+        concurrency: AdaptiveConcurrency | None = None,
+        connection: ConnectionOptions | None = None,
+    ) -> Transport:
+        """Replace the REST client of an API client with a transport wrapping it."""
+        transport = cls(
+            client.rest_client,
+            client.configuration,
+            rate_limiter=rate_limiter,
+            concurrency=concurrency,
+            connection=connection,
+        )
+        client.rest_client = transport  # type: ignore[assignment]
+        return transport
+
+    @property
+    def pool_manager(self) -> httpx.AsyncClient | None:
+        """The pooled HTTP client, once created."""
+        return self._rest_client.pool_manager
+
+    @pool_manager.setter
+    def pool_manager(self, value: httpx.AsyncClient | None) -> None:
+        self._rest_client.pool_manager = value
+
+    def _create_pool_manager(self) -> httpx.AsyncClient:
+        options = self.connection
+        if options.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError("HTTP/2 support requires the 'h2' package: pip install 'biolevate[http2]'")
+
+        rest_client = self._rest_client
+        proxy = httpx.Proxy(url=rest_client.proxy, headers=rest_client.proxy_headers) if rest_client.proxy else None
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=options.max_connections or rest_client.maxsize,
+                max_keepalive_connections=options.max_keepalive_connections,
+                keepalive_expiry=options.keepalive_expiry,
+            ),
+            timeout=options.timeout,
+            http2=options.http2,
+            proxy=proxy,
+            verify=rest_client.ssl_context,
+            trust_env=True,
+        )
+
+    async def prewarm(self, connections: int | None = None) -> None:
+        """Open connections to the API host ahead of the first requests.
+
+        Args:
+            connections: Number of connections to open (default:
+                ``ConnectionOptions.prewarm_connections``). With HTTP/2 a
+                single connection is opened, since requests share it.
+        """
+        count = self.connection.prewarm_connections if connections is None else connections
+        if self.connection.http2:
+            count = min(count, 1)
+        if count <= 0:
+            return
+        if self.pool_manager is None:
+            self.pool_manager = self._create_pool_manager()
+        pool = self.pool_manager
+        # Any response, even an error status, leaves an established connection in the pool.
+        await asyncio.gather(*(pool.head(self._host) for _ in range(count)), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._rest_client.close()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Any = None,
+    ) -> RESTResponse:
+        """Send a request, retrying transient failures according to the retry policy."""
+        policy = current_override() or self.retry
+        method = method.upper()
+        attempt = 0
+
+        while True:
+            try:
+                response = await self._send(method, url, headers, body, post_params, _request_timeout)
+            except httpx.TransportError as e:
+                if not policy.can_retry_error(method, e, attempt):
+                    raise
+                delay = policy.delay(attempt)
+            else:
+                if not policy.can_retry_status(method, response.status, attempt):
+                    return response
+                delay = policy.delay(attempt, response.headers.get("Retry-After"))
+                await response.response.aclose()
+
+            attempt += 1
+            self.stats.retries += 1
+            await asyncio.sleep(delay)
+
+    @contextlib.asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, Any] | None = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Open a request whose body is read as it arrives.
+
+        The request goes through the rate limiter, holds a concurrency slot
+        until the body is read, and is retried according to the retry policy
+        until a response is returned; once its body is being read, a failure
+        is raised to the caller.
+
+        Yields:
+            The response, with its body not read yet. The bytes downloaded
+            are counted once it is closed; the reader counts the decoded ones.
+        """
+        policy = current_override() or self.retry
+        method = method.upper()
+        attempt = 0
+
+        while True:
+            if self.rate_limiter is not None:
+                self.stats.throttled_seconds += await self.rate_limiter.acquire(url)
+            if self.pool_manager is None:
+                self.pool_manager = self._create_pool_manager()
+            pool = self.pool_manager
+
+            slot = self.concurrency.slot() if self.concurrency is not None else contextlib.nullcontext()
+            async with slot:
+                self.stats.requests += 1
+                started = time.monotonic()
+                request = pool.build_request(method, url, headers=headers, timeout=self.connection.timeout)
+                try:
+                    response = await pool.send(request, stream=True)
+                except httpx.TransportError as e:
+                    if self.concurrency is not None:
+                        self.concurrency.record(time.monotonic() - started, None)
+                    if not policy.can_retry_error(method, e, attempt):
+                        raise
+                    delay = policy.delay(attempt)
+                else:
+                    if self.concurrency is not None:
+                        self.concurrency.record(time.monotonic() - started, response.status_code)
+                    if not policy.can_retry_status(method, response.status_code, attempt):
+                        try:
+                            yield response
+                        finally:
+                            await response.aclose()
+                            self.stats.bytes_received += response.num_bytes_downloaded
+                        return
+                    delay = policy.delay(attempt, response.headers.get("Retry-After"))
+                    await response.aclose()
+
+            attempt += 1
+            self.stats.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, Any] | None,
+        body: Any,
+        post_params: Any,
+        _request_timeout: Any,
+    ) -> RESTResponse:
+        """Send a single attempt once the rate limiter and concurrency controller allow it."""
+        if self.rate_limiter is not None:
+            self.stats.throttled_seconds += await self.rate_limiter.acquire(url)
+
+        if self.pool_manager is None:
+            self.pool_manager = self._create_pool_manager()
+
+        # The REST client mutates the headers (Content-Type), so every attempt gets a fresh copy.
+        headers = dict(headers or {})
+        timeout = _request_timeout or self.connection.timeout
+        content = self._encode_body(method, headers, body)
+
+        slot = self.concurrency.slot() if self.concurrency is not None else contextlib.nullcontext()
+        async with slot:
+            self.stats.requests += 1
+            started = time.monotonic()
+            try:
+                if content is None:
+                    sent = await self._rest_client.request(
+                        method,
+                        url,
+                        headers=headers,
+                        body=body,
+                        post_params=post_params,
+                        _request_timeout=timeout,
+                    )
+                    raw = sent.response
+                    size = int(raw.request.headers.get("Content-Length", 0))
+                    self.stats.bytes_sent += size
+                    self.stats.bytes_sent_uncompressed += size
+                else:
+                    raw = await self.pool_manager.request(
+                        method, url, headers=headers, content=content, timeout=timeout
+                    )
+            except httpx.TransportError:
+                # Timeouts and resets are the clearest overload signals: count them as failures.
+                if self.concurrency is not None:
+                    self.concurrency.record(time.monotonic() - started, None)
+                raise
+            if self.concurrency is not None:
+                self.concurrency.record(time.monotonic() - started, raw.status_code)
+        return _MeteredResponse(raw, self.stats)
+
+    def _encode_body(self, method: str, headers: dict[str, Any], body: Any) -> bytes | None:
+        """Serialize and gzip a JSON body above the compression threshold.
+
+        Returns:
+            The body to send, or None to let the REST client encode it.
+        """
+        if not self.connection.compress_requests or body is None or method not in _BODY_METHODS:
+            return None
+        content_type = headers.setdefault("Content-Type", "application/json")
+        if "json" not in content_type.lower() or isinstance(body, (bytes, str)):
+            return None
+
+        # Same encoding as httpx uses for ``json=`` bodies.
+        data = json.dumps(body, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+        if len(data) < self.connection.compression_threshold:
+            return None
+        content = gzip.compress(data, compresslevel=6)
+        headers["Content-Encoding"] = "gzip"
+        self.stats.bytes_sent += len(content)
+        self.stats.bytes_sent_uncompressed += len(data)
+        return content
+
+
+def http_client(client: ApiClient) -> httpx.AsyncClient:
+    """Return the pooled ``httpx.AsyncClient`` of an API client.
+
+    The pool is created on first use with the SSL, proxy and connection
+    limits of the client's ``Configuration``, exactly as the generated
+    client would create it for its own requests.
+    """
+    rest_client = client.rest_client
+    if rest_client.pool_manager is None:
+        rest_client.pool_manager = rest_client._create_pool_manager()
+    return rest_client.pool_manager
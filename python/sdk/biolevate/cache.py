@@ -0,0 +1,288 @@
+"""Client-side caches of API resources."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+CacheNamespace = Literal["providers", "collections", "files"]
+
+DEFAULT_TTLS: Mapping[CacheNamespace, float] = {"providers": 300.0, "collections": 60.0, "files": 30.0}
+"""Default time to live in seconds of the cached resources."""
+
+
+@dataclass
+class CacheStats:
+    """Counters of a cache.
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups that found no entry, or an expired one.
+        evictions: Entries dropped to make room for new ones.
+        invalidations: Entries dropped because the SDK changed the resource.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of the lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MetadataCache:
+    """In-memory LRU cache of providers, collections and files, with a TTL per resource.
+
+    Entries expire after the TTL of their resource, and the least recently
+    used entries are evicted beyond ``maxsize``. The resources of the client
+    drop the entries of the objects they update or delete, but changes made
+    by other clients are only seen once entries expire.
+
+    Cached models are shared between the callers, so treat them as read-only.
+
+    Example:
+        ```python
+        cache = MetadataCache(maxsize=10_000, ttl={"providers": 3600, "files": 10})
+        client = BiolevateClient(base_url=..., token=..., cache=cache)
+        ```
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | Mapping[CacheNamespace, float] | None = None,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries.
+            ttl: Time to live in seconds of every entry, or by resource
+                (``"providers"``, ``"collections"``, ``"files"``). Resources
+                not given keep their default TTL (see ``DEFAULT_TTLS``).
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        if ttl is None or isinstance(ttl, Mapping):
+            self.ttl = {**DEFAULT_TTLS, **(ttl or {})}
+        else:
+            self.ttl = dict.fromkeys(DEFAULT_TTLS, float(ttl))
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, namespace: CacheNamespace, key: str) -> Any | None:
+        """Return a cached resource, or None if absent or expired."""
+        entry = self._entries.get((namespace, key))
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[namespace, key]
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end((namespace, key))
+        self.stats.hits += 1
+        return entry[1]
+
+    def set(self, namespace: CacheNamespace, key: str, value: Any) -> None:
+        """Cache a resource, evicting the least recently used entries when full."""
+        ttl = self.ttl.get(namespace, 0.0)
+        if ttl <= 0:
+            return
+        self._entries[namespace, key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, namespace: CacheNamespace, key: str | None = None) -> None:
+        """Drop a cached resource, or every resource of a namespace when ``key`` is None."""
+        keys = [(namespace, key)] if key is not None else [k for k in self._entries if k[0] == namespace]
+        for entry_key in keys:
+            if self._entries.pop(entry_key, None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+JobArtifact = Literal["job", "inputs", "outputs", "annotations"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    task TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    artifact TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (task, job_id, artifact)
+);
+CREATE INDEX IF NOT EXISTS artifacts_accessed ON artifacts (accessed);
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS usage (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL);
+INSERT OR IGNORE INTO usage SELECT 0, COALESCE(SUM(size), 0) FROM artifacts;
+CREATE TRIGGER IF NOT EXISTS artifacts_insert AFTER INSERT ON artifacts
+BEGIN UPDATE usage SET total = total + new.size; END;
+CREATE TRIGGER IF NOT EXISTS artifacts_update AFTER UPDATE OF size ON artifacts
+BEGIN UPDATE usage SET total = total + new.size - old.size; END;
+CREATE TRIGGER IF NOT EXISTS artifacts_delete AFTER DELETE ON artifacts
+BEGIN UPDATE usage SET total = total - old.size; END;
+COMMIT;
+"""
+
+
+class JobCache:
+    """Persistent cache of the artifacts of terminal jobs, in a SQLite database.
+
+    Once a job is SUCCESS, FAILED or ABORTED, its inputs, outputs and
+    annotations never change, so they can be kept across processes and
+    restarts. Artifacts are stored compressed, and the least recently read
+    ones are evicted once the database holds more than ``max_size`` bytes;
+    their total size is kept up to date by triggers, so writes do not slow
+    down as the cache grows. Several processes can share the same database.
+    Each thread reuses its own connection until :meth:`close`.
+
+    Example:
+        ```python
+        client = BiolevateClient(base_url=..., token=..., job_cache=JobCache("~/.cache/biolevate/jobs.db"))
+        ```
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_size: int = 1 << 30) -> None:
+        """Open or create the cache database.
+
+        Args:
+            path: Path of the SQLite database file.
+            max_size: Maximum total size in bytes of the compressed artifacts.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.path = Path(path).expanduser()
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        # WAL lets readers of other processes proceed while one process writes.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection of the current thread, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Only used by the thread that opened it, but closed by whichever thread calls close().
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        """Close the connections of every thread; the cache reopens them on next use."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
+    async def get(self, task: str, job_id: str, artifact: JobArtifact) -> bytes | None:
+        """Return a cached artifact as JSON, or None if absent.
+
+        Args:
+            task: The job type (``"qa"`` or ``"extraction"``).
+            job_id: The unique identifier of the job.
+            artifact: The artifact to read.
+        """
+        data = await asyncio.to_thread(self._get, task, job_id, artifact)
+        if data is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return zlib.decompress(data)
+
+    async def set(self, task: str, job_id: str, artifact: JobArtifact, data: bytes) -> None:
+        """Cache an artifact given as JSON, evicting the least recently read ones if needed.
+
+        Args:
+            task: The job type (``"qa"`` or ``"extraction"``).
+            job_id: The unique identifier of the job.
+            artifact: The artifact to write.
+            data: The JSON serialization of the artifact.
+        """
+        self.stats.evictions += await asyncio.to_thread(self._set, task, job_id, artifact, zlib.compress(data))
+
+    async def clear(self) -> None:
+        """Drop every artifact."""
+        await asyncio.to_thread(self._execute, "DELETE FROM artifacts")
+
+    def size(self) -> int:
+        """Return the total size in bytes of the compressed artifacts."""
+        return self._connection().execute("SELECT total FROM usage").fetchone()[0]
+
+    def _get(self, task: str, job_id: str, artifact: str) -> bytes | None:
+        key = (task, job_id, artifact)
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT data FROM artifacts WHERE task = ? AND job_id = ? AND artifact = ?", key
+        ).fetchone()
+        if row is not None:
+            connection.execute(
+                "UPDATE artifacts SET accessed = ? WHERE task = ? AND job_id = ? AND artifact = ?",
+                (time.time(), *key),
+            )
+        return None if row is None else row[0]
+
+    def _set(self, task: str, job_id: str, artifact: str, data: bytes) -> int:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete would not fire the size trigger.
+            connection.execute(
+                "INSERT INTO artifacts VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (task, job_id, artifact) "
+                "DO UPDATE SET data = excluded.data, size = excluded.size, accessed = excluded.accessed",
+                (task, job_id, artifact, data, len(data), time.time()),
+            )
+            evicted = self._evict(connection)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return evicted
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        """Delete the least recently read artifacts until the total size fits."""
+        excess = connection.execute("SELECT total FROM usage").fetchone()[0] - self.max_size
+        evicted = 0
+        while excess > 0:
+            rows = connection.execute("SELECT rowid, size FROM artifacts ORDER BY accessed LIMIT 64").fetchall()
+            if not rows:
+                break
+            for rowid, size in rows:
+                if excess <= 0:
+                    break
+                connection.execute("DELETE FROM artifacts WHERE rowid = ?", (rowid,))
+                excess -= size
+                evicted += 1
+        return evicted
+
+    def _execute(self, statement: str) -> None:
+        self._connection().execute(statement)
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
+from biolevate._transport import ConnectionOptions, Transport, TransportStats
+from biolevate.cache import JobCache, MetadataCache
+from biolevate.ratelimit import AdaptiveConcurrency, RateLimiter
 from biolevate.resources.collections import CollectionsResource
 from biolevate.resources.extraction import ExtractionResource
 from biolevate.resources.files import FilesResource
@@ -12,6 +17,10 @@ from biolevate.resources.providers import ProvidersResource
 from biolevate.resources.question_answering import QuestionAnsweringResource
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from biolevate.ratelimit import RateLimit
+    from biolevate.retry import Retry
     from biolevate_client import ApiClient
 
 
@@ -30,15 +39,79 @@ class BiolevateClient:
         ```
     """
 
-    def __init__(self, base_url: str, token: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        retries: int | Retry | None = None,
+        rate_limit: float | RateLimit | Mapping[str, float | RateLimit] | RateLimiter | None = None,
+        adaptive_concurrency: bool | AdaptiveConcurrency = False,
+        connection: ConnectionOptions | None = None,
+        coalesce_requests: bool = False,
+        cache: bool | MetadataCache = False,
+        conditional_requests: bool | int = False,
+        job_cache: str | os.PathLike[str] | JobCache | None = None,
+        trusted_responses: bool = False,
+        offload_threshold: int | None = 1024 * 1024,
+        offload_executor: Executor | None = None,
+    ) -> None:
         """Initialize the Biolevate client.
 
         Args:
             base_url: The base URL of the Biolevate API.
             token: The authentication token (JWT).
+            retries: Retry policy for transient failures (429, 502, 503, 504
+                and connection errors), or a maximum number of retries using
+                the default policy. Retries are disabled by default.
+            rate_limit: Maximum requests per second, for every request or by
+                endpoint group (``"jobs"``, ``"items"``, ``"files"``,
+                ``"providers"``, ``"default"``). Pass a ``RateLimiter`` to
+                share one budget between several clients.
+            adaptive_concurrency: Whether to adapt the number of requests in
+                flight to the server's capacity, or the controller to use
+                (it can be shared between clients as well).
+            connection: HTTP/2, connection pool and timeout settings.
+            coalesce_requests: Whether concurrent identical GET requests
+                share one HTTP request and its result. The callers then
+                receive the same model instance, which they must not modify.
+            cache: Whether to cache providers, collections and files in
+                memory, or the cache to use (it can be shared between
+                clients as well).
+            conditional_requests: Whether to revalidate repeated GET
+                requests with ``ETag``/``Last-Modified`` validators, serving
+                the kept result on ``304 Not Modified``, or the number of
+                responses to keep (default 256).
+            job_cache: Persistent cache of the terminal jobs and their
+                inputs, outputs and annotations, or the path of its database.
+            trusted_responses: Whether to build the response models without
+                validating them (no enum, strict type or field validator
+                checks), which is several times faster on large responses.
+                Only use it with an API whose responses match its schema.
+            offload_threshold: Size in bytes above which a response is
+                decoded in a thread instead of on the event loop, so that
+                large listings or annotation lists do not stall the other
+                coroutines (default 1 MiB, None to always decode inline).
+                The time spent is counted in ``stats.offloaded_seconds``.
+            offload_executor: Executor decoding the large responses, e.g. a
+                dedicated ``ThreadPoolExecutor`` or a ``ProcessPoolExecutor``
+                (default: the default executor of the event loop). The
+                client does not shut it down.
         """
         self._base_url = base_url
         self._token = token
+        self._retries = retries
+        self._rate_limiter = (
+            rate_limit if rate_limit is None or isinstance(rate_limit, RateLimiter) else RateLimiter(rate_limit)
+        )
+        self._concurrency = AdaptiveConcurrency() if adaptive_concurrency is True else adaptive_concurrency or None
+        self._connection = connection
+        self._coalesce_requests = coalesce_requests
+        self._cache = MetadataCache() if cache is True else cache or None
+        self._job_cache = job_cache if job_cache is None or isinstance(job_cache, JobCache) else JobCache(job_cache)
+        self._revalidation_cache_size = 256 if conditional_requests is True else int(conditional_requests)
+        self._trusted_responses = trusted_responses
+        self._offload_threshold = offload_threshold
+        self._offload_executor = offload_executor
         self._client: ApiClient | None = None
         self._providers: ProvidersResource | None = None
         self._items: ProviderItemsResource | None = None
@@ -50,60 +123,91 @@ class BiolevateClient:
     def _get_client(self) -> ApiClient:
         """Get or create the underlying API client."""
         if self._client is None:
-            from biolevate_client import ApiClient
+            from biolevate._api_client import ApiClient
             from biolevate_client.configuration import Configuration
 
             config = Configuration(
                 host=self._base_url,
                 access_token=self._token,
+                retries=self._retries,
+            )
+            self._client = ApiClient(
+                config,
+                coalesce=self._coalesce_requests,
+                revalidation_cache_size=self._revalidation_cache_size,
+                trusted=self._trusted_responses,
+                offload_threshold=self._offload_threshold,
+                offload_executor=self._offload_executor,
+            )
+            Transport.install(
+                self._client,
+                rate_limiter=self._rate_limiter,
+                concurrency=self._concurrency,
+                connection=self._connection,
             )
-            self._client = ApiClient(config)
         return self._client
 
+    @property
+    def stats(self) -> TransportStats:
+        """Counters of the HTTP requests sent by this client, retries included."""
+        return self._transport().stats
+
+    @property
+    def cache(self) -> MetadataCache | None:
+        """The metadata cache of this client, if enabled."""
+        return self._cache
+
+    def _transport(self) -> Transport:
+        transport = self._get_client().rest_client
+        assert isinstance(transport, Transport)
+        return transport
+
     @property
     def providers(self) -> ProvidersResource:
         """Access the providers resource for managing storage providers."""
         if self._providers is None:
-            self._providers = ProvidersResource(self._get_client())
+            self._providers = ProvidersResource(self._get_client(), cache=self._cache)
         return self._providers
 
     @property
     def items(self) -> ProviderItemsResource:
         """Access the provider items resource for managing files/folders within providers."""
         if self._items is None:
-            self._items = ProviderItemsResource(self._get_client())
+            self._items = ProviderItemsResource(self._get_client(), cache=self._cache)
         return self._items
 
     @property
     def files(self) -> FilesResource:
         """Access the files resource for managing indexed files."""
         if self._files is None:
-            self._files = FilesResource(self._get_client())
+            self._files = FilesResource(self._get_client(), cache=self._cache)
         return self._files
 
     @property
     def collections(self) -> CollectionsResource:
         """Access the collections resource for managing file collections."""
         if self._collections is None:
-            self._collections = CollectionsResource(self._get_client())
+            self._collections = CollectionsResource(self._get_client(), cache=self._cache)
         return self._collections
 
     @property
     def extraction(self) -> ExtractionResource:
         """Access the extraction resource for metadata extraction jobs."""
         if self._extraction is None:
-            self._extraction = ExtractionResource(self._get_client())
+            self._extraction = ExtractionResource(self._get_client(), job_cache=self._job_cache)
         return self._extraction
 
     @property
     def qa(self) -> QuestionAnsweringResource:
         """Access the question answering resource for QA jobs."""
         if self._qa is None:
-            self._qa = QuestionAnsweringResource(self._get_client())
+            self._qa = QuestionAnsweringResource(self._get_client(), job_cache=self._job_cache)
         return self._qa
 
     async def __aenter__(self) -> BiolevateClient:
-        """Enter async context."""
+        """Enter async context, opening ``connection.prewarm_connections`` connections."""
+        if self._connection is not None and self._connection.prewarm_connections:
+            await self._transport().prewarm()
         return self
 
     async def __aexit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: object) -> None:
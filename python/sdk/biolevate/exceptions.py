@@ -22,3 +22,16 @@ class APIError(BiolevateError):
         self.status_code = status_code
         self.message = message
         super().__init__(f"API error {status_code}: {message}")
+
+
+class WaitTimeoutError(BiolevateError):
+    """Raised when waiting for a job or file exceeds the given timeout."""
+
+
+class IndexationError(BiolevateError):
+    """Raised when the indexation of a file fails or is aborted."""
+
+    def __init__(self, file_id: str, message: str = "") -> None:
+        self.file_id = file_id
+        self.message = message
+        super().__init__(f"Indexation of file '{file_id}' failed: {message}")
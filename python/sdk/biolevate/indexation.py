@@ -0,0 +1,63 @@
+"""Helpers to follow the indexation of files."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+from biolevate.jobs import TERMINAL_JOB_STATUSES
+
+if TYPE_CHECKING:
+    from biolevate.models import File
+
+IndexationState = Literal["ready", "failed", "pending"]
+
+
+@dataclass
+class IndexationResult:
+    """Indexation outcome of a set of files.
+
+    Attributes:
+        ready: IDs of the files whose indexation succeeded.
+        failed: IDs of the files whose indexation failed, was aborted, or
+            that no longer exist.
+        pending: IDs of the files still being indexed when the wait timed out.
+        errors: Error message of each failed file, when the API reports one.
+    """
+
+    ready: set[str] = field(default_factory=set)
+    failed: set[str] = field(default_factory=set)
+    pending: set[str] = field(default_factory=set)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def all_ready(self) -> bool:
+        """Whether every file is indexed."""
+        return not self.failed and not self.pending
+
+
+def indexation_state(file: File) -> IndexationState:
+    """Classify a file from its last indexation infos.
+
+    Args:
+        file: The file to classify.
+
+    Returns:
+        ``"ready"`` once indexed, ``"failed"`` if the indexation failed or was
+        aborted, and ``"pending"`` otherwise.
+    """
+    infos = file.last_indexation_infos
+    status = infos.status if infos else None
+    if status == "SUCCESS" or (status is None and file.indexed):
+        return "ready"
+    if status in TERMINAL_JOB_STATUSES:
+        return "failed"
+    return "pending"
+
+
+def indexation_error(file: File) -> str:
+    """Return the error reported for a failed indexation."""
+    infos = file.last_indexation_infos
+    if infos is None:
+        return "Indexation failed"
+    return infos.error_message or f"Indexation {(infos.status or 'failed').lower()}"
@@ -0,0 +1,251 @@
+"""Helpers shared by the extraction and question answering job resources."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from biolevate._backoff import Backoff
+from biolevate._json_stream import iter_json_array
+from biolevate._transport import Transport
+from biolevate.exceptions import APIError, AuthenticationError, NotFoundError, WaitTimeoutError
+
+if TYPE_CHECKING:
+    from biolevate.cache import JobArtifact, JobCache
+    from biolevate.models import Annotation, Job
+    from biolevate_client import ApiClient
+
+OutputsT = TypeVar("OutputsT")
+ArtifactT = TypeVar("ArtifactT")
+
+TERMINAL_JOB_STATUSES = frozenset({"SUCCESS", "FAILED", "ABORTED"})
+"""Job statuses after which a job never changes again."""
+
+
+@dataclass
+class JobResult(Generic[OutputsT]):
+    """A job that reached a terminal status, with its optional results.
+
+    Attributes:
+        job: The job in its terminal state.
+        outputs: The job outputs, when requested and the job succeeded.
+        annotations: The job annotations, when requested and the job succeeded.
+    """
+
+    job: Job
+    outputs: OutputsT | None = None
+    annotations: list[Annotation] | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the job finished with status SUCCESS."""
+        return self.job.status == "SUCCESS"
+
+
+async def wait_for_job(
+    get_job: Callable[[str], Awaitable[Job]],
+    job_id: str,
+    timeout: float | None,
+    backoff: Backoff,
+) -> Job:
+    """Poll a job until it reaches a terminal status.
+
+    Args:
+        get_job: Coroutine function fetching the job by ID.
+        job_id: The unique identifier of the job.
+        timeout: Maximum number of seconds to wait, or None to wait forever.
+        backoff: Schedule of delays between two polls.
+
+    Returns:
+        The job in its terminal state.
+
+    Raises:
+        WaitTimeoutError: If the job is still running after ``timeout`` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    attempt = 0
+
+    while True:
+        job = await get_job(job_id)
+        if job.status in TERMINAL_JOB_STATUSES:
+            return job
+
+        delay = backoff.delay(attempt)
+        attempt += 1
+        if deadline is not None:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise WaitTimeoutError(f"Job '{job_id}' still {job.status} after {timeout}s")
+            delay = min(delay, remaining)
+        await asyncio.sleep(delay)
+
+
+async def cached_job(
+    cache: JobCache | None,
+    task: str,
+    job_id: str,
+    fetch: Callable[[str], Awaitable[Job]],
+) -> Job:
+    """Get a job, from the job cache once it is terminal.
+
+    Args:
+        cache: The job cache, or None to always fetch the job.
+        task: The job type (``"qa"`` or ``"extraction"``).
+        job_id: The unique identifier of the job.
+        fetch: Coroutine function fetching the job from the API.
+
+    Returns:
+        The job.
+    """
+    if cache is None:
+        return await fetch(job_id)
+
+    from biolevate_client.models import Job
+
+    data = await cache.get(task, job_id, "job")
+    if data is not None:
+        return Job.from_dict(json.loads(data))
+    job = await fetch(job_id)
+    if job.status in TERMINAL_JOB_STATUSES:
+        await cache.set(task, job_id, "job", json.dumps(job.to_dict(), default=str).encode())
+    return job
+
+
+async def cached_artifact(
+    cache: JobCache | None,
+    task: str,
+    job_id: str,
+    artifact: JobArtifact,
+    fetch: Callable[[str], Awaitable[ArtifactT]],
+    get_job: Callable[[str], Awaitable[Job]],
+    model: Any,
+    many: bool = False,
+) -> ArtifactT:
+    """Get a job artifact, from the job cache once the job is terminal.
+
+    Inputs never change, so they are cached right away; outputs and
+    annotations are only cached when the job had reached a terminal status
+    before they were fetched.
+
+    Args:
+        cache: The job cache, or None to always fetch the artifact.
+        task: The job type (``"qa"`` or ``"extraction"``).
+        job_id: The unique identifier of the job.
+        artifact: The artifact to get.
+        fetch: Coroutine function fetching the artifact from the API.
+        get_job: Coroutine function getting the job, to check its status.
+        model: The model class of the artifact.
+        many: Whether the artifact is a list of ``model``.
+
+    Returns:
+        The artifact.
+    """
+    if cache is None:
+        return await fetch(job_id)
+
+    data = await cache.get(task, job_id, artifact)
+    if data is not None:
+        if many:
+            return [model.from_dict(item) for item in json.loads(data)]  # type: ignore[return-value]
+        return model.from_dict(json.loads(data))
+
+    # Read the status first: a job finishing between the two requests must not
+    # get the partial artifact fetched while it was still running cached forever.
+    cacheable = artifact == "inputs" or (await get_job(job_id)).status in TERMINAL_JOB_STATUSES
+    value = await fetch(job_id)
+    if cacheable:
+        encoded = [item.to_dict() for item in value] if many else value.to_dict()  # type: ignore[attr-defined]
+        # ``default=str`` covers the UUID and datetime fields the generated ``to_json`` cannot encode.
+        await cache.set(task, job_id, artifact, json.dumps(encoded, default=str).encode())
+    return value
+
+
+async def streamed_artifact(
+    cache: JobCache | None,
+    task: str,
+    job_id: str,
+    artifact: JobArtifact,
+    stream: Callable[[str], AsyncIterator[Any]],
+    model: Any,
+) -> AsyncIterator[Any]:
+    """Iterate over the items of a list job artifact, from the job cache if it holds it.
+
+    Streamed items are not added to the cache, which would mean holding them
+    all in memory; the ``get_job_*`` methods cache them.
+
+    Args:
+        cache: The job cache, or None to always stream the artifact.
+        task: The job type (``"qa"`` or ``"extraction"``).
+        job_id: The unique identifier of the job.
+        artifact: The artifact to iterate over.
+        stream: Async generator function streaming the artifact items from the API.
+        model: The model class of the items.
+
+    Yields:
+        The items of the artifact.
+    """
+    data = await cache.get(task, job_id, artifact) if cache is not None else None
+    if data is None:
+        async for item in stream(job_id):
+            yield item
+        return
+    for item in json.loads(data):
+        yield model.from_dict(item)
+
+
+async def stream_job_annotations(
+    client: ApiClient,
+    job_id: str,
+    request: tuple[Any, ...],
+) -> AsyncIterator[Annotation]:
+    """Stream the annotations of a job from the API, building them as they are received.
+
+    The request goes through the transport of the client like any other
+    (rate limiter, concurrency slot, retries until the body is read, stats),
+    and the annotations are built as the client builds response models, with
+    or without validation (see :func:`biolevate._decoders.converter_for`).
+
+    Args:
+        client: The API client.
+        job_id: The unique identifier of the job.
+        request: The serialized request of the annotations endpoint, as
+            returned by the ``_*_serialize`` methods of the generated API.
+
+    Yields:
+        The annotations, in the order of the API response.
+
+    Raises:
+        NotFoundError: If the job is not found.
+        AuthenticationError: If authentication fails.
+        APIError: If the API returns an unexpected error.
+    """
+    from biolevate._decoders import converter_for
+    from biolevate_client.exceptions import (
+        ApiException,
+        ForbiddenException,
+        NotFoundException,
+        UnauthorizedException,
+    )
+
+    method, url, headers, _, _ = request
+    transport = client.rest_client
+    assert isinstance(transport, Transport)
+    convert = converter_for("EliseAnnotation", getattr(client, "trusted", False))
+    assert convert is not None
+
+    try:
+        async with transport.stream(method, url, headers) as response:
+            async for item in iter_json_array(response, transport.stats):
+                yield convert(item)
+    except NotFoundException as e:
+        raise NotFoundError(f"Job '{job_id}' not found") from e
+    except UnauthorizedException as e:
+        raise AuthenticationError("Authentication failed") from e
+    except ForbiddenException as e:
+        raise AuthenticationError("Access denied") from e
+    except ApiException as e:
+        raise APIError(e.status or 500, str(e.reason)) from e
@@ -2,63 +2,97 @@
 
 This module provides simplified aliases for the generated client models,
 making the SDK more user-friendly while decoupling from internal naming.
+
+The models are imported on first access (PEP 562), so only the models that
+are used get loaded.
 """
 
-from biolevate_client.models import (
-    EliseAnnotation as Annotation,
-)
-from biolevate_client.models import (
-    EliseCollectionInfo as Collection,
-)
-from biolevate_client.models import (
-    EliseFileInfo as File,
-)
-from biolevate_client.models import (
-    EliseMetaInput as MetaInput,
-)
-from biolevate_client.models import (
-    EliseMetaResult as ExtractionResult,
-)
-from biolevate_client.models import (
-    EliseOntology as Ontology,
-)
-from biolevate_client.models import (
-    EliseQAResult as QAResult,
-)
-from biolevate_client.models import (
-    EliseQuestionInput as QuestionInput,
-)
-from biolevate_client.models import (
-    ExpectedAnswerTypeDto as AnswerType,
-)
-from biolevate_client.models import (
-    ExtractJobInputs as ExtractionJobInputs,
-)
-from biolevate_client.models import (
-    ExtractJobOutputs as ExtractionJobOutputs,
-)
-from biolevate_client.models import (
-    FSProviderExternal as Provider,
-)
-from biolevate_client.models import (
-    Job,
-    ListItemsResponse,
-    ProviderItem,
-    QAJobInputs,
-    QAJobOutputs,
-)
-from biolevate_client.models import (
-    PageDataEliseCollectionInfo as CollectionPage,
-)
-from biolevate_client.models import (
-    PageDataEliseFileInfo as FilePage,
-)
-from biolevate_client.models import (
-    PageDataFSProviderExternal as ProviderPage,
-)
-from biolevate_client.models import (
-    PageDataJob as JobPage,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from biolevate_client.models import (
+        EliseAnnotation as Annotation,
+    )
+    from biolevate_client.models import (
+        EliseCollectionInfo as Collection,
+    )
+    from biolevate_client.models import (
+        EliseFileInfo as File,
+    )
+    from biolevate_client.models import (
+        EliseMetaInput as MetaInput,
+    )
+    from biolevate_client.models import (
+        EliseMetaResult as ExtractionResult,
+    )
+    from biolevate_client.models import (
+        EliseOntology as Ontology,
+    )
+    from biolevate_client.models import (
+        EliseQAResult as QAResult,
+    )
+    from biolevate_client.models import (
+        EliseQuestionInput as QuestionInput,
+    )
+    from biolevate_client.models import (
+        ExpectedAnswerTypeDto as AnswerType,
+    )
+    from biolevate_client.models import (
+        ExtractJobInputs as ExtractionJobInputs,
+    )
+    from biolevate_client.models import (
+        ExtractJobOutputs as ExtractionJobOutputs,
+    )
+    from biolevate_client.models import (
+        FSProviderExternal as Provider,
+    )
+    from biolevate_client.models import (
+        Job,
+        ListItemsResponse,
+        ProviderItem,
+        QAJobInputs,
+        QAJobOutputs,
+    )
+    from biolevate_client.models import (
+        PageDataEliseCollectionInfo as CollectionPage,
+    )
+    from biolevate_client.models import (
+        PageDataEliseFileInfo as FilePage,
+    )
+    from biolevate_client.models import (
+        PageDataFSProviderExternal as ProviderPage,
+    )
+    from biolevate_client.models import (
+        PageDataJob as JobPage,
+    )
+
+_GENERATED_NAMES: dict[str, str] = {
+    "Annotation": "EliseAnnotation",
+    "Collection": "EliseCollectionInfo",
+    "File": "EliseFileInfo",
+    "MetaInput": "EliseMetaInput",
+    "ExtractionResult": "EliseMetaResult",
+    "Ontology": "EliseOntology",
+    "QAResult": "EliseQAResult",
+    "QuestionInput": "EliseQuestionInput",
+    "AnswerType": "ExpectedAnswerTypeDto",
+    "ExtractionJobInputs": "ExtractJobInputs",
+    "ExtractionJobOutputs": "ExtractJobOutputs",
+    "Provider": "FSProviderExternal",
+    "Job": "Job",
+    "ListItemsResponse": "ListItemsResponse",
+    "ProviderItem": "ProviderItem",
+    "QAJobInputs": "QAJobInputs",
+    "QAJobOutputs": "QAJobOutputs",
+    "CollectionPage": "PageDataEliseCollectionInfo",
+    "FilePage": "PageDataEliseFileInfo",
+    "ProviderPage": "PageDataFSProviderExternal",
+    "JobPage": "PageDataJob",
+}
+"""Name of the generated model behind each alias."""
 
 __all__ = [
     "Annotation",
@@ -83,3 +117,16 @@ __all__ = [
     "QAResult",
     "QuestionInput",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    generated = _GENERATED_NAMES.get(name)
+    if generated is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("biolevate_client.models"), generated)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_GENERATED_NAMES))
@@ -1 +1,16 @@
 """Biolevate pipelines for common workflows."""
+
+from biolevate.pipelines.ingest import IngestPipeline, IngestReport, IngestResult
+from biolevate.pipelines.jobs import JobCompletion, JobWatcher
+from biolevate.pipelines.upload import BulkUploader, UploadProgress, UploadResult
+
+__all__ = [
+    "BulkUploader",
+    "IngestPipeline",
+    "IngestReport",
+    "IngestResult",
+    "JobCompletion",
+    "JobWatcher",
+    "UploadProgress",
+    "UploadResult",
+]
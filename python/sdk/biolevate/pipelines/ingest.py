@@ -0,0 +1,344 @@
+"""Streaming ingest of local files: upload, indexation and collection membership."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import httpx
+
+from biolevate._backoff import Backoff
+from biolevate.exceptions import BiolevateError, IndexationError, WaitTimeoutError
+from biolevate.pipelines.upload import UploadSource, _folder_key, _sources
+
+if TYPE_CHECKING:
+    from biolevate.client import BiolevateClient
+    from biolevate.resources.files import FilesResource
+
+IngestStage = Literal["upload", "index", "collection"]
+
+
+@dataclass
+class IngestResult:
+    """Outcome of the ingestion of a single file.
+
+    Attributes:
+        path: The local file.
+        key: The destination key in the provider.
+        file_id: The ID of the indexed file, once it has been created.
+        error: The error that stopped the ingestion of this file, if any.
+        stage: The stage that failed, if any.
+    """
+
+    path: Path
+    key: str
+    file_id: str | None = None
+    error: BiolevateError | OSError | httpx.TransportError | None = None
+    stage: IngestStage | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the file went through every stage."""
+        return self.error is None
+
+
+@dataclass
+class IngestReport:
+    """Summary of an ingest run.
+
+    Attributes:
+        file_ids: IDs of the successfully ingested files, by key.
+        failures: Results of the files that could not be ingested.
+    """
+
+    file_ids: dict[str, str] = field(default_factory=dict)
+    failures: list[IngestResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every file was ingested."""
+        return not self.failures
+
+
+class IngestPipeline:
+    """Upload, index and collect many files with overlapping stages.
+
+    Each file goes through three stages: upload to the provider and creation
+    of the indexed file, wait for its indexation, and addition to the target
+    collection. Every stage has its own pool of workers and hands files over
+    to the next one through a bounded queue, so file N+1 is uploaded while
+    file N is being indexed, and a slow stage holds back the ones before it
+    instead of letting work pile up in memory. The files waiting for their
+    indexation are checked together, through the provider listing, so each
+    round costs a few page requests instead of one request per file.
+
+    Example:
+        ```python
+        pipeline = IngestPipeline(client, provider_id, collection_id=collection_id)
+        report = await pipeline.run(Path("papers").glob("*.pdf"), prefix="papers/")
+        for failure in report.failures:
+            print(failure.key, failure.stage, failure.error)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: BiolevateClient,
+        provider_id: str,
+        collection_id: str | None = None,
+        upload_concurrency: int = 4,
+        index_concurrency: int = 32,
+        collection_concurrency: int = 4,
+        index_timeout: float | None = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 15.0,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            client: The Biolevate client.
+            provider_id: The provider receiving the files.
+            collection_id: Collection to add the files to, or None to stop
+                once they are indexed.
+            upload_concurrency: Maximum number of files uploaded at the same time.
+            index_concurrency: Maximum number of files waited on for indexation
+                at the same time.
+            collection_concurrency: Maximum number of concurrent collection updates.
+            index_timeout: Maximum number of seconds to wait for the indexation
+                of a file, or None to wait forever.
+            poll_interval: Initial delay between two rounds of indexation checks.
+            max_poll_interval: Upper bound for the delay between two rounds.
+        """
+        if min(upload_concurrency, index_concurrency, collection_concurrency) < 1:
+            raise ValueError("stage concurrency must be at least 1")
+        self._client = client
+        self._provider_id = provider_id
+        self._collection_id = collection_id
+        self._index_timeout = index_timeout
+        self._backoff = Backoff(initial=poll_interval, maximum=max_poll_interval)
+
+        stages: list[tuple[IngestStage, int]] = [("upload", upload_concurrency), ("index", index_concurrency)]
+        if collection_id is not None:
+            stages.append(("collection", collection_concurrency))
+        self._stages = stages
+
+    async def stream(self, files: Iterable[UploadSource], prefix: str = "") -> AsyncIterator[IngestResult]:
+        """Ingest files and yield each one as soon as it is done or has failed.
+
+        Args:
+            files: Local paths, uploaded under ``prefix`` with their file name,
+                or ``(path, key)`` pairs giving the destination key explicitly.
+            prefix: Folder key under which bare paths are created.
+
+        Yields:
+            One ``IngestResult`` per file, in completion order.
+        """
+        results: asyncio.Queue[IngestResult | None] = asyncio.Queue()
+        pending = (IngestResult(path=path, key=key) for path, key in _sources(files, _folder_key(prefix)))
+        inbox: Iterable[IngestResult] | asyncio.Queue[IngestResult | None] = pending
+        indexer = _IndexWaiter(self._client.files, self._provider_id, self._index_timeout, self._backoff)
+        handles: dict[IngestStage, Callable[[IngestResult], Awaitable[None]]] = {
+            "upload": self._upload,
+            "index": indexer.wait,
+            "collection": self._add_to_collection,
+        }
+
+        tasks: list[asyncio.Task[None]] = []
+        for index, (stage, concurrency) in enumerate(self._stages):
+            last = index == len(self._stages) - 1
+            outbox: asyncio.Queue[IngestResult | None] = (
+                results if last else asyncio.Queue(maxsize=self._stages[index + 1][1])
+            )
+            downstream = 1 if last else self._stages[index + 1][1]
+            handle = handles[stage]
+            tasks.append(
+                asyncio.create_task(self._run_stage(stage, handle, concurrency, inbox, outbox, results, downstream))
+            )
+            inbox = outbox
+
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await indexer.close()
+
+    async def run(self, files: Iterable[UploadSource], prefix: str = "") -> IngestReport:
+        """Ingest files and return a summary once all of them are processed.
+
+        Args:
+            files: Local paths or ``(path, key)`` pairs, as for :meth:`stream`.
+            prefix: Folder key under which bare paths are created.
+
+        Returns:
+            The IDs of the ingested files and the failures.
+        """
+        report = IngestReport()
+        async for result in self.stream(files, prefix):
+            if result.succeeded and result.file_id is not None:
+                report.file_ids[result.key] = result.file_id
+            else:
+                report.failures.append(result)
+        return report
+
+    async def _run_stage(
+        self,
+        stage: IngestStage,
+        handle: Callable[[IngestResult], Awaitable[None]],
+        concurrency: int,
+        inbox: Iterable[IngestResult] | asyncio.Queue[IngestResult | None],
+        outbox: asyncio.Queue[IngestResult | None],
+        failures: asyncio.Queue[IngestResult | None],
+        downstream: int,
+    ) -> None:
+        """Process files with ``concurrency`` workers, then signal the end to ``downstream`` workers."""
+
+        async def process(item: IngestResult) -> None:
+            try:
+                await handle(item)
+            except (BiolevateError, OSError, httpx.TransportError) as e:
+                item.error = e
+                item.stage = stage
+                await failures.put(item)
+            else:
+                await outbox.put(item)
+
+        async def work() -> None:
+            if isinstance(inbox, asyncio.Queue):
+                while (item := await inbox.get()) is not None:
+                    await process(item)
+            else:
+                # Workers share the lazy source iterator, so at most `concurrency` files are in progress.
+                for item in inbox:
+                    await process(item)
+
+        workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # An unexpected error ends the stage: stop the other workers before signalling the end.
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            for _ in range(downstream):
+                await outbox.put(None)
+
+    async def _upload(self, item: IngestResult) -> None:
+        await self._client.items.upload_direct(self._provider_id, item.key, item.path)
+        file = await self._client.files.create(self._provider_id, item.key)
+        item.file_id = str(file.id.id) if file.id and file.id.id else None
+        if item.file_id is None:
+            raise IndexationError(item.key, "the created file has no ID")
+
+    async def _add_to_collection(self, item: IngestResult) -> None:
+        assert self._collection_id is not None and item.file_id is not None
+        await self._client.collections.add_file(self._collection_id, item.file_id)
+
+
+class _IndexWaiter:
+    """Wait for the indexation of the files of the index stage, in shared rounds of checks.
+
+    Each round checks every waiting file with one ``FilesResource.wait_indexed``
+    round, which scans the most recent pages of the provider listing instead
+    of requesting the files one by one, and bypasses the metadata cache.
+    """
+
+    def __init__(
+        self,
+        files: FilesResource,
+        provider_id: str,
+        timeout: float | None,
+        backoff: Backoff,
+    ) -> None:
+        self._files = files
+        self._provider_id = provider_id
+        self._timeout = timeout
+        self._backoff = backoff
+        self._waiting: dict[str, tuple[asyncio.Future[None], float | None]] = {}
+        self._arrived = asyncio.Event()
+        self._attempt = 0
+        self._poller: asyncio.Task[None] | None = None
+
+    async def wait(self, item: IngestResult) -> None:
+        """Wait until a file is indexed.
+
+        Raises:
+            IndexationError: If the indexation failed or the file no longer exists.
+            WaitTimeoutError: If the file is still not indexed after the timeout.
+            Exception: The error of the round checking the file, if it failed.
+        """
+        assert item.file_id is not None
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._waiting[item.file_id] = (future, None if self._timeout is None else loop.time() + self._timeout)
+        # Check new files after the initial interval rather than the current backoff delay.
+        self._attempt = 0
+        self._arrived.set()
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll())
+        await future
+
+    async def close(self) -> None:
+        """Stop checking the files still waiting."""
+        if self._poller is not None:
+            self._poller.cancel()
+            await asyncio.gather(self._poller, return_exceptions=True)
+
+    async def _poll(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._waiting:
+            file_ids = set(self._waiting)
+            try:
+                result = await self._files.wait_indexed(file_ids, provider_id=self._provider_id, timeout=0)
+            except Exception as e:
+                # Fail the round's files rather than leave their workers waiting forever;
+                # the stage reports SDK and connection errors and lets anything else abort the run.
+                for file_id in file_ids:
+                    self._settle(file_id, e)
+                continue
+
+            for file_id in result.ready:
+                self._settle(file_id)
+            for file_id in result.failed:
+                self._settle(file_id, IndexationError(file_id, result.errors.get(file_id, "Indexation failed")))
+            now = loop.time()
+            for file_id in result.pending:
+                deadline = self._waiting[file_id][1]
+                if deadline is not None and deadline <= now:
+                    error = WaitTimeoutError(f"File '{file_id}' still not indexed after {self._timeout}s")
+                    self._settle(file_id, error)
+
+            delay = self._backoff.delay(self._attempt)
+            self._attempt += 1
+            deadlines = [deadline for _, deadline in self._waiting.values() if deadline is not None]
+            if deadlines:
+                delay = min(delay, max(min(deadlines) - now, 0))
+            await self._sleep(delay)
+
+    async def _sleep(self, delay: float) -> None:
+        """Sleep until the next round, shortened to the initial interval when new files arrive."""
+        loop = asyncio.get_running_loop()
+        wake = loop.time() + delay
+        while (remaining := wake - loop.time()) > 0:
+            self._arrived.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._arrived.wait(), timeout=remaining)
+                wake = min(wake, loop.time() + self._backoff.delay(0))
+                continue
+            return
+
+    def _settle(self, file_id: str, error: BaseException | None = None) -> None:
+        future, _ = self._waiting.pop(file_id)
+        if future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
@@ -0,0 +1,364 @@
+"""Multiplexed status polling for large numbers of extraction and QA jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+import httpx
+
+from biolevate._backoff import Backoff
+from biolevate.exceptions import APIError
+from biolevate.jobs import TERMINAL_JOB_STATUSES
+
+if TYPE_CHECKING:
+    from biolevate.client import BiolevateClient
+    from biolevate.models import Job
+
+JobKind = Literal["extraction", "qa"]
+
+
+@dataclass
+class JobCompletion:
+    """Outcome of a watched job.
+
+    Attributes:
+        job_id: The unique identifier of the job.
+        kind: Whether the job is an extraction or a QA job.
+        job: The job in its terminal state, or None if it could not be polled.
+        error: The error that stopped polling, if any.
+        polls: Number of status checks of this job, on its own or in a batch.
+    """
+
+    job_id: str
+    kind: JobKind
+    job: Job | None = None
+    error: Exception | None = None
+    polls: int = 0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the job finished with status SUCCESS."""
+        return self.job is not None and self.job.status == "SUCCESS"
+
+
+@dataclass(order=True)
+class _Entry:
+    due: float
+    seq: int
+    job_id: str = field(compare=False)
+    kind: JobKind = field(compare=False)
+    added: float = field(compare=False)
+    expected_duration: float = field(compare=False)
+    interval: float = field(default=0.0, compare=False)
+    polls: int = field(default=0, compare=False)
+    failures: int = field(default=0, compare=False)
+    listed: bool = field(default=True, compare=False)
+
+
+class JobWatcher:
+    """Track many jobs through a single rate-limited polling scheduler.
+
+    Instead of one polling loop per job, every watched job sits in a single
+    schedule ordered by its next due time. A job is first polled when it is
+    expected to be close to done, then with a growing interval once it
+    overruns its expected duration, so long-running jobs stop generating
+    requests every second. Status requests are spaced to respect
+    ``max_requests_per_second`` and at most ``concurrency`` are in flight.
+
+    When at least ``batch_threshold`` jobs of the same kind are due, or at
+    least halfway to their next poll, they are checked together through the
+    job listing, most recent first, so hundreds of jobs cost a few page
+    requests instead of one request each. Jobs not found in the first pages
+    (e.g. old jobs) are polled one by one from then on.
+
+    Example:
+        ```python
+        async with JobWatcher(client, max_requests_per_second=20) as watcher:
+            for job in jobs:
+                watcher.watch(job.job_id, "extraction", expected_duration=120)
+            async for completion in watcher.completions():
+                print(completion.job_id, completion.job.status)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: BiolevateClient,
+        max_requests_per_second: float = 10.0,
+        concurrency: int = 8,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        expected_duration: float = 30.0,
+        max_failures: int = 5,
+        batch_threshold: int = 4,
+        page_size: int = 100,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            client: The Biolevate client used to poll jobs.
+            max_requests_per_second: Upper bound on status requests per second.
+            concurrency: Maximum number of status requests in flight.
+            min_interval: Shortest delay between two polls of the same job.
+            max_interval: Longest delay between two polls of the same job.
+            expected_duration: Default expected run time of a job, in seconds.
+            max_failures: Consecutive API or connection errors after which a job is reported
+                as failed instead of being polled again.
+            batch_threshold: Minimum number of jobs checked through the job
+                listing instead of one by one.
+            page_size: Number of jobs requested per listing page.
+        """
+        if max_requests_per_second <= 0:
+            raise ValueError("max_requests_per_second must be positive")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self._spacing = 1.0 / max_requests_per_second
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._expected_duration = expected_duration
+        self._max_failures = max_failures
+        self._batch_threshold = max(batch_threshold, 2)
+        self._page_size = page_size
+        self._error_backoff = Backoff(initial=min_interval, maximum=max_interval)
+        self._schedule: list[_Entry] = []
+        self._tracked: set[str] = set()
+        self._inflight: set[asyncio.Task[None]] = set()
+        self._completed: asyncio.Queue[JobCompletion] = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._seq = itertools.count()
+        self._runner: asyncio.Task[None] | None = None
+        self.requests = 0
+        """Total number of status requests issued."""
+
+    @property
+    def pending(self) -> int:
+        """Number of watched jobs that have not completed yet."""
+        return len(self._tracked)
+
+    def watch(self, job_id: str, kind: JobKind, expected_duration: float | None = None) -> None:
+        """Start tracking a job.
+
+        Args:
+            job_id: The unique identifier of the job.
+            kind: ``"extraction"`` or ``"qa"``.
+            expected_duration: Expected run time in seconds, used to delay
+                the first poll and to rank the job against others.
+        """
+        if job_id in self._tracked:
+            return
+        now = asyncio.get_running_loop().time()
+        expected = self._expected_duration if expected_duration is None else expected_duration
+        first_poll = min(max(expected * 0.5, self._min_interval), self._max_interval)
+        self._tracked.add(job_id)
+        heapq.heappush(
+            self._schedule,
+            _Entry(
+                due=now + first_poll,
+                seq=next(self._seq),
+                job_id=job_id,
+                kind=kind,
+                added=now,
+                expected_duration=expected,
+                interval=first_poll,
+            ),
+        )
+        self._start()
+        self._wakeup.set()
+
+    async def completions(self) -> AsyncIterator[JobCompletion]:
+        """Yield jobs as they reach a terminal status.
+
+        The iteration ends once every watched job has completed; jobs watched
+        while iterating are included.
+
+        Yields:
+            One ``JobCompletion`` per watched job.
+        """
+        while self._tracked or not self._completed.empty():
+            yield await self._completed.get()
+
+    async def close(self) -> None:
+        """Stop polling and cancel in-flight status requests."""
+        tasks = list(self._inflight)
+        if self._runner is not None:
+            tasks.append(self._runner)
+            self._runner = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> JobWatcher:
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: object) -> None:
+        """Exit async context and stop polling."""
+        await self.close()
+
+    def _start(self) -> None:
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_slot = loop.time()
+        while self._tracked:
+            if not self._schedule:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            now = loop.time()
+            wait = max(self._schedule[0].due, next_slot) - now
+            if wait > 0:
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                continue
+
+            await self._semaphore.acquire()
+            entry = heapq.heappop(self._schedule)
+            next_slot = max(next_slot, now) + self._spacing
+            batch = self._take_batch(entry, now)
+            task = asyncio.create_task(self._poll(entry) if len(batch) == 1 else self._poll_batch(entry.kind, batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _poll(self, entry: _Entry) -> None:
+        try:
+            entry.polls += 1
+            self.requests += 1
+            try:
+                job = await self._get_job(entry)
+            except Exception as e:
+                self._fail(entry, e)
+                return
+            self._settle(entry, job)
+        finally:
+            self._semaphore.release()
+            self._wakeup.set()
+
+    async def _poll_batch(self, kind: JobKind, entries: list[_Entry]) -> None:
+        try:
+            try:
+                found = await self._scan_recent(kind, {entry.job_id for entry in entries})
+            except Exception as e:
+                for entry in entries:
+                    entry.polls += 1
+                    self._fail(entry, e)
+                return
+
+            for entry in entries:
+                job = found.get(entry.job_id)
+                if job is None:
+                    # Not among the most recent jobs: poll it on its own from now on.
+                    entry.listed = False
+                    self._reschedule(entry, 0.0)
+                else:
+                    entry.polls += 1
+                    self._settle(entry, job)
+        finally:
+            self._semaphore.release()
+            self._wakeup.set()
+
+    async def _scan_recent(self, kind: JobKind, job_ids: set[str]) -> dict[str, Job]:
+        """Look for jobs in the most recent pages of the job listing.
+
+        The scan stops once every job has been seen, or after twice as many
+        jobs as requested have been listed.
+        """
+        resource = self._client.extraction if kind == "extraction" else self._client.qa
+        found: dict[str, Job] = {}
+        budget = 2 * len(job_ids) + self._page_size
+        page = 0
+        while True:
+            if page:
+                await asyncio.sleep(self._spacing)
+            self.requests += 1
+            result = await resource.list_jobs(
+                page=page, page_size=self._page_size, sort_by="createdTime", sort_order="desc"
+            )
+            for job in result.data or []:
+                if job.job_id in job_ids:
+                    found[job.job_id] = job
+            budget -= len(result.data or [])
+            if len(found) == len(job_ids) or budget <= 0 or not result.has_next or not result.data:
+                return found
+            page += 1
+
+    def _take_batch(self, first: _Entry, now: float) -> list[_Entry]:
+        """Pop the jobs to check together with ``first``, or return ``first`` alone.
+
+        The batch gathers the listed jobs of the same kind that are at least
+        halfway to their next poll, if there are ``batch_threshold`` of them.
+        """
+        if not first.listed:
+            return [first]
+        batch = [
+            entry
+            for entry in self._schedule
+            if entry.listed and entry.kind == first.kind and entry.due - entry.interval / 2 <= now
+        ]
+        if len(batch) + 1 < self._batch_threshold:
+            return [first]
+        taken = {id(entry) for entry in batch}
+        self._schedule = [entry for entry in self._schedule if id(entry) not in taken]
+        heapq.heapify(self._schedule)
+        return [first, *batch]
+
+    def _settle(self, entry: _Entry, job: Job) -> None:
+        """Complete or reschedule a job from its polled status."""
+        entry.failures = 0
+        if job.status in TERMINAL_JOB_STATUSES:
+            self._complete(entry, job=job)
+        else:
+            self._reschedule(entry, self._next_interval(entry))
+
+    def _fail(self, entry: _Entry, error: Exception) -> None:
+        """Retry a job after a transient error, or complete it with the error."""
+        if isinstance(error, (APIError, httpx.TransportError)):
+            entry.failures += 1
+            if entry.failures <= self._max_failures:
+                self._reschedule(entry, self._error_backoff.delay(entry.failures - 1))
+                return
+        # Anything else (e.g. a payload the models reject) would end the task silently
+        # and leave the job tracked forever; report it on the job instead.
+        self._complete(entry, error=error)
+
+    async def _get_job(self, entry: _Entry) -> Job:
+        if entry.kind == "extraction":
+            return await self._client.extraction.get_job(entry.job_id)
+        return await self._client.qa.get_job(entry.job_id)
+
+    def _next_interval(self, entry: _Entry) -> float:
+        """Delay before the next poll, based on the job age and expected duration."""
+        age = asyncio.get_running_loop().time() - entry.added
+        remaining = entry.expected_duration - age
+        # Poll halfway to the expected end; overdue jobs back off in proportion to how late they are.
+        interval = remaining / 2 if remaining > 0 else -remaining / 4
+        return min(max(interval, self._min_interval), self._max_interval)
+
+    def _reschedule(self, entry: _Entry, delay: float) -> None:
+        entry.due = asyncio.get_running_loop().time() + delay
+        entry.interval = delay
+        entry.seq = next(self._seq)
+        heapq.heappush(self._schedule, entry)
+
+    def _complete(
+        self,
+        entry: _Entry,
+        job: Job | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self._tracked.discard(entry.job_id)
+        self._completed.put_nowait(
+            JobCompletion(job_id=entry.job_id, kind=entry.kind, job=job, error=error, polls=entry.polls)
+        )
@@ -0,0 +1,282 @@
+"""Concurrent upload of many local files into a provider."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+
+from biolevate.exceptions import BiolevateError, NotFoundError
+
+if TYPE_CHECKING:
+    from biolevate.client import BiolevateClient
+    from biolevate.models import ProviderItem
+
+UploadSource = str | os.PathLike[str] | tuple[str | os.PathLike[str], str]
+"""A local path, or a ``(path, key)`` pair giving the destination key explicitly."""
+
+
+@dataclass
+class UploadResult:
+    """Outcome of the upload of a single file.
+
+    Attributes:
+        path: The local file.
+        key: The destination key in the provider.
+        size: Size of the local file in bytes.
+        item: The created provider item, if the upload succeeded.
+        error: The error that made the upload fail, if any.
+        skipped: Whether the file was skipped because the key already exists.
+        duration: Time spent uploading the file, in seconds.
+    """
+
+    path: Path
+    key: str
+    size: int
+    item: ProviderItem | None = None
+    error: BiolevateError | OSError | httpx.TransportError | None = None
+    skipped: bool = False
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the file was uploaded."""
+        return self.item is not None
+
+
+@dataclass
+class UploadProgress:
+    """Aggregate progress of a bulk upload.
+
+    Attributes:
+        uploaded: Number of files uploaded.
+        skipped: Number of files skipped because their key already exists.
+        failed: Number of files that could not be uploaded.
+        bytes_uploaded: Total size of the uploaded files, in bytes.
+        elapsed: Seconds since the upload started.
+    """
+
+    uploaded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    bytes_uploaded: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def completed(self) -> int:
+        """Number of files processed so far, whatever their outcome."""
+        return self.uploaded + self.skipped + self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Average upload rate since the start, in bytes per second."""
+        return self.bytes_uploaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class BulkUploader:
+    """Upload many local files into a provider through a bounded worker pool.
+
+    Each file goes through ``ProviderItemsResource.upload_direct``, so it is
+    streamed straight to storage when the provider supports presigned
+    uploads and proxied through the API otherwise. Keys already present in
+    the provider with the same size are skipped, and a failing file is
+    reported without stopping the others.
+
+    Example:
+        ```python
+        uploader = BulkUploader(client, provider_id, concurrency=16)
+        async for result in uploader.upload_directory("./papers", prefix="papers/"):
+            if result.error:
+                print("failed", result.path, result.error)
+        print(uploader.progress.throughput)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: BiolevateClient,
+        provider_id: str,
+        concurrency: int = 8,
+        skip_existing: bool = True,
+        on_progress: Callable[[UploadResult, UploadProgress], None] | None = None,
+    ) -> None:
+        """Initialize the uploader.
+
+        Args:
+            client: The Biolevate client used to upload files.
+            provider_id: The provider receiving the files.
+            concurrency: Maximum number of files uploaded at the same time.
+            skip_existing: Whether to skip files whose key already exists in
+                the provider with the same size.
+            on_progress: Called after each file with its result and the
+                aggregate progress.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self._provider_id = provider_id
+        self._concurrency = concurrency
+        self._skip_existing = skip_existing
+        self._on_progress = on_progress
+        self._started: float | None = None
+        self.progress = UploadProgress()
+        """Aggregate progress of the uploads run by this uploader."""
+
+    async def upload_directory(
+        self,
+        directory: str | os.PathLike[str],
+        prefix: str = "",
+        pattern: str = "*",
+    ) -> AsyncIterator[UploadResult]:
+        """Upload every file below a local directory, keeping its layout.
+
+        Args:
+            directory: The local directory to walk recursively.
+            prefix: Folder key under which the files are created (e.g. 'papers/').
+            pattern: Glob pattern that file names must match.
+
+        Yields:
+            One ``UploadResult`` per file, in completion order.
+        """
+        root = Path(directory)
+        prefix = _folder_key(prefix)
+        sources = ((path, prefix + path.relative_to(root).as_posix()) for path in _walk(root, pattern))
+        async for result in self._run(sources, tree=prefix):
+            yield result
+
+    async def upload_files(self, files: Iterable[UploadSource], prefix: str = "") -> AsyncIterator[UploadResult]:
+        """Upload the given files.
+
+        Existing keys are looked up in the folders receiving the files only,
+        each listed without its sub-folders the first time a file targets it.
+
+        Args:
+            files: Local paths, uploaded under ``prefix`` with their file name,
+                or ``(path, key)`` pairs giving the destination key explicitly.
+            prefix: Folder key under which bare paths are created.
+
+        Yields:
+            One ``UploadResult`` per file, in completion order.
+        """
+        prefix = _folder_key(prefix)
+        async for result in self._run(_sources(files, prefix)):
+            yield result
+
+    async def _run(self, sources: Iterator[tuple[Path, str]], tree: str | None = None) -> AsyncIterator[UploadResult]:
+        """Upload sources, looking existing keys up in ``tree`` recursively, or else in the parent folder of each key."""
+        if self._started is None:
+            self._started = asyncio.get_running_loop().time()
+
+        listings: dict[str, asyncio.Task[dict[str, int | None]]] = {}
+
+        async def existing(key: str) -> dict[str, int | None]:
+            if not self._skip_existing:
+                return {}
+            folder = tree if tree is not None else _folder_key(key.rpartition("/")[0])
+            listing = listings.get(folder)
+            if listing is None:
+                listing = listings[folder] = asyncio.create_task(
+                    self._existing_sizes(folder, recursive=tree is not None)
+                )
+            return await asyncio.shield(listing)
+
+        results: asyncio.Queue[UploadResult | None] = asyncio.Queue()
+
+        async def work() -> None:
+            # Workers share the lazy source iterator, so at most `concurrency` files are in progress.
+            try:
+                for path, key in sources:
+                    await results.put(await self._upload_one(path, key, await existing(key)))
+            finally:
+                await results.put(None)
+
+        tasks = [asyncio.create_task(work()) for _ in range(self._concurrency)]
+        try:
+            remaining = self._concurrency
+            while remaining:
+                result = await results.get()
+                if result is None:
+                    remaining -= 1
+                    continue
+                self._record(result)
+                yield result
+            await asyncio.gather(*tasks)
+        finally:
+            for task in [*tasks, *listings.values()]:
+                task.cancel()
+            await asyncio.gather(*tasks, *listings.values(), return_exceptions=True)
+
+    async def _existing_sizes(self, folder: str, recursive: bool) -> dict[str, int | None]:
+        """Map the keys of the files already stored in ``folder`` to their size."""
+        existing: dict[str, int | None] = {}
+        try:
+            async for item in self._client.items.iter(
+                self._provider_id, key=folder or "/", recursive=recursive, concurrency=self._concurrency
+            ):
+                if item.type != "FOLDER" and item.key:
+                    existing[item.key] = item.size
+        except NotFoundError:
+            pass
+        return existing
+
+    async def _upload_one(self, path: Path, key: str, existing: dict[str, int | None]) -> UploadResult:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            size = (await asyncio.to_thread(path.stat)).st_size
+        except OSError as e:
+            return UploadResult(path=path, key=key, size=0, error=e)
+
+        if key in existing and existing[key] in (None, size):
+            return UploadResult(path=path, key=key, size=size, skipped=True)
+
+        try:
+            item = await self._client.items.upload_direct(self._provider_id, key, path)
+        except (BiolevateError, OSError, httpx.TransportError) as e:
+            return UploadResult(path=path, key=key, size=size, error=e, duration=loop.time() - started)
+        return UploadResult(path=path, key=key, size=size, item=item, duration=loop.time() - started)
+
+    def _record(self, result: UploadResult) -> None:
+        progress = self.progress
+        if result.skipped:
+            progress.skipped += 1
+        elif result.error is not None:
+            progress.failed += 1
+        else:
+            progress.uploaded += 1
+            progress.bytes_uploaded += result.size
+        if self._started is not None:
+            progress.elapsed = asyncio.get_running_loop().time() - self._started
+        if self._on_progress is not None:
+            self._on_progress(result, progress)
+
+
+def _folder_key(prefix: str) -> str:
+    """Normalize a folder key to either '' (root) or 'a/b/'."""
+    prefix = prefix.strip("/")
+    return f"{prefix}/" if prefix else ""
+
+
+def _sources(files: Iterable[UploadSource], prefix: str) -> Iterator[tuple[Path, str]]:
+    """Pair each source with its destination key, lazily."""
+    for source in files:
+        if isinstance(source, tuple):
+            yield Path(source[0]), source[1]
+        else:
+            path = Path(source)
+            yield path, prefix + path.name
+
+
+def _walk(root: Path, pattern: str) -> Iterator[Path]:
+    """Yield the files below ``root`` whose name matches ``pattern``, lazily."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = Path(dirpath, name)
+            if path.match(pattern):
+                yield path
@@ -0,0 +1,219 @@
+"""Client-side rate limiting and adaptive concurrency for API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import re
+import time
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+
+ENDPOINT_GROUPS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("jobs", re.compile(r"/api/core/(extraction|qa)/")),
+    ("items", re.compile(r"/api/core/providers/[^/]+/items")),
+    ("files", re.compile(r"/api/core/(files|collections)")),
+    ("providers", re.compile(r"/api/core/providers")),
+)
+"""Endpoint groups rate limits can be configured for, matched on the URL path in order."""
+
+DEFAULT_GROUP = "default"
+"""Group of the requests that match no other endpoint group."""
+
+
+def endpoint_group(url: str) -> str:
+    """Return the endpoint group of a request URL."""
+    for group, pattern in ENDPOINT_GROUPS:
+        if pattern.search(url):
+            return group
+    return DEFAULT_GROUP
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Sustained request rate with an allowance for bursts.
+
+    Attributes:
+        rate: Requests per second allowed on average.
+        burst: Requests that may be sent at once after an idle period
+            (default: one second worth of requests).
+    """
+
+    rate: float
+    burst: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+
+
+class TokenBucket:
+    """Token bucket enforcing a :class:`RateLimit`."""
+
+    def __init__(self, limit: RateLimit) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            limit: The rate to enforce.
+        """
+        self.rate = limit.rate
+        self.capacity = float(limit.burst if limit.burst is not None else max(1, round(limit.rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for it if the bucket is empty.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Per endpoint group token buckets, shareable between clients.
+
+    Passing the same limiter to several clients makes them share one budget,
+    e.g. to keep all the workers of a process under the tenant quota.
+
+    Example:
+        ```python
+        limiter = RateLimiter({"jobs": 5, "items": 20, "default": 50})
+        client = BiolevateClient(base_url=..., token=..., rate_limit=limiter)
+        ```
+    """
+
+    def __init__(self, limits: float | RateLimit | Mapping[str, float | RateLimit]) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limits: A limit applied to every request, or limits by endpoint
+                group (``"jobs"``, ``"items"``, ``"files"``, ``"providers"``,
+                ``"default"``). Groups without a limit, and the ``"default"``
+                group when not given, are not limited.
+        """
+        if not isinstance(limits, Mapping):
+            limits = {DEFAULT_GROUP: limits}
+            self._shared = True
+        else:
+            self._shared = False
+        self._buckets = {
+            group: TokenBucket(limit if isinstance(limit, RateLimit) else RateLimit(rate=limit))
+            for group, limit in limits.items()
+        }
+
+    def bucket(self, url: str) -> TokenBucket | None:
+        """Return the bucket that limits requests to a URL, if any."""
+        if self._shared:
+            return self._buckets[DEFAULT_GROUP]
+        return self._buckets.get(endpoint_group(url)) or self._buckets.get(DEFAULT_GROUP)
+
+    async def acquire(self, url: str) -> float:
+        """Wait until a request to the URL is allowed.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        bucket = self.bucket(url)
+        return 0.0 if bucket is None else await bucket.acquire()
+
+
+class AdaptiveConcurrency:
+    """AIMD controller of the number of requests in flight.
+
+    The limit grows by ``increase`` after each window of ``limit`` requests
+    completed without throttling, and is multiplied by ``decrease`` when the
+    server throttles (429/503) or when latency rises above
+    ``latency_tolerance`` times the best latency seen recently. It therefore
+    settles near the highest concurrency the server sustains without
+    queueing, instead of a hand-picked pool size.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase: int = 1,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            initial: Starting number of requests allowed in flight.
+            minimum: Lower bound of the limit.
+            maximum: Upper bound of the limit.
+            increase: Amount added to the limit after a healthy window.
+            decrease: Factor applied to the limit on congestion.
+            latency_tolerance: Latency, relative to the baseline, above which
+                a response counts as a congestion signal.
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("expected 1 <= minimum <= initial <= maximum")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self._baseline: float | None = None
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the in-flight slots for the duration of a request."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def record(self, latency: float, status: int | None) -> None:
+        """Feed the outcome of a request to the controller.
+
+        Args:
+            latency: Duration of the request in seconds.
+            status: Response status, or None if the request failed without one.
+        """
+        # Requests failing without a response (timeouts, resets) are overload signals too.
+        throttled = status is None or status in (429, 503)
+        if not throttled:
+            # The baseline follows the best latency, slowly forgetting it so it adapts to load changes.
+            self._baseline = latency if self._baseline is None else min(latency, self._baseline * 1.05)
+        congested = throttled or (self._baseline is not None and latency > self._baseline * self.latency_tolerance)
+
+        if congested:
+            now = time.monotonic()
+            # Decrease at most once per baseline round trip, so a burst of slow responses counts once.
+            if now - self._last_decrease >= (self._baseline or 0.0):
+                self.limit = max(float(self.minimum), self.limit * self.decrease)
+                self._last_decrease = now
+            self._successes = 0
+            return
+
+        self._successes += 1
+        if self._successes >= int(self.limit):
+            self.limit = min(float(self.maximum), self.limit + self.increase)
+            self._successes = 0
@@ -0,0 +1,180 @@
+"""Lightweight list results projected straight from the response JSON.
+
+The list methods of the files, provider items and collections resources
+accept ``raw=True`` to return the items as the dicts parsed from the
+response, and ``fields=[...]`` to return compact records holding only the
+given fields. Both skip the construction of the pydantic models, which
+dominates the CPU and memory cost of large listings.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from collections import namedtuple
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+
+Projector = Callable[[dict[str, Any]], Any]
+
+
+@dataclass(slots=True)
+class RawPage:
+    """Page of a page-numbered list endpoint, with raw items.
+
+    Attributes:
+        data: The items, as dicts or records (see the ``fields`` argument of
+            the list methods).
+        total_pages: Total number of pages.
+        total_elements: Total number of items.
+        has_next: Whether there is a next page.
+    """
+
+    data: list[Any]
+    total_pages: int | None = None
+    total_elements: int | None = None
+    has_next: bool | None = None
+
+    @classmethod
+    def from_json(cls, page: dict[str, Any], project: Projector | None = None) -> RawPage:
+        """Build a page from its parsed JSON, projecting each item."""
+        data = page.get("data") or []
+        return cls(
+            data=data if project is None else [project(item) for item in data],
+            total_pages=page.get("totalPages"),
+            total_elements=page.get("totalElements"),
+            has_next=page.get("hasNext"),
+        )
+
+
+@dataclass(slots=True)
+class RawItemsPage:
+    """Page of a provider directory listing, with raw items.
+
+    Attributes:
+        items: The items, as dicts or records (see the ``fields`` argument
+            of :meth:`ProviderItemsResource.list`).
+        next_cursor: Cursor of the next page, None on the last page.
+    """
+
+    items: list[Any]
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_json(cls, page: dict[str, Any], project: Projector | None = None) -> RawItemsPage:
+        """Build a page from its parsed JSON, projecting each item."""
+        items = page.get("items") or []
+        return cls(
+            items=items if project is None else [project(item) for item in items],
+            next_cursor=page.get("nextCursor"),
+        )
+
+
+def projector(model: str, fields: Sequence[str] | None) -> Projector | None:
+    """Return the projection of the JSON items of a model on some of its fields.
+
+    Fields are named like the model attributes, with dots for nested
+    models (e.g. ``"last_indexation_infos.status"``); the JSON names
+    (``"lastIndexationInfos.status"``) are accepted as well. Each item is
+    projected on a record: a named tuple whose attributes are the fields,
+    with dots replaced by underscores (``record.last_indexation_infos_status``).
+    Missing values are None.
+
+    Args:
+        model: Name of the generated model of the items (e.g. ``"EliseFileInfo"``).
+        fields: The fields to keep, or None to keep the items as parsed.
+
+    Returns:
+        The projection, or None when ``fields`` is None.
+
+    Raises:
+        ValueError: If a field is not a field of the model.
+    """
+    if fields is None:
+        return None
+    return _projector(model, tuple(fields))
+
+
+@functools.cache
+def _projector(model: str, fields: tuple[str, ...]) -> Projector:
+    import biolevate_client.models
+
+    getters = [_getter(_json_path(getattr(biolevate_client.models, model), field)) for field in fields]
+    record = namedtuple(f"{model}Record", [field.replace(".", "_") for field in fields])  # type: ignore[misc]
+    new = tuple.__new__
+
+    def project(item: dict[str, Any]) -> Any:
+        return new(record, [get(item) for get in getters])
+
+    return project
+
+
+def _getter(path: tuple[str, ...]) -> Callable[[dict[str, Any]], Any]:
+    """Return a function reading the value at a path of JSON keys, or None if absent."""
+    key, *nested = path
+    if not nested:
+        return lambda item: item.get(key)
+
+    def get(item: dict[str, Any]) -> Any:
+        value: Any = item.get(key)
+        for part in nested:
+            value = value.get(part) if isinstance(value, dict) else None
+        return value
+
+    return get
+
+
+def _json_path(model: Any, field: str) -> tuple[str, ...]:
+    """Return the JSON keys leading to a dotted field of a model."""
+    from biolevate._decoders import models_in
+
+    path = []
+    for part in field.split("."):
+        if model is None:
+            raise ValueError(f"Unknown field '{field}': '{path[-1]}' is not a model")
+        for name, info in model.model_fields.items():
+            alias = info.alias or name
+            if part in (name, alias):
+                path.append(alias)
+                nested = models_in(info.annotation)
+                model = nested[0] if nested else None
+                break
+        else:
+            raise ValueError(f"Unknown field '{field}' of {model.__name__}")
+    return tuple(path)
+
+
+async def read_json(response: httpx.Response) -> Any:
+    """Read and parse the JSON body of a response returned without preloading.
+
+    Raises:
+        ApiException: The exception of the generated client matching the
+            status of an error response, as its regular methods raise it.
+    """
+    body = await response.aread()
+    if not 200 <= response.status_code <= 299:
+        raise_for_status(response, body)
+    return json.loads(body)
+
+
+def raise_for_status(response: httpx.Response, body: bytes) -> None:
+    """Raise the exception of the generated client matching an error response.
+
+    Args:
+        response: The error response, returned without preloading.
+        body: Its body, already read.
+
+    Raises:
+        ApiException: The exception matching the status, as the regular
+            methods of the generated client raise it.
+    """
+    from biolevate_client.exceptions import ApiException
+    from biolevate_client.rest import RESTResponse
+
+    error = RESTResponse(response)
+    error.data = body
+    raise ApiException.from_response(http_resp=error, body=body.decode(errors="replace"), data=None)
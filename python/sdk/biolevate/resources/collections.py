@@ -4,10 +4,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from biolevate._pagination import iterate_pages
 from biolevate.exceptions import APIError, AuthenticationError, NotFoundError
+from biolevate.raw import RawPage, projector, read_json
 
 if TYPE_CHECKING:
-    from biolevate.models import Collection, CollectionPage, FilePage
+    from collections.abc import AsyncIterator, Sequence
+
+    from biolevate.cache import MetadataCache
+    from biolevate.models import Collection, CollectionPage, File, FilePage
     from biolevate_client import ApiClient
 
 
@@ -18,13 +23,15 @@ class CollectionsResource:
     for extraction or question answering jobs.
     """
 
-    def __init__(self, client: ApiClient) -> None:
+    def __init__(self, client: ApiClient, cache: MetadataCache | None = None) -> None:
         """Initialize the collections resource.
 
         Args:
             client: The API client.
+            cache: Cache of the collections, if enabled on the client.
         """
         self._client = client
+        self._cache = cache
 
     async def list(
         self,
@@ -33,7 +40,9 @@ class CollectionsResource:
         sort_by: str | None = None,
         sort_order: str = "asc",
         query: str | None = None,
-    ) -> CollectionPage:
+        raw: bool = False,
+        fields: Sequence[str] | None = None,
+    ) -> CollectionPage | RawPage:
         """List collections with pagination.  Pagination is 0-based.
 
         Args:
@@ -42,13 +51,18 @@ class CollectionsResource:
             sort_by: Field to sort by.
             sort_order: Sort direction ('asc' or 'desc').
             query: Text search filter.
+            raw: Whether to return the collections as the dicts parsed from the
+                response, without building models.
+            fields: Fields to keep from each collection, returned as records
+                instead of models (see :func:`biolevate.raw.projector`).
 
         Returns:
-            Paginated list of collections.
+            Paginated list of collections, as a ``RawPage`` with ``raw`` or ``fields``.
 
         Raises:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
+            ValueError: If a field is not a field of the collections.
         """
         from biolevate_client.api.collections_api import CollectionsApi
         from biolevate_client.exceptions import (
@@ -58,8 +72,18 @@ class CollectionsResource:
         )
 
         api = CollectionsApi(self._client)
+        project = projector("EliseCollectionInfo", fields)
 
         try:
+            if raw or fields is not None:
+                response = await api.list_collections_without_preload_content(
+                    page=page,
+                    page_size=page_size,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    q=query,
+                )
+                return RawPage.from_json(await read_json(response), project)
             return await api.list_collections(
                 page=page,
                 page_size=page_size,
@@ -74,6 +98,51 @@ class CollectionsResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+    async def iter(
+        self,
+        page_size: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        query: str | None = None,
+        concurrency: int = 2,
+        raw: bool = False,
+        fields: Sequence[str] | None = None,
+    ) -> AsyncIterator[Collection]:
+        """Iterate over all collections, fetching pages lazily.
+
+        Args:
+            page_size: Number of items requested per page.
+            sort_by: Field to sort by.
+            sort_order: Sort direction ('asc' or 'desc').
+            query: Text search filter.
+            concurrency: Maximum number of pages fetched ahead of the consumer.
+            raw: Whether to return the collections as the dicts parsed from the
+                response, without building models.
+            fields: Fields to keep from each collection, returned as records
+                instead of models (see :func:`biolevate.raw.projector`).
+
+        Yields:
+            Each collection, in page order (a dict or record with ``raw`` or ``fields``).
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            APIError: If the API returns an unexpected error.
+            ValueError: If a field is not a field of the collections.
+        """
+        async for collection in iterate_pages(
+            lambda page: self.list(
+                page=page,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                query=query,
+                raw=raw,
+                fields=fields,
+            ),
+            concurrency=concurrency,
+        ):
+            yield collection
+
     async def create(
         self,
         name: str,
@@ -130,6 +199,9 @@ class CollectionsResource:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
         """
+        if self._cache is not None and (cached := self._cache.get("collections", collection_id)) is not None:
+            return cached
+
         from biolevate_client.api.collections_api import CollectionsApi
         from biolevate_client.exceptions import (
             ApiException,
@@ -141,7 +213,7 @@ class CollectionsResource:
         api = CollectionsApi(self._client)
 
         try:
-            return await api.get_collection(id=collection_id)
+            collection = await api.get_collection(id=collection_id)
         except NotFoundException as e:
             raise NotFoundError(f"Collection '{collection_id}' not found") from e
         except UnauthorizedException as e:
@@ -151,6 +223,10 @@ class CollectionsResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+        if self._cache is not None:
+            self._cache.set("collections", collection_id, collection)
+        return collection
+
     async def update(
         self,
         collection_id: str,
@@ -184,7 +260,7 @@ class CollectionsResource:
         api = CollectionsApi(self._client)
 
         try:
-            return await api.update_collection(
+            collection = await api.update_collection(
                 id=collection_id,
                 update_collection_request=UpdateCollectionRequest(
                     name=name,
@@ -200,6 +276,10 @@ class CollectionsResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+        if self._cache is not None:
+            self._cache.invalidate("collections", collection_id)
+        return collection
+
     async def delete(self, collection_id: str) -> None:
         """Delete a collection.
 
@@ -232,6 +312,9 @@ class CollectionsResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+        if self._cache is not None:
+            self._cache.invalidate("collections", collection_id)
+
     async def list_files(
         self,
         collection_id: str,
@@ -239,7 +322,9 @@ class CollectionsResource:
         page_size: int = 20,
         sort_by: str | None = None,
         sort_order: str = "asc",
-    ) -> FilePage:
+        raw: bool = False,
+        fields: Sequence[str] | None = None,
+    ) -> FilePage | RawPage:
         """List files in a collection.
 
         Args:
@@ -248,14 +333,19 @@ class CollectionsResource:
             page_size: Number of items per page.
             sort_by: Field to sort by.
             sort_order: Sort direction ('asc' or 'desc').
+            raw: Whether to return the files as the dicts parsed from the
+                response, without building models.
+            fields: Fields to keep from each file, returned as records
+                instead of models (see :func:`biolevate.raw.projector`).
 
         Returns:
-            Paginated list of files in the collection.
+            Paginated list of files in the collection, as a ``RawPage`` with ``raw`` or ``fields``.
 
         Raises:
             NotFoundError: If the collection is not found.
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
+            ValueError: If a field is not a field of the files.
         """
         from biolevate_client.api.collections_api import CollectionsApi
         from biolevate_client.exceptions import (
@@ -266,8 +356,18 @@ class CollectionsResource:
         )
 
         api = CollectionsApi(self._client)
+        project = projector("EliseFileInfo", fields)
 
         try:
+            if raw or fields is not None:
+                response = await api.list_collection_files_without_preload_content(
+                    id=collection_id,
+                    page=page,
+                    page_size=page_size,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                )
+                return RawPage.from_json(await read_json(response), project)
             return await api.list_collection_files(
                 id=collection_id,
                 page=page,
@@ -284,6 +384,52 @@ class CollectionsResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+    async def iter_files(
+        self,
+        collection_id: str,
+        page_size: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        concurrency: int = 2,
+        raw: bool = False,
+        fields: Sequence[str] | None = None,
+    ) -> AsyncIterator[File]:
+        """Iterate over all files in a collection, fetching pages lazily.
+
+        Args:
+            collection_id: The unique identifier of the collection.
+            page_size: Number of items requested per page.
+            sort_by: Field to sort by.
+            sort_order: Sort direction ('asc' or 'desc').
+            concurrency: Maximum number of pages fetched ahead of the consumer.
+            raw: Whether to return the files as the dicts parsed from the
+                response, without building models.
+            fields: Fields to keep from each file, returned as records
+                instead of models (see :func:`biolevate.raw.projector`).
+
+        Yields:
+            Each file in the collection, in page order (a dict or record with ``raw`` or ``fields``).
+
+        Raises:
+            NotFoundError: If the collection is not found.
+            AuthenticationError: If authentication fails.
+            APIError: If the API returns an unexpected error.
+            ValueError: If a field is not a field of the files.
+        """
+        async for file in iterate_pages(
+            lambda page: self.list_files(
+                collection_id=collection_id,
+                page=page,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                raw=raw,
+                fields=fields,
+            ),
+            concurrency=concurrency,
+        ):
+            yield file
+
     async def add_file(
         self,
         collection_id: str,
@@ -327,6 +473,9 @@ class CollectionsResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+        if self._cache is not None:
+            self._cache.invalidate("collections", collection_id)
+
     async def remove_file(
         self,
         collection_id: str,
@@ -366,3 +515,6 @@ class CollectionsResource:
             raise AuthenticationError("Access denied") from e
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
+
+        if self._cache is not None:
+            self._cache.invalidate("collections", collection_id)
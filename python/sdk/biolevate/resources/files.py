@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from typing import TYPE_CHECKING
 
+from biolevate._backoff import Backoff
+from biolevate._pagination import iterate_pages
 from biolevate.exceptions import APIError, AuthenticationError, NotFoundError
+from biolevate.indexation import IndexationResult, indexation_error, indexation_state
+from biolevate.raw import RawPage, projector, read_json
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Sequence
+
+    from biolevate.cache import MetadataCache
     from biolevate.models import File, FilePage, Ontology
     from biolevate_client import ApiClient
 
@@ -18,13 +27,15 @@ class FilesResource:
     as well as manage indexation and ontologies.
     """
 
-    def __init__(self, client: ApiClient) -> None:
+    def __init__(self, client: ApiClient, cache: MetadataCache | None = None) -> None:
         """Initialize the files resource.
 
         Args:
             client: The API client.
+            cache: Cache of the files, if enabled on the client.
         """
         self._client = client
+        self._cache = cache
 
     async def list(
         self,
@@ -33,7 +44,9 @@ class FilesResource:
         page_size: int = 20,
         sort_property: str | None = None,
         sort_order: str | None = None,
-    ) -> FilePage:
+        raw: bool = False,
+        fields: Sequence[str] | None = None,
+    ) -> FilePage | RawPage:
         """List indexed files with pagination.
 
         Args:
@@ -42,13 +55,19 @@ class FilesResource:
             page_size: Number of items per page.
             sort_property: Field to sort by.
             sort_order: Sort direction ('asc' or 'desc').
+            raw: Whether to return the files as the dicts parsed from the
+                response, without building models.
+            fields: Fields to keep from each file, returned as records
+                instead of models (see :func:`biolevate.raw.projector`), e.g.
+                ``["id", "name", "last_indexation_infos.status"]``.
 
         Returns:
-            Paginated list of files.
+            Paginated list of files, as a ``RawPage`` with ``raw`` or ``fields``.
 
         Raises:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
+            ValueError: If a field is not a field of the files.
         """
         from biolevate_client.api.files_api import FilesApi
         from biolevate_client.exceptions import (
@@ -58,8 +77,18 @@ class FilesResource:
         )
 
         api = FilesApi(self._client)
+        project = projector("EliseFileInfo", fields)
 
         try:
+            if raw or fields is not None:
+                response = await api.list_files_without_preload_content(
+                    provider_id=provider_id,
+                    page=page,
+                    page_size=page_size,
+                    sort_property=sort_property,
+                    sort_order=sort_order,
+                )
+                return RawPage.from_json(await read_json(response), project)
             return await api.list_files(
                 provider_id=provider_id,
                 page=page,
@@ -74,6 +103,52 @@ class FilesResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+    async def iter(
+        self,
+        provider_id: str,
+        page_size: int = 100,
+        sort_property: str | None = None,
+        sort_order: str | None = None,
+        concurrency: int = 2,
+        raw: bool = False,
+        fields: Sequence[str] | None = None,
+    ) -> AsyncIterator[File]:
+        """Iterate over all indexed files of a provider, fetching pages lazily.
+
+        Args:
+            provider_id: The provider ID to list files for.
+            page_size: Number of items requested per page.
+            sort_property: Field to sort by.
+            sort_order: Sort direction ('asc' or 'desc').
+            concurrency: Maximum number of pages fetched ahead of the consumer.
+            raw: Whether to return the files as the dicts parsed from the
+                response, without building models.
+            fields: Fields to keep from each file, returned as records
+                instead of models (see :func:`biolevate.raw.projector`), e.g.
+                ``["id", "name", "last_indexation_infos.status"]``.
+
+        Yields:
+            Each file, in page order (a dict or record with ``raw`` or ``fields``).
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            APIError: If the API returns an unexpected error.
+            ValueError: If a field is not a field of the files.
+        """
+        async for file in iterate_pages(
+            lambda page: self.list(
+                provider_id=provider_id,
+                page=page,
+                page_size=page_size,
+                sort_property=sort_property,
+                sort_order=sort_order,
+                raw=raw,
+                fields=fields,
+            ),
+            concurrency=concurrency,
+        ):
+            yield file
+
     async def create(
         self,
         provider_id: str,
@@ -140,6 +215,12 @@ class FilesResource:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
         """
+        if self._cache is not None and (cached := self._cache.get("files", file_id)) is not None:
+            return cached
+        return await self._fetch(file_id)
+
+    async def _fetch(self, file_id: str) -> File:
+        """Get a file from the API, bypassing the cache, and cache it."""
         from biolevate_client.api.files_api import FilesApi
         from biolevate_client.exceptions import (
             ApiException,
@@ -151,8 +232,10 @@ class FilesResource:
         api = FilesApi(self._client)
 
         try:
-            return await api.get_file(id=file_id)
+            file = await api.get_file(id=file_id)
         except NotFoundException as e:
+            if self._cache is not None:
+                self._cache.invalidate("files", file_id)
             raise NotFoundError(f"File '{file_id}' not found") from e
         except UnauthorizedException as e:
             raise AuthenticationError("Authentication failed") from e
@@ -161,6 +244,10 @@ class FilesResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+        if self._cache is not None:
+            self._cache.set("files", file_id, file)
+        return file
+
     async def delete(self, file_id: str) -> None:
         """Delete an indexed file.
 
@@ -193,6 +280,9 @@ class FilesResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+        if self._cache is not None:
+            self._cache.invalidate("files", file_id)
+
     async def reindex(self, file_id: str) -> None:
         """Trigger re-indexation of a file.
 
@@ -228,6 +318,111 @@ class FilesResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+        if self._cache is not None:
+            self._cache.invalidate("files", file_id)
+
+    async def wait_indexed(
+        self,
+        file_ids: Iterable[str],
+        provider_id: str | None = None,
+        timeout: float | None = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 15.0,
+        page_size: int = 100,
+        concurrency: int = 8,
+    ) -> IndexationResult:
+        """Wait until every given file is indexed or has failed to index.
+
+        When ``provider_id`` is given, each round checks the files through the
+        provider listing, most recent first, so hundreds of files cost a few
+        page requests instead of one request each. Files not found in the
+        first pages (e.g. old files being re-indexed) are checked one by one,
+        with at most ``concurrency`` requests in flight.
+
+        Args:
+            file_ids: IDs of the files to wait for.
+            provider_id: Provider holding the files, to check them in batches.
+            timeout: Maximum number of seconds to wait, or None to wait until
+                every file is settled.
+            poll_interval: Initial delay between two rounds of checks.
+            max_poll_interval: Upper bound for the delay between two rounds.
+            page_size: Number of files requested per listing page.
+            concurrency: Maximum number of single-file requests in flight.
+
+        Returns:
+            The ready and failed files, plus the files still pending if the
+            timeout expired.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            APIError: If the API returns an unexpected error.
+        """
+        backoff = Backoff(initial=poll_interval, maximum=max_poll_interval)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        result = IndexationResult(pending=set(file_ids))
+        semaphore = asyncio.Semaphore(concurrency)
+        attempt = 0
+
+        async def get(file_id: str) -> tuple[str, File | None]:
+            async with semaphore:
+                try:
+                    return file_id, await self._fetch(file_id)
+                except NotFoundError:
+                    return file_id, None
+
+        while result.pending:
+            found: dict[str, File | None] = {}
+            if provider_id is not None and len(result.pending) > 1:
+                found = await self._scan_recent(provider_id, result.pending, page_size)
+            missing = result.pending - found.keys()
+            found.update(await asyncio.gather(*(get(file_id) for file_id in missing)))
+
+            for file_id, file in found.items():
+                state = "failed" if file is None else indexation_state(file)
+                if state == "pending":
+                    continue
+                result.pending.discard(file_id)
+                if state == "ready":
+                    result.ready.add(file_id)
+                else:
+                    result.failed.add(file_id)
+                    result.errors[file_id] = "File not found" if file is None else indexation_error(file)
+
+            if not result.pending:
+                break
+            delay = backoff.delay(attempt)
+            attempt += 1
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+
+        return result
+
+    async def _scan_recent(self, provider_id: str, file_ids: set[str], page_size: int) -> dict[str, File | None]:
+        """Look for files in the most recent pages of the provider listing.
+
+        The scan stops once every file has been seen, or after twice as many
+        files as requested have been listed.
+        """
+        found: dict[str, File | None] = {}
+        budget = 2 * len(file_ids) + page_size
+        files = self.iter(provider_id, page_size=page_size, sort_property="createdTime", sort_order="desc")
+        async with contextlib.aclosing(files):
+            async for file in files:
+                file_id = str(file.id.id) if file.id and file.id.id else None
+                if file_id in file_ids:
+                    found[file_id] = file
+                    if len(found) == len(file_ids):
+                        break
+                budget -= 1
+                if budget <= 0:
+                    break
+        return found
+
     async def get_ontologies(self, file_id: str) -> list[Ontology]:  # type: ignore[valid-type]
         """Get computed ontologies for a file.
 
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+import mimetypes
+import os
+from collections import deque
 from http import HTTPStatus
+from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO
 
+from biolevate._transport import http_client
 from biolevate.exceptions import APIError, AuthenticationError, NotFoundError
+from biolevate.raw import RawItemsPage, projector, read_json
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    import httpx
+
+    from biolevate.cache import MetadataCache
     from biolevate.models import ListItemsResponse, ProviderItem
     from biolevate_client import ApiClient
     from biolevate_client.models import DownloadUrlResponse, UploadUrlResponse
@@ -19,32 +33,53 @@ class ProviderItemsResource:
     Provides methods to list, upload, download, rename, and delete items.
     """
 
-    def __init__(self, client: ApiClient) -> None:
+    def __init__(self, client: ApiClient, cache: MetadataCache | None = None) -> None:
         """Initialize the provider items resource.  Paths are relative to the provider root.
 
         Args:
             client: The API client.
+            cache: Cache of the files, if enabled on the client; renaming or
+                deleting items invalidates it.
         """
         self._client = client
+        self._cache = cache
 
     async def list(
         self,
         provider_id: str,
         key: str = "/",
-    ) -> ListItemsResponse:
-        """List items in a provider directory.
+        query: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        raw: bool = False,
+        fields: Sequence[str] | None = None,
+    ) -> ListItemsResponse | RawItemsPage:
+        """List one page of items in a provider directory.
+
+        Large directories are returned in several pages: pass the
+        ``next_cursor`` of a response as ``cursor`` to fetch the next one,
+        or use :meth:`iter` to follow cursors automatically.
 
         Args:
             provider_id: The provider ID.
-            path: Directory path to list (default: root).
+            key: Directory key to list (default: root).
+            query: Name filter.
+            cursor: Pagination cursor returned by a previous call.
+            limit: Maximum number of items to return.
+            raw: Whether to return the items as the dicts parsed from the
+                response, without building models.
+            fields: Fields to keep from each item, returned as records
+                instead of models (see :func:`biolevate.raw.projector`).
 
         Returns:
-            List of items in the directory.
+            Items of the directory page and the cursor of the next page, as
+            a ``RawItemsPage`` with ``raw`` or ``fields``.
 
         Raises:
             NotFoundError: If the provider or path is not found.
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
+            ValueError: If a field is not a field of the items.
         """
         from biolevate_client.api.provider_items_api import ProviderItemsApi
         from biolevate_client.exceptions import (
@@ -55,9 +90,25 @@ class ProviderItemsResource:
         )
 
         api = ProviderItemsApi(self._client)
+        project = projector("ProviderItem", fields)
 
         try:
-            return await api.list_items(provider_id=provider_id, key=key)
+            if raw or fields is not None:
+                response = await api.list_items_without_preload_content(
+                    provider_id=provider_id,
+                    key=key,
+                    q=query,
+                    cursor=cursor,
+                    limit=limit,
+                )
+                return RawItemsPage.from_json(await read_json(response), project)
+            return await api.list_items(
+                provider_id=provider_id,
+                key=key,
+                q=query,
+                cursor=cursor,
+                limit=limit,
+            )
         except NotFoundException as e:
             raise NotFoundError(f"Key not found: {key}") from e
         except UnauthorizedException as e:
@@ -67,6 +118,80 @@ class ProviderItemsResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+    async def iter(
+        self,
+        provider_id: str,
+        key: str = "/",
+        recursive: bool = False,
+        page_size: int | None = None,
+        concurrency: int = 4,
+        raw: bool = False,
+        fields: Sequence[str] | None = None,
+    ) -> AsyncIterator[ProviderItem]:
+        """Iterate over the items of a provider directory, following cursors.
+
+        Items are yielded as soon as their page arrives. With ``recursive``
+        enabled, every sub-folder is listed as well, with at most
+        ``concurrency`` listings in flight at any time; items of different
+        folders may then be interleaved.
+
+        Args:
+            provider_id: The provider ID.
+            key: Directory key to list (default: root).
+            recursive: Whether to descend into sub-folders.
+            page_size: Maximum number of items requested per page.
+            concurrency: Maximum number of concurrent listings.
+            raw: Whether to return the items as the dicts parsed from the
+                response, without building models.
+            fields: Fields to keep from each item, returned as records
+                instead of models (see :func:`biolevate.raw.projector`).
+
+        Yields:
+            Each file and folder item (a dict or record with ``raw`` or ``fields``).
+
+        Raises:
+            NotFoundError: If the provider or path is not found.
+            AuthenticationError: If authentication fails.
+            APIError: If the API returns an unexpected error.
+            ValueError: If ``concurrency`` is lower than 1, or a field is not
+                a field of the items.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        project = projector("ProviderItem", fields)
+
+        async def fetch(folder: str, cursor: str | None) -> tuple[str, ListItemsResponse | RawItemsPage]:
+            # Raw listings keep the parsed items, needed to find sub-folders, and project them when yielded.
+            return folder, await self.list(
+                provider_id, key=folder, cursor=cursor, limit=page_size, raw=raw or fields is not None
+            )
+
+        backlog: deque[tuple[str, str | None]] = deque([(key, None)])
+        running: set[asyncio.Future[tuple[str, ListItemsResponse | RawItemsPage]]] = set()
+        try:
+            while backlog or running:
+                while backlog and len(running) < concurrency:
+                    running.add(asyncio.ensure_future(fetch(*backlog.popleft())))
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    folder, response = future.result()
+                    if response.next_cursor:
+                        backlog.appendleft((folder, response.next_cursor))
+                    if isinstance(response, RawItemsPage):
+                        for item in response.items:
+                            if recursive and item.get("type") == "FOLDER" and item.get("key") not in (None, "", folder):
+                                backlog.append((item["key"], None))
+                            yield item if project is None else project(item)
+                        continue
+                    for item in response.items or []:
+                        if recursive and item.type == "FOLDER" and item.key and item.key != folder:
+                            backlog.append((item.key, None))
+                        yield item
+        finally:
+            for future in running:
+                future.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
     async def upload(
         self,
         provider_id: str,
@@ -92,35 +217,37 @@ class ProviderItemsResource:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
         """
-        import httpx
-
         from biolevate_client.models import ProviderItem as ProviderItemModel
 
-        config = self._client.configuration
-        base_url = config.host.rstrip("/")
-        headers = {"Authorization": f"Bearer {config.access_token}"}
-
-        async with httpx.AsyncClient() as http_client:
-            response = await http_client.post(
-                f"{base_url}/api/core/providers/{provider_id}/items",
-                params={"key": key},
-                files={"file": (file_name, file, mime_type)},
-                headers=headers,
-            )
+        method, url, headers, _, _ = self._client.param_serialize(
+            method="POST",
+            resource_path="/api/core/providers/{providerId}/items",
+            path_params={"providerId": provider_id},
+            query_params=[("key", key)],
+            header_params={"Accept": "application/json", "Content-Type": "multipart/form-data"},
+            auth_settings=["TOKEN"],
+        )
+        response = await self._client.call_api(
+            method,
+            url,
+            header_params=headers,
+            post_params=[("file", (file_name, file, mime_type))],
+        )
+        await response.read()
 
-        if response.status_code == HTTPStatus.UNAUTHORIZED:
+        if response.status == HTTPStatus.UNAUTHORIZED:
             raise AuthenticationError("Authentication failed")
 
-        if response.status_code == HTTPStatus.FORBIDDEN:
+        if response.status == HTTPStatus.FORBIDDEN:
             raise AuthenticationError("Access denied to provider")
 
-        if response.status_code == HTTPStatus.NOT_FOUND:
+        if response.status == HTTPStatus.NOT_FOUND:
             raise NotFoundError(f"Key not found: {key}")
 
-        if response.status_code != HTTPStatus.CREATED:
-            raise APIError(response.status_code, f"Failed to upload file: {response.text}")
+        if response.status != HTTPStatus.CREATED:
+            raise APIError(response.status, f"Failed to upload file: {response.data.decode(errors='replace')}")
 
-        result = ProviderItemModel.from_dict(response.json())
+        result = ProviderItemModel.from_dict(json.loads(response.data))
         if result is None:
             raise APIError(500, "Failed to parse upload response")
         return result
@@ -144,34 +271,32 @@ class ProviderItemsResource:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
         """
-        import httpx
-
         from biolevate_client.models import ProviderItem as ProviderItemModel
 
-        config = self._client.configuration
-        base_url = config.host.rstrip("/")
-        headers = {"Authorization": f"Bearer {config.access_token}"}
-
-        async with httpx.AsyncClient() as http_client:
-            response = await http_client.post(
-                f"{base_url}/api/core/providers/{provider_id}/items",
-                json={"key": key},
-                headers=headers,
-            )
+        method, url, headers, body, _ = self._client.param_serialize(
+            method="POST",
+            resource_path="/api/core/providers/{providerId}/items",
+            path_params={"providerId": provider_id},
+            header_params={"Accept": "application/json", "Content-Type": "application/json"},
+            body={"key": key},
+            auth_settings=["TOKEN"],
+        )
+        response = await self._client.call_api(method, url, header_params=headers, body=body)
+        await response.read()
 
-        if response.status_code == HTTPStatus.UNAUTHORIZED:
+        if response.status == HTTPStatus.UNAUTHORIZED:
             raise AuthenticationError("Authentication failed")
 
-        if response.status_code == HTTPStatus.FORBIDDEN:
+        if response.status == HTTPStatus.FORBIDDEN:
             raise AuthenticationError("Access denied to provider")
 
-        if response.status_code == HTTPStatus.NOT_FOUND:
+        if response.status == HTTPStatus.NOT_FOUND:
             raise NotFoundError(f"Key not found: {key}")
 
-        if response.status_code not in (HTTPStatus.OK, HTTPStatus.CREATED):
-            raise APIError(response.status_code, f"Failed to create folder: {response.text}")
+        if response.status not in (HTTPStatus.OK, HTTPStatus.CREATED):
+            raise APIError(response.status, f"Failed to create folder: {response.data.decode(errors='replace')}")
 
-        result = ProviderItemModel.from_dict(response.json())
+        result = ProviderItemModel.from_dict(json.loads(response.data))
         if result is None:
             raise APIError(500, "Failed to parse folder response")
         return result
@@ -209,7 +334,7 @@ class ProviderItemsResource:
         api = ProviderItemsApi(self._client)
 
         try:
-            return await api.rename_item(
+            item = await api.rename_item(
                 provider_id=provider_id,
                 new_name=new_name,
                 item_reference=ItemReference(
@@ -225,6 +350,9 @@ class ProviderItemsResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+        self._invalidate_files()
+        return item
+
     async def delete(
         self,
         provider_id: str,
@@ -270,6 +398,8 @@ class ProviderItemsResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+        self._invalidate_files()
+
     async def get_download_url(
         self,
         provider_id: str,
@@ -416,3 +546,255 @@ class ProviderItemsResource:
             raise AuthenticationError("Access denied to provider") from e
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
+
+    async def upload_direct(
+        self,
+        provider_id: str,
+        key: str,
+        source: str | os.PathLike[str] | BinaryIO,
+        media_type: str | None = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> ProviderItem:
+        """Upload a file straight to the provider storage through a presigned URL.
+
+        The file is streamed from disk in chunks of ``chunk_size`` bytes, so
+        it is never fully loaded in memory, and the bytes do not transit
+        through the Biolevate API. If the presigned URL is about to expire
+        before the transfer starts, a fresh one is requested, and a transfer
+        the storage rejects with ``403`` (e.g. because the URL expired while
+        waiting for a connection) is retried once with a fresh URL when the
+        source can be rewound. Providers that do not support presigned
+        uploads fall back to :meth:`upload`.
+
+        Args:
+            provider_id: The provider ID.
+            key: Full key of the file to create (e.g. 'reports/report.pdf').
+            source: Path of a local file, or a binary file-like object read
+                from its current position.
+            media_type: MIME type of the file (default: guessed from the key).
+            chunk_size: Number of bytes read and sent at a time.
+
+        Returns:
+            The created provider item.
+
+        Raises:
+            NotFoundError: If the provider or path is not found.
+            AuthenticationError: If authentication fails.
+            APIError: If the API or the storage returns an unexpected error.
+        """
+        media_type = media_type or mimetypes.guess_type(key)[0] or "application/octet-stream"
+
+        with contextlib.ExitStack() as stack:
+            if isinstance(source, (str, os.PathLike)):
+                stream: BinaryIO = stack.enter_context(open(source, "rb"))
+            else:
+                stream = source
+            size = _remaining_size(stream)
+
+            presigned = await self.get_upload_url(provider_id, key, size=size, media_type=media_type)
+            if _expires_too_soon(presigned):
+                presigned = await self.get_upload_url(provider_id, key, size=size, media_type=media_type)
+
+            if not presigned.url or presigned.supported is False:
+                folder, _, file_name = key.rpartition("/")
+                return await self.upload(
+                    provider_id,
+                    key=f"{folder}/" if folder else "/",
+                    file=stream,
+                    file_name=file_name,
+                    mime_type=media_type,
+                )
+
+            # A known size means the stream is seekable, so it can be sent again.
+            start = stream.tell() if size is not None else None
+            response = await self._put_to_storage(presigned.url, stream, media_type, size, chunk_size)
+            if response.status_code == HTTPStatus.FORBIDDEN and start is not None:
+                stream.seek(start)
+                presigned = await self.get_upload_url(provider_id, key, size=size, media_type=media_type)
+                if presigned.url:
+                    response = await self._put_to_storage(presigned.url, stream, media_type, size, chunk_size)
+
+        if not response.is_success:
+            raise APIError(response.status_code, f"Direct upload to storage failed: {response.text}")
+
+        return await self.confirm_upload(provider_id, key)
+
+    async def _put_to_storage(
+        self,
+        presigned_url: str,
+        stream: BinaryIO,
+        media_type: str,
+        size: int | None,
+        chunk_size: int,
+    ) -> httpx.Response:
+        """Stream a file to a presigned upload URL."""
+        url, headers = self._resolve_storage_url(presigned_url)
+        headers["Content-Type"] = media_type
+        if size is not None:
+            headers["Content-Length"] = str(size)
+        if ".blob.core.windows.net" in url:
+            headers["x-ms-blob-type"] = "BlockBlob"
+
+        return await http_client(self._client).put(
+            url,
+            content=_read_chunks(stream, chunk_size),
+            headers=headers,
+        )
+
+    async def iter_content(
+        self,
+        provider_id: str,
+        key: str,
+        chunk_size: int = 1024 * 1024,
+        presigned: bool = True,
+    ) -> AsyncIterator[bytes]:
+        """Stream the content of a file chunk by chunk.
+
+        The file is fetched from a presigned download URL when the provider
+        supports it, so the bytes do not transit through the Biolevate API;
+        otherwise it is proxied through the ``/items/content`` endpoint.
+        Only one chunk is held in memory at a time.
+
+        Args:
+            provider_id: The provider ID.
+            key: Full key of the file (e.g. 'reports/report.pdf').
+            chunk_size: Maximum number of bytes per yielded chunk.
+            presigned: Whether to try a presigned download URL first.
+
+        Yields:
+            Successive chunks of the file content.
+
+        Raises:
+            NotFoundError: If the file is not found.
+            AuthenticationError: If authentication fails.
+            APIError: If the API or the storage returns an unexpected error.
+        """
+        url, headers = await self._download_request(provider_id, key, presigned)
+
+        async with http_client(self._client).stream("GET", url, headers=headers) as response:
+            if not response.is_success:
+                await response.aread()
+                _raise_for_download_status(response, key)
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def download(
+        self,
+        provider_id: str,
+        key: str,
+        destination: str | os.PathLike[str],
+        chunk_size: int = 1024 * 1024,
+        presigned: bool = True,
+    ) -> Path:
+        """Download a file to disk with bounded memory usage.
+
+        Content is written to a ``.part`` file next to the destination, which
+        is renamed once the transfer completes, so an interrupted download
+        never leaves a truncated file at the destination path.
+
+        Args:
+            provider_id: The provider ID.
+            key: Full key of the file (e.g. 'reports/report.pdf').
+            destination: Target file path, or an existing directory in which
+                the file is saved under its own name.
+            chunk_size: Number of bytes read and written at a time.
+            presigned: Whether to try a presigned download URL first.
+
+        Returns:
+            The path of the downloaded file.
+
+        Raises:
+            NotFoundError: If the file is not found.
+            AuthenticationError: If authentication fails.
+            APIError: If the API or the storage returns an unexpected error.
+        """
+        target = Path(destination)
+        if target.is_dir():
+            target = target / key.rstrip("/").rpartition("/")[2]
+        partial = target.with_name(f"{target.name}.part")
+
+        try:
+            with open(partial, "wb") as f:
+                async for chunk in self.iter_content(provider_id, key, chunk_size=chunk_size, presigned=presigned):
+                    await asyncio.to_thread(f.write, chunk)
+            os.replace(partial, target)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        return target
+
+    async def _download_request(self, provider_id: str, key: str, presigned: bool) -> tuple[str, dict[str, str]]:
+        """Return the URL and headers to fetch the content of a file from."""
+        if presigned:
+            try:
+                response = await self.get_download_url(provider_id, key)
+            except APIError:
+                # Providers without presigned download support reject the request; use the proxy instead.
+                response = None
+            if response is not None and response.url:
+                return self._resolve_storage_url(response.url)
+
+        _, url, headers, _, _ = self._client.param_serialize(
+            method="GET",
+            resource_path="/api/core/providers/{providerId}/items/content",
+            path_params={"providerId": provider_id},
+            query_params=[("key", key)],
+            header_params={"Accept": "*/*"},
+            auth_settings=["TOKEN"],
+        )
+        return url, headers
+
+    def _resolve_storage_url(self, url: str) -> tuple[str, dict[str, str]]:
+        """Return an absolute storage URL and the headers needed to authenticate against it."""
+        if url.startswith(("http://", "https://")):
+            return url, {}
+        # Relative URLs point to the storage proxy of the Biolevate API itself.
+        config = self._client.configuration
+        return config.host.rstrip("/") + "/" + url.lstrip("/"), {"Authorization": f"Bearer {config.access_token}"}
+
+    def _invalidate_files(self) -> None:
+        """Drop the cached files, as the files of a renamed or deleted item are not known by key."""
+        if self._cache is not None:
+            self._cache.invalidate("files")
+
+
+_PRESIGNED_URL_MIN_VALIDITY = 5
+"""Presigned URLs valid for fewer seconds than this are requested again."""
+
+
+def _expires_too_soon(presigned: UploadUrlResponse) -> bool:
+    """Whether a presigned URL would likely expire before the transfer starts."""
+    return (
+        bool(presigned.url)
+        and presigned.supported is not False
+        and presigned.expires_in_seconds is not None
+        and presigned.expires_in_seconds < _PRESIGNED_URL_MIN_VALIDITY
+    )
+
+
+def _raise_for_download_status(response: httpx.Response, key: str) -> None:
+    """Map an unsuccessful download response to an SDK exception."""
+    if response.status_code == HTTPStatus.UNAUTHORIZED:
+        raise AuthenticationError("Authentication failed")
+    if response.status_code == HTTPStatus.FORBIDDEN:
+        raise AuthenticationError("Access denied to provider")
+    if response.status_code == HTTPStatus.NOT_FOUND:
+        raise NotFoundError(f"File not found: {key}")
+    raise APIError(response.status_code, f"Failed to download file: {response.text}")
+
+
+def _remaining_size(stream: BinaryIO) -> int | None:
+    """Return the number of bytes left to read in a stream, if it can be known."""
+    try:
+        position = stream.tell()
+        end = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return end - position
+
+
+async def _read_chunks(stream: BinaryIO, chunk_size: int) -> AsyncIterator[bytes]:
+    """Read a blocking stream chunk by chunk without blocking the event loop."""
+    while chunk := await asyncio.to_thread(stream.read, chunk_size):
+        yield chunk
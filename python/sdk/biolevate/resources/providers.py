@@ -4,9 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from biolevate._pagination import iterate_pages
 from biolevate.exceptions import APIError, AuthenticationError, NotFoundError
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from biolevate.cache import MetadataCache
     from biolevate.models import Provider, ProviderPage
     from biolevate_client import ApiClient
 
@@ -17,13 +21,15 @@ class ProvidersResource:
     Provides methods to list and retrieve storage providers.
     """
 
-    def __init__(self, client: ApiClient) -> None:
+    def __init__(self, client: ApiClient, cache: MetadataCache | None = None) -> None:
         """Initialize the providers resource.
 
         Args:
             client: The API client.
+            cache: Cache of the providers, if enabled on the client.
         """
         self._client = client
+        self._cache = cache
 
     async def list(
         self,
@@ -73,6 +79,42 @@ class ProvidersResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+    async def iter(
+        self,
+        page_size: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        query: str | None = None,
+        concurrency: int = 2,
+    ) -> AsyncIterator[Provider]:
+        """Iterate over all storage providers, fetching pages lazily.
+
+        Args:
+            page_size: Number of items requested per page.
+            sort_by: Field to sort by.
+            sort_order: Sort direction ('asc' or 'desc').
+            query: Text search filter.
+            concurrency: Maximum number of pages fetched ahead of the consumer.
+
+        Yields:
+            Each provider, in page order.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            APIError: If the API returns an unexpected error.
+        """
+        async for provider in iterate_pages(
+            lambda page: self.list(
+                page=page,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                query=query,
+            ),
+            concurrency=concurrency,
+        ):
+            yield provider
+
     async def get(self, provider_id: str) -> Provider:
         """Get a storage provider by ID.
 
@@ -87,6 +129,9 @@ class ProvidersResource:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
         """
+        if self._cache is not None and (cached := self._cache.get("providers", provider_id)) is not None:
+            return cached
+
         from biolevate_client.api.providers_api import ProvidersApi
         from biolevate_client.exceptions import (
             ApiException,
@@ -98,7 +143,7 @@ class ProvidersResource:
         api = ProvidersApi(self._client)
 
         try:
-            return await api.get_provider(id=provider_id)
+            provider = await api.get_provider(id=provider_id)
         except NotFoundException as e:
             raise NotFoundError(f"Provider '{provider_id}' not found") from e
         except UnauthorizedException as e:
@@ -107,3 +152,7 @@ class ProvidersResource:
             raise AuthenticationError("Access denied to provider") from e
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
+
+        if self._cache is not None:
+            self._cache.set("providers", provider_id, provider)
+        return provider
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
+from biolevate._backoff import Backoff
+from biolevate._pagination import iterate_pages
 from biolevate.exceptions import APIError, AuthenticationError, NotFoundError
+from biolevate.jobs import (
+    JobResult,
+    cached_artifact,
+    cached_job,
+    stream_job_annotations,
+    streamed_artifact,
+    wait_for_job,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from biolevate.cache import JobCache
     from biolevate.models import (
         Annotation,
         Job,
@@ -25,13 +39,15 @@ class QuestionAnsweringResource:
     answer questions based on indexed files.
     """
 
-    def __init__(self, client: ApiClient) -> None:
+    def __init__(self, client: ApiClient, job_cache: JobCache | None = None) -> None:
         """Initialize the question answering resource.
 
         Args:
             client: The API client.
+            job_cache: Persistent cache of terminal jobs, if enabled on the client.
         """
         self._client = client
+        self._job_cache = job_cache
 
     async def list_jobs(
         self,
@@ -78,6 +94,39 @@ class QuestionAnsweringResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+    async def iter_jobs(
+        self,
+        page_size: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        concurrency: int = 2,
+    ) -> AsyncIterator[Job]:
+        """Iterate over all QA jobs, fetching pages lazily.
+
+        Args:
+            page_size: Number of items requested per page.
+            sort_by: Field to sort by.
+            sort_order: Sort direction ('asc' or 'desc').
+            concurrency: Maximum number of pages fetched ahead of the consumer.
+
+        Yields:
+            Each job, in page order.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            APIError: If the API returns an unexpected error.
+        """
+        async for job in iterate_pages(
+            lambda page: self.list_jobs(
+                page=page,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            ),
+            concurrency=concurrency,
+        ):
+            yield job
+
     async def create_job(
         self,
         questions: list[EliseQuestionInput],
@@ -146,6 +195,10 @@ class QuestionAnsweringResource:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
         """
+        return await cached_job(self._job_cache, "qa", job_id, self._fetch_job)
+
+    async def _fetch_job(self, job_id: str) -> Job:
+        """Fetch the job from the API."""
         from biolevate_client.api.question_answering_api import QuestionAnsweringApi
         from biolevate_client.exceptions import (
             ApiException,
@@ -167,6 +220,57 @@ class QuestionAnsweringResource:
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
 
+    async def wait(
+        self,
+        job_id: str,
+        timeout: float | None = None,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 10.0,
+        fetch_outputs: bool = False,
+        fetch_annotations: bool = False,
+    ) -> JobResult[QAJobOutputs]:
+        """Wait for a QA job to reach a terminal status.
+
+        The job is polled with exponential backoff and jitter, starting at
+        ``poll_interval`` and growing up to ``max_poll_interval`` seconds.
+        Cancelling the awaiting task stops polling immediately.
+
+        Args:
+            job_id: The unique identifier of the job.
+            timeout: Maximum number of seconds to wait (default: no limit).
+            poll_interval: Delay before the second poll, in seconds.
+            max_poll_interval: Upper bound of the delay between two polls.
+            fetch_outputs: Also fetch the job outputs if the job succeeded.
+            fetch_annotations: Also fetch the job annotations if the job succeeded.
+
+        Returns:
+            The terminal job, with its outputs and annotations when requested.
+
+        Raises:
+            WaitTimeoutError: If the job is still running after ``timeout`` seconds.
+            NotFoundError: If the job is not found.
+            AuthenticationError: If authentication fails.
+            APIError: If the API returns an unexpected error.
+        """
+        job = await wait_for_job(
+            self.get_job,
+            job_id,
+            timeout=timeout,
+            backoff=Backoff(initial=poll_interval, maximum=max_poll_interval),
+        )
+        result: JobResult[QAJobOutputs] = JobResult(job=job)
+        if result.succeeded:
+            if fetch_outputs and fetch_annotations:
+                result.outputs, result.annotations = await asyncio.gather(
+                    self.get_job_outputs(job_id),
+                    self.get_job_annotations(job_id),
+                )
+            elif fetch_outputs:
+                result.outputs = await self.get_job_outputs(job_id)
+            elif fetch_annotations:
+                result.annotations = await self.get_job_annotations(job_id)
+        return result
+
     async def get_job_inputs(self, job_id: str) -> QAJobInputs:
         """Get the inputs for a QA job.
 
@@ -181,6 +285,20 @@ class QuestionAnsweringResource:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
         """
+        from biolevate_client.models import QAJobInputs
+
+        return await cached_artifact(
+            self._job_cache,
+            "qa",
+            job_id,
+            "inputs",
+            self._fetch_job_inputs,
+            self.get_job,
+            QAJobInputs,
+        )
+
+    async def _fetch_job_inputs(self, job_id: str) -> QAJobInputs:
+        """Fetch the job inputs from the API."""
         from biolevate_client.api.question_answering_api import QuestionAnsweringApi
         from biolevate_client.exceptions import (
             ApiException,
@@ -216,6 +334,20 @@ class QuestionAnsweringResource:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
         """
+        from biolevate_client.models import QAJobOutputs
+
+        return await cached_artifact(
+            self._job_cache,
+            "qa",
+            job_id,
+            "outputs",
+            self._fetch_job_outputs,
+            self.get_job,
+            QAJobOutputs,
+        )
+
+    async def _fetch_job_outputs(self, job_id: str) -> QAJobOutputs:
+        """Fetch the job outputs from the API."""
         from biolevate_client.api.question_answering_api import QuestionAnsweringApi
         from biolevate_client.exceptions import (
             ApiException,
@@ -251,6 +383,51 @@ class QuestionAnsweringResource:
             AuthenticationError: If authentication fails.
             APIError: If the API returns an unexpected error.
         """
+        from biolevate_client.models import EliseAnnotation
+
+        return await cached_artifact(
+            self._job_cache,
+            "qa",
+            job_id,
+            "annotations",
+            self._fetch_job_annotations,
+            self.get_job,
+            EliseAnnotation,
+            many=True,
+        )
+
+    async def iter_job_annotations(self, job_id: str) -> AsyncIterator[Annotation]:
+        """Iterate over the annotations of a QA job as they are received.
+
+        Unlike :meth:`get_job_annotations`, the response is parsed element by
+        element while it is downloaded, so only one annotation is held in
+        memory at a time, whatever the number of annotations of the job.
+
+        Args:
+            job_id: The unique identifier of the job.
+
+        Yields:
+            The annotations, in the order of the API response.
+
+        Raises:
+            NotFoundError: If the job is not found.
+            AuthenticationError: If authentication fails.
+            APIError: If the API returns an unexpected error.
+        """
+        from biolevate_client.models import EliseAnnotation
+
+        async for annotation in streamed_artifact(
+            self._job_cache,
+            "qa",
+            job_id,
+            "annotations",
+            self._stream_job_annotations,
+            EliseAnnotation,
+        ):
+            yield annotation
+
+    async def _fetch_job_annotations(self, job_id: str) -> list[Annotation]:
+        """Fetch the job annotations from the API."""
         from biolevate_client.api.question_answering_api import QuestionAnsweringApi
         from biolevate_client.exceptions import (
             ApiException,
@@ -271,3 +448,17 @@ class QuestionAnsweringResource:
             raise AuthenticationError("Access denied") from e
         except ApiException as e:
             raise APIError(e.status or 500, str(e.reason)) from e
+
+    async def _stream_job_annotations(self, job_id: str) -> AsyncIterator[Annotation]:
+        """Stream the job annotations from the API."""
+        from biolevate_client.api.question_answering_api import QuestionAnsweringApi
+
+        request = QuestionAnsweringApi(self._client)._get_qa_job_annotations_serialize(
+            job_id=job_id,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        async for annotation in stream_job_annotations(self._client, job_id, request):
+            yield annotation
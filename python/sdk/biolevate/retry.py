@@ -0,0 +1,138 @@
+"""Retry policy applied by the transport to transient API failures."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import email.utils
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+import httpx
+
+from biolevate._backoff import Backoff
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""HTTP methods that can be sent twice without changing the outcome."""
+
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+"""Response statuses that signal a transient failure."""
+
+_override: contextvars.ContextVar[Retry | None] = contextvars.ContextVar("biolevate_retry_override", default=None)
+
+
+@dataclass(frozen=True)
+class Retry:
+    """Retry policy for transient failures.
+
+    A request is retried when the response status is in ``statuses`` or the
+    connection fails, as long as its method is in ``methods``. Connection
+    failures that happen before the request is sent are retried whatever
+    the method. Delays follow ``backoff``; a ``Retry-After`` header sent
+    with the response takes precedence when it asks for a longer wait.
+
+    Attributes:
+        total: Maximum number of retries of a single request (0 disables retries).
+        backoff: Schedule of delays between two attempts.
+        statuses: Response statuses that trigger a retry.
+        methods: HTTP methods that may be retried.
+        respect_retry_after: Whether to honor the ``Retry-After`` header.
+        max_retry_after: Upper bound in seconds for a ``Retry-After`` delay.
+    """
+
+    total: int = 3
+    backoff: Backoff = field(default_factory=lambda: Backoff(initial=0.5, maximum=30.0, full_jitter=True))
+    statuses: frozenset[int] = RETRYABLE_STATUSES
+    methods: frozenset[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+
+    @classmethod
+    def from_config(cls, retries: int | Retry | None) -> Retry:
+        """Build a policy from the ``retries`` value of a ``Configuration``.
+
+        Args:
+            retries: A policy, a maximum number of retries, or None to
+                disable retries.
+
+        Returns:
+            The corresponding policy.
+        """
+        if isinstance(retries, Retry):
+            return retries
+        return cls(total=retries or 0)
+
+    def can_retry_status(self, method: str, status: int, attempt: int) -> bool:
+        """Whether a response with the given status should be retried after ``attempt`` retries."""
+        return attempt < self.total and method in self.methods and status in self.statuses
+
+    def can_retry_error(self, method: str, error: httpx.TransportError, attempt: int) -> bool:
+        """Whether a connection failure should be retried after ``attempt`` retries."""
+        if attempt >= self.total:
+            return False
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+            # The request never reached the server.
+            return True
+        return method in self.methods
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Return the delay in seconds before the next attempt.
+
+        Args:
+            attempt: Number of retries already made (0-based).
+            retry_after: Value of the ``Retry-After`` response header, if any.
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = self.backoff.delay(attempt)
+        if self.respect_retry_after and retry_after:
+            requested = _parse_retry_after(retry_after)
+            if requested is not None:
+                delay = max(delay, min(requested, self.max_retry_after))
+        return delay
+
+
+@contextlib.contextmanager
+def retry_policy(policy: Retry) -> Iterator[Retry]:
+    """Override the retry policy of the requests made within the block.
+
+    The override applies to the current task and the tasks it starts, for
+    every client.
+
+    Example:
+        ```python
+        with retry_policy(Retry(total=5, methods=IDEMPOTENT_METHODS | {"POST"})):
+            job = await client.qa.create_job(...)
+        ```
+
+    Args:
+        policy: The policy to apply.
+
+    Yields:
+        The applied policy.
+    """
+    token = _override.set(policy)
+    try:
+        yield policy
+    finally:
+        _override.reset(token)
+
+
+def current_override() -> Retry | None:
+    """Return the policy set by an enclosing :func:`retry_policy` block, if any."""
+    return _override.get()
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
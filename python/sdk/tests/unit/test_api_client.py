@@ -0,0 +1,532 @@
+"""Unit tests for the SDK API client."""
+
+import asyncio
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+from pydantic import ValidationError
+
+from biolevate import BiolevateClient, NotFoundError
+from biolevate._api_client import ApiClient
+from biolevate._decoders import decoder_for
+from biolevate._transport import TransportStats
+from biolevate_client import ApiClient as GeneratedApiClient
+from biolevate_client import Configuration
+from biolevate_client.exceptions import NotFoundException
+from biolevate_client.models import (
+    EliseAnnotationData,
+    EliseDocumentStatement,
+    EliseDocumentStatementAllOfPositions,
+    EliseFullDocumentStatement,
+    EliseReviewComment,
+    EliseWebStatement,
+    PositionBboxDto,
+    PositionCellDto,
+)
+from biolevate_client.rest import RESTResponse
+
+PROVIDER_ID = "550e8400-e29b-41d4-a716-446655440000"
+JOB_ID = "f47ac10b-58cc-4372-a567-0e02b2c3d479"
+
+
+def _slow(response: Response):
+    async def respond(_request):
+        await asyncio.sleep(0.01)
+        return response
+
+    return respond
+
+
+@pytest.fixture
+def coalescing_client(base_url: str, token: str) -> BiolevateClient:
+    return BiolevateClient(base_url=base_url, token=token, coalesce_requests=True)
+
+
+@pytest.mark.asyncio
+class TestRequestCoalescing:
+    @respx.mock
+    async def test_concurrent_identical_gets_share_one_request(
+        self,
+        coalescing_client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            side_effect=_slow(Response(200, json=provider_payload))
+        )
+
+        providers = await asyncio.gather(*(coalescing_client.providers.get(PROVIDER_ID) for _ in range(5)))
+
+        assert route.call_count == 1
+        assert all(provider is providers[0] for provider in providers)
+        assert coalescing_client.stats.coalesced == 4
+
+    @respx.mock
+    async def test_sequential_gets_are_not_coalesced(
+        self,
+        coalescing_client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            return_value=Response(200, json=provider_payload)
+        )
+
+        await coalescing_client.providers.get(PROVIDER_ID)
+        await coalescing_client.providers.get(PROVIDER_ID)
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_different_urls_are_not_coalesced(
+        self,
+        coalescing_client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/providers").mock(
+            side_effect=_slow(Response(200, json={"data": [provider_payload], "hasNext": False}))
+        )
+
+        await asyncio.gather(coalescing_client.providers.list(page=0), coalescing_client.providers.list(page=1))
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_errors_are_raised_to_every_caller(self, coalescing_client: BiolevateClient, base_url: str) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            side_effect=_slow(Response(404, json={"message": "not found"}))
+        )
+
+        results = await asyncio.gather(
+            *(coalescing_client.providers.get(PROVIDER_ID) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert route.call_count == 1
+        assert all(isinstance(result, NotFoundError) for result in results)
+
+    @respx.mock
+    async def test_cancelled_caller_does_not_cancel_shared_request(
+        self,
+        coalescing_client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            side_effect=_slow(Response(200, json=provider_payload))
+        )
+
+        first = asyncio.create_task(coalescing_client.providers.get(PROVIDER_ID))
+        second = asyncio.create_task(coalescing_client.providers.get(PROVIDER_ID))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        provider = await second
+        assert provider.name == provider_payload["name"]
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @respx.mock
+    async def test_connection_errors_are_raised_to_every_caller(
+        self, coalescing_client: BiolevateClient, base_url: str
+    ) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(side_effect=httpx.ConnectError("refused"))
+
+        results = await asyncio.gather(
+            *(coalescing_client.providers.get(PROVIDER_ID) for _ in range(2)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, httpx.ConnectError) for result in results)
+
+    @respx.mock
+    async def test_is_disabled_by_default(self, client: BiolevateClient, base_url: str, provider_payload: dict) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            side_effect=_slow(Response(200, json=provider_payload))
+        )
+
+        providers = await asyncio.gather(*(client.providers.get(PROVIDER_ID) for _ in range(3)))
+
+        assert route.call_count == 3
+        assert providers[0] is not providers[1]
+
+    @respx.mock
+    async def test_requests_with_different_timeouts_are_not_coalesced(
+        self, coalescing_client: BiolevateClient, base_url: str, provider_payload: dict
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            side_effect=_slow(Response(200, json=provider_payload))
+        )
+        api_client = coalescing_client._get_client()
+        url = f"{base_url}/api/core/providers/{PROVIDER_ID}"
+
+        await asyncio.gather(
+            api_client.call_api("GET", url, _request_timeout=1),
+            api_client.call_api("GET", url, _request_timeout=1),
+            api_client.call_api("GET", url, _request_timeout=60),
+        )
+
+        assert route.call_count == 2
+
+
+@pytest.fixture
+def revalidating_client(base_url: str, token: str) -> BiolevateClient:
+    return BiolevateClient(base_url=base_url, token=token, conditional_requests=True)
+
+
+@pytest.mark.asyncio
+class TestConditionalRequests:
+    @respx.mock
+    async def test_serves_kept_result_on_not_modified(
+        self,
+        revalidating_client: BiolevateClient,
+        base_url: str,
+        annotation_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(
+            side_effect=[
+                Response(200, json=[annotation_payload], headers={"ETag": '"v1"'}),
+                Response(304),
+            ]
+        )
+
+        first = await revalidating_client.qa.get_job_annotations(JOB_ID)
+        second = await revalidating_client.qa.get_job_annotations(JOB_ID)
+
+        assert second is first
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert revalidating_client.stats.not_modified == 1
+
+    @respx.mock
+    async def test_replaces_kept_result_when_modified(
+        self,
+        revalidating_client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            side_effect=[
+                Response(200, json=provider_payload, headers={"Last-Modified": modified}),
+                Response(200, json={**provider_payload, "name": "Renamed"}, headers={"ETag": '"v2"'}),
+                Response(304),
+            ]
+        )
+
+        await revalidating_client.providers.get(PROVIDER_ID)
+        renamed = await revalidating_client.providers.get(PROVIDER_ID)
+        again = await revalidating_client.providers.get(PROVIDER_ID)
+
+        assert route.calls[1].request.headers["If-Modified-Since"] == modified
+        assert route.calls[2].request.headers["If-None-Match"] == '"v2"'
+        assert renamed.name == again.name == "Renamed"
+
+    @respx.mock
+    async def test_evicts_least_recently_used_responses(
+        self,
+        base_url: str,
+        token: str,
+        provider_payload: dict,
+    ) -> None:
+        other = "660e8400-e29b-41d4-a716-446655440000"
+        routes = {
+            provider_id: respx.get(f"{base_url}/api/core/providers/{provider_id}").mock(
+                return_value=Response(200, json=provider_payload, headers={"ETag": '"v1"'})
+            )
+            for provider_id in (PROVIDER_ID, other)
+        }
+        client = BiolevateClient(base_url=base_url, token=token, conditional_requests=1)
+
+        await client.providers.get(PROVIDER_ID)
+        await client.providers.get(other)
+        await client.providers.get(PROVIDER_ID)
+
+        assert "If-None-Match" not in routes[PROVIDER_ID].calls[1].request.headers
+
+    @respx.mock
+    async def test_is_disabled_by_default(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            return_value=Response(200, json=provider_payload, headers={"ETag": '"v1"'})
+        )
+
+        await client.providers.get(PROVIDER_ID)
+        await client.providers.get(PROVIDER_ID)
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+
+def _response(payload: object, status: int = 200, content_type: str = "application/json") -> RESTResponse:
+    response = RESTResponse(
+        httpx.Response(status, content=json.dumps(payload).encode(), headers={"Content-Type": content_type})
+    )
+    response.data = response.response.content
+    return response
+
+
+class TestFastDeserialization:
+    @pytest.fixture
+    def api_client(self, base_url: str) -> ApiClient:
+        return ApiClient(Configuration(host=base_url))
+
+    @pytest.fixture
+    def generated_client(self, base_url: str) -> GeneratedApiClient:
+        return GeneratedApiClient(Configuration(host=base_url))
+
+    @pytest.mark.parametrize(
+        ("response_type", "fixture"),
+        [
+            ("PageDataEliseFileInfo", "file_page_payload"),
+            ("FSProviderExternal", "provider_payload"),
+            ("Job", "job_payload"),
+            ("List[EliseAnnotation]", "annotation_payload"),
+        ],
+    )
+    def test_matches_generated_deserialization(
+        self,
+        api_client: ApiClient,
+        generated_client: GeneratedApiClient,
+        request: pytest.FixtureRequest,
+        response_type: str,
+        fixture: str,
+    ) -> None:
+        payload = request.getfixturevalue(fixture)
+        if response_type.startswith("List["):
+            payload = [payload, payload]
+        types = {"200": response_type}
+
+        fast = api_client.response_deserialize(_response(payload), types)
+        generated = generated_client.response_deserialize(_response(payload), types)
+
+        assert fast.data == generated.data
+        assert fast.status_code == 200
+        assert fast.raw_data == generated.raw_data
+
+    def test_compiles_decoder_once_per_type(self) -> None:
+        assert decoder_for("PageDataEliseFileInfo") is decoder_for("PageDataEliseFileInfo")
+        assert decoder_for("bytearray") is None
+
+    def test_invalid_body_falls_back_to_generated_path(self, api_client: ApiClient, file_payload: dict) -> None:
+        file_payload["indexed"] = "maybe"
+
+        with pytest.raises(ValidationError):
+            api_client.response_deserialize(_response(file_payload), {"200": "EliseFileInfo"})
+
+    def test_non_json_content_type_uses_generated_path(self, api_client: ApiClient) -> None:
+        response = _response("plain", content_type="text/plain")
+
+        result = api_client.response_deserialize(response, {"200": "str"})
+
+        assert result.data == '"plain"'
+
+    def test_errors_still_raise(self, api_client: ApiClient) -> None:
+        with pytest.raises(NotFoundException):
+            api_client.response_deserialize(_response({"message": "missing"}, status=404), {"200": "Job"})
+
+
+class TestOneOfDispatch:
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            ({"type": "DOCUMENT_STATEMENT", "content": "x", "documentName": "a.pdf"}, EliseDocumentStatement),
+            ({"type": "REVIEW_STATEMENT", "content": "x", "documentName": "a.pdf"}, EliseReviewComment),
+            ({"type": "WEB_STATEMENT", "url": "https://example.com", "source": "WEB"}, EliseWebStatement),
+            ({"type": "ENTIRE_DOCUMENT_STATEMENT", "documentName": "a.pdf"}, EliseFullDocumentStatement),
+        ],
+    )
+    def test_annotation_data_dispatches_on_type(self, data: dict, expected: type) -> None:
+        result = EliseAnnotationData.from_dict(data)
+
+        assert type(result.actual_instance) is expected
+        assert result.to_dict() == data
+
+    def test_positions_dispatch_on_type(self) -> None:
+        result = EliseDocumentStatementAllOfPositions.from_json(json.dumps({"type": "CELL", "pageNumber": 2}))
+
+        assert isinstance(result.actual_instance, PositionCellDto)
+
+    def test_unknown_type_tries_every_schema(self) -> None:
+        with pytest.raises(ValueError, match="No match found"):
+            EliseDocumentStatementAllOfPositions.from_dict({"type": "UNKNOWN", "pageNumber": "two"})
+
+
+class TestTrustedResponses:
+    @pytest.fixture
+    def trusted_client(self, base_url: str) -> ApiClient:
+        return ApiClient(Configuration(host=base_url), trusted=True)
+
+    @pytest.fixture
+    def generated_client(self, base_url: str) -> GeneratedApiClient:
+        return GeneratedApiClient(Configuration(host=base_url))
+
+    @pytest.mark.parametrize(
+        ("response_type", "fixture"),
+        [
+            ("PageDataEliseFileInfo", "file_page_payload"),
+            ("PageDataFSProviderExternal", "provider_page_payload"),
+            ("Job", "job_payload"),
+            ("List[EliseAnnotation]", "annotation_payload"),
+        ],
+    )
+    def test_matches_validated_models(
+        self,
+        trusted_client: ApiClient,
+        generated_client: GeneratedApiClient,
+        request: pytest.FixtureRequest,
+        response_type: str,
+        fixture: str,
+    ) -> None:
+        payload = request.getfixturevalue(fixture)
+        if response_type.startswith("List["):
+            payload = [payload, payload]
+        types = {"200": response_type}
+
+        trusted = trusted_client.response_deserialize(_response(payload), types).data
+        validated = generated_client.response_deserialize(_response(payload), types).data
+
+        assert trusted == validated
+        items = trusted if isinstance(trusted, list) else [trusted]
+        expected = validated if isinstance(validated, list) else [validated]
+        assert [item.to_dict() for item in items] == [item.to_dict() for item in expected]
+
+    def test_builds_nested_models_with_their_types(self, trusted_client: ApiClient, annotation_payload: dict) -> None:
+        annotation_payload["status"] = "ARCHIVED"
+
+        annotations = trusted_client.response_deserialize(
+            _response([annotation_payload]), {"200": "List[EliseAnnotation]"}
+        ).data
+
+        assert annotations[0].status == "ARCHIVED"
+        assert isinstance(annotations[0].id.id, uuid.UUID)
+        statement = annotations[0].data.actual_instance
+        assert isinstance(statement, EliseDocumentStatement)
+        assert isinstance(statement.positions[0].actual_instance, PositionBboxDto)
+
+    def test_accepts_values_validation_rejects(
+        self, trusted_client: ApiClient, generated_client: GeneratedApiClient, job_payload: dict
+    ) -> None:
+        job_payload["status"] = "PAUSED"
+
+        job = trusted_client.response_deserialize(_response(job_payload), {"200": "Job"}).data
+
+        assert job.status == "PAUSED"
+        assert str(job.job_id) == JOB_ID
+        with pytest.raises(ValidationError):
+            generated_client.response_deserialize(_response(job_payload), {"200": "Job"})
+
+
+@pytest.mark.asyncio
+class TestClientTrustedResponses:
+    @respx.mock
+    async def test_resources_return_trusted_models(
+        self, base_url: str, token: str, job_payload: dict, annotation_payload: dict
+    ) -> None:
+        job_payload["status"] = "PAUSED"
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}").mock(return_value=Response(200, json=job_payload))
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(200, json=[annotation_payload])
+        )
+        client = BiolevateClient(base_url=base_url, token=token, trusted_responses=True)
+
+        job = await client.qa.get_job(JOB_ID)
+        annotations = await client.qa.get_job_annotations(JOB_ID)
+
+        assert job.status == "PAUSED"
+        assert annotations[0].data.actual_instance.document_name == "report.pdf"
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+class TestOffloadedDeserialization:
+    @respx.mock
+    async def test_small_responses_are_decoded_inline(self, base_url: str, token: str, file_page_payload: dict) -> None:
+        respx.get(f"{base_url}/api/core/files").mock(return_value=Response(200, json=file_page_payload))
+        client = BiolevateClient(base_url=base_url, token=token)
+
+        page = await client.files.list(PROVIDER_ID)
+
+        assert len(page.data) == 1
+        assert client.stats.offloaded == 0
+
+    @respx.mock
+    async def test_large_responses_are_decoded_off_the_event_loop(
+        self, base_url: str, token: str, file_page_payload: dict
+    ) -> None:
+        respx.get(f"{base_url}/api/core/files").mock(return_value=Response(200, json=file_page_payload))
+        client = BiolevateClient(base_url=base_url, token=token, offload_threshold=100)
+        inline = BiolevateClient(base_url=base_url, token=token, offload_threshold=None)
+
+        page = await client.files.list(PROVIDER_ID)
+
+        assert page == await inline.files.list(PROVIDER_ID)
+        assert client.stats.offloaded == 1
+        assert client.stats.offloaded_seconds > 0
+        assert inline.stats.offloaded == 0
+
+    @respx.mock
+    async def test_uses_the_given_executor(self, base_url: str, token: str, annotation_payload: dict) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(200, json=[annotation_payload])
+        )
+
+        with _CountingExecutor() as executor:
+            client = BiolevateClient(base_url=base_url, token=token, offload_threshold=0, offload_executor=executor)
+            annotations = await client.qa.get_job_annotations(JOB_ID)
+
+        assert annotations[0].data.actual_instance.document_name == "report.pdf"
+        assert executor.submitted == 1
+
+    @respx.mock
+    async def test_coalesced_callers_share_one_decoding(
+        self, base_url: str, token: str, provider_payload: dict
+    ) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            side_effect=_slow(Response(200, json=provider_payload))
+        )
+        client = BiolevateClient(base_url=base_url, token=token, coalesce_requests=True, offload_threshold=0)
+
+        providers = await asyncio.gather(*(client.providers.get(PROVIDER_ID) for _ in range(5)))
+
+        assert all(provider is providers[0] for provider in providers)
+        assert client.stats.coalesced == 4
+        assert client.stats.offloaded == 1
+
+    @respx.mock
+    async def test_error_responses_still_raise(self, base_url: str, token: str) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            return_value=Response(404, json={"error": "Not found" * 100})
+        )
+        client = BiolevateClient(base_url=base_url, token=token, offload_threshold=0)
+
+        with pytest.raises(NotFoundError):
+            await client.providers.get(PROVIDER_ID)
+
+        assert client.stats.offloaded == 0
+
+    async def test_rejected_bodies_take_the_generated_path(self, base_url: str) -> None:
+        api_client = ApiClient(Configuration(host=base_url), offload_threshold=0)
+        api_client.rest_client.stats = TransportStats()
+        payload = {"data": [{"id": {"id": str(uuid.uuid4())}, "indexed": "maybe"}]}
+
+        with pytest.raises(ValidationError):
+            await api_client.response_deserialize_async(_response(payload), {"200": "PageDataEliseFileInfo"})
+
+        assert api_client.rest_client.stats.offloaded == 1
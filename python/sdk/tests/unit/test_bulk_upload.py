@@ -0,0 +1,190 @@
+"""Unit tests for the BulkUploader pipeline."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from biolevate import APIError, BiolevateClient
+from biolevate.pipelines import BulkUploader
+
+PROVIDER_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+def _mock_storage(base_url: str, fail: set[str] | None = None) -> respx.Route:
+    fail = fail or set()
+
+    def upload_url(request):
+        key = json.loads(request.content)["key"]
+        return Response(200, json={"url": f"https://storage.test/{key}", "supported": True})
+
+    def put(request):
+        key = request.url.path.lstrip("/")
+        return Response(500 if key in fail else 200)
+
+    def confirm(request):
+        key = json.loads(request.content)["key"]
+        return Response(200, json={"providerId": PROVIDER_ID, "key": key, "type": "FILE"})
+
+    respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/upload-url").mock(side_effect=upload_url)
+    respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/confirm").mock(side_effect=confirm)
+    return respx.put(url__startswith="https://storage.test/").mock(side_effect=put)
+
+
+@pytest.mark.asyncio
+class TestBulkUploader:
+    @respx.mock
+    async def test_uploads_directory_tree_under_prefix(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        (tmp_path / "a.pdf").write_bytes(b"a" * 10)
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.pdf").write_bytes(b"b" * 20)
+        listing = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(200, json={"items": []})
+        )
+        storage = _mock_storage(base_url)
+        progress = []
+
+        uploader = BulkUploader(
+            client,
+            PROVIDER_ID,
+            concurrency=2,
+            on_progress=lambda result, total: progress.append((result.key, total.completed)),
+        )
+        results = [r async for r in uploader.upload_directory(tmp_path, prefix="/papers")]
+
+        assert sorted(r.key for r in results) == ["papers/a.pdf", "papers/sub/b.pdf"]
+        assert all(r.succeeded for r in results)
+        assert storage.call_count == 2
+        assert listing.calls.last.request.url.params["key"] == "papers/"
+        assert sorted(key for key, _ in progress) == ["papers/a.pdf", "papers/sub/b.pdf"]
+        assert [completed for _, completed in progress] == [1, 2]
+        assert uploader.progress.uploaded == 2
+        assert uploader.progress.bytes_uploaded == 30
+
+    @respx.mock
+    async def test_skips_keys_already_present_with_same_size(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        (tmp_path / "same.pdf").write_bytes(b"x" * 5)
+        (tmp_path / "changed.pdf").write_bytes(b"x" * 7)
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(
+                200,
+                json={
+                    "items": [
+                        {"key": "same.pdf", "type": "FILE", "size": 5},
+                        {"key": "changed.pdf", "type": "FILE", "size": 3},
+                    ]
+                },
+            )
+        )
+        storage = _mock_storage(base_url)
+
+        uploader = BulkUploader(client, PROVIDER_ID)
+        results = {r.key: r async for r in uploader.upload_directory(tmp_path)}
+
+        assert results["same.pdf"].skipped
+        assert results["changed.pdf"].succeeded
+        assert storage.call_count == 1
+        assert uploader.progress.skipped == 1
+
+    @respx.mock
+    async def test_keeps_going_past_failures(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        paths = []
+        for name in ("ok.pdf", "bad.pdf"):
+            path = tmp_path / name
+            path.write_bytes(b"data")
+            paths.append(path)
+        _mock_storage(base_url, fail={"docs/bad.pdf"})
+
+        uploader = BulkUploader(client, PROVIDER_ID, skip_existing=False)
+        results = {r.key: r async for r in uploader.upload_files([*paths, tmp_path / "missing.pdf"], prefix="docs")}
+
+        assert results["docs/ok.pdf"].succeeded
+        assert isinstance(results["docs/bad.pdf"].error, APIError)
+        assert isinstance(results["docs/missing.pdf"].error, OSError)
+        assert uploader.progress.failed == 2
+        assert uploader.progress.completed == 3
+
+    @respx.mock
+    async def test_keeps_going_past_connection_errors(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        paths = []
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            path = tmp_path / name
+            path.write_bytes(b"data")
+            paths.append(path)
+        storage = _mock_storage(base_url)
+        storage.side_effect = [httpx.ConnectError("connection reset"), Response(200), Response(200)]
+
+        uploader = BulkUploader(client, PROVIDER_ID, concurrency=1, skip_existing=False)
+        results = [r async for r in uploader.upload_files(paths)]
+
+        assert [r.key for r in results] == ["a.pdf", "b.pdf", "c.pdf"]
+        assert isinstance(results[0].error, httpx.ConnectError)
+        assert results[1].succeeded and results[2].succeeded
+        assert uploader.progress.failed == 1
+
+    @respx.mock
+    async def test_accepts_explicit_keys(self, client: BiolevateClient, base_url: str, tmp_path) -> None:
+        path = tmp_path / "local-name.pdf"
+        path.write_bytes(b"data")
+        _mock_storage(base_url)
+
+        uploader = BulkUploader(client, PROVIDER_ID, skip_existing=False)
+        results = [r async for r in uploader.upload_files([(path, "archive/2024/report.pdf")])]
+
+        assert results[0].key == "archive/2024/report.pdf"
+        assert results[0].item.key == "archive/2024/report.pdf"
+
+    @respx.mock
+    async def test_lists_only_the_folders_of_explicit_keys(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        sources = []
+        for key in ("archive/2024/a.pdf", "archive/2024/b.pdf", "other/c.pdf"):
+            path = tmp_path / key.replace("/", "-")
+            path.write_bytes(b"data")
+            sources.append((path, key))
+
+        def folder(request):
+            existing = {"archive/2024/": [{"key": "archive/2024/a.pdf", "type": "FILE", "size": 4}]}
+            items = existing.get(request.url.params["key"], [])
+            items = [*items, {"key": request.url.params["key"] + "sub/", "type": "FOLDER"}]
+            return Response(200, json={"items": items})
+
+        listing = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(side_effect=folder)
+        storage = _mock_storage(base_url)
+
+        uploader = BulkUploader(client, PROVIDER_ID, concurrency=3)
+        results = {r.key: r async for r in uploader.upload_files(sources)}
+
+        assert sorted(call.request.url.params["key"] for call in listing.calls) == ["archive/2024/", "other/"]
+        assert results["archive/2024/a.pdf"].skipped
+        assert storage.call_count == 2
+
+    async def test_rejects_invalid_concurrency(self, client: BiolevateClient) -> None:
+        with pytest.raises(ValueError):
+            BulkUploader(client, PROVIDER_ID, concurrency=0)
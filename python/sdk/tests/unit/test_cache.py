@@ -0,0 +1,398 @@
+"""Unit tests for the metadata cache."""
+
+import asyncio
+import contextlib
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import respx
+from httpx import Response
+
+from biolevate import BiolevateClient, JobCache, MetadataCache
+
+PROVIDER_ID = "550e8400-e29b-41d4-a716-446655440000"
+FILE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+COLLECTION_ID = "c0ffee00-dead-beef-cafe-123456789abc"
+JOB_ID = "f47ac10b-58cc-4372-a567-0e02b2c3d479"
+
+
+@pytest.fixture
+def cached_client(base_url: str, token: str) -> BiolevateClient:
+    return BiolevateClient(base_url=base_url, token=token, cache=True)
+
+
+class TestMetadataCache:
+    def test_returns_cached_values_and_counts_hits(self) -> None:
+        cache = MetadataCache()
+
+        assert cache.get("files", FILE_ID) is None
+        cache.set("files", FILE_ID, "file")
+
+        assert cache.get("files", FILE_ID) == "file"
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_ratio == 0.5
+
+    def test_entries_expire_after_their_ttl(self, monkeypatch) -> None:
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache = MetadataCache(ttl={"files": 10})
+        cache.set("files", FILE_ID, "file")
+        cache.set("providers", PROVIDER_ID, "provider")
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+        assert cache.get("files", FILE_ID) is None
+        assert cache.get("providers", PROVIDER_ID) == "provider"
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used_entries(self) -> None:
+        cache = MetadataCache(maxsize=2)
+        cache.set("files", "a", 1)
+        cache.set("files", "b", 2)
+        cache.get("files", "a")
+
+        cache.set("files", "c", 3)
+
+        assert cache.get("files", "b") is None
+        assert cache.get("files", "a") == 1
+        assert cache.stats.evictions == 1
+
+    def test_invalidates_entries(self) -> None:
+        cache = MetadataCache()
+        cache.set("files", "a", 1)
+        cache.set("files", "b", 2)
+        cache.set("collections", "a", 3)
+
+        cache.invalidate("files", "a")
+        assert cache.get("files", "a") is None
+        cache.invalidate("files")
+
+        assert cache.get("files", "b") is None
+        assert cache.get("collections", "a") == 3
+        assert cache.stats.invalidations == 2
+
+    def test_zero_ttl_disables_a_resource(self) -> None:
+        cache = MetadataCache(ttl={"files": 0})
+        cache.set("files", FILE_ID, "file")
+
+        assert cache.get("files", FILE_ID) is None
+
+    def test_rejects_invalid_size(self) -> None:
+        with pytest.raises(ValueError):
+            MetadataCache(maxsize=0)
+
+
+@pytest.mark.asyncio
+class TestClientCache:
+    @respx.mock
+    async def test_serves_repeated_lookups_from_cache(
+        self,
+        cached_client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+        collection_payload: dict,
+        file_payload: dict,
+    ) -> None:
+        routes = [
+            respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+                return_value=Response(200, json=provider_payload)
+            ),
+            respx.get(f"{base_url}/api/core/collections/{COLLECTION_ID}").mock(
+                return_value=Response(200, json=collection_payload)
+            ),
+            respx.get(f"{base_url}/api/core/files/{FILE_ID}").mock(return_value=Response(200, json=file_payload)),
+        ]
+
+        for _ in range(3):
+            await cached_client.providers.get(PROVIDER_ID)
+            await cached_client.collections.get(COLLECTION_ID)
+            await cached_client.files.get(FILE_ID)
+
+        assert [route.call_count for route in routes] == [1, 1, 1]
+        assert cached_client.cache is not None
+        assert (cached_client.cache.stats.hits, cached_client.cache.stats.misses) == (6, 3)
+
+    @respx.mock
+    async def test_is_disabled_by_default(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        file_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/files/{FILE_ID}").mock(return_value=Response(200, json=file_payload))
+
+        await client.files.get(FILE_ID)
+        await client.files.get(FILE_ID)
+
+        assert route.call_count == 2
+        assert client.cache is None
+
+    @respx.mock
+    async def test_update_and_delete_invalidate_collection(
+        self,
+        cached_client: BiolevateClient,
+        base_url: str,
+        collection_payload: dict,
+    ) -> None:
+        url = f"{base_url}/api/core/collections/{COLLECTION_ID}"
+        get = respx.get(url).mock(return_value=Response(200, json=collection_payload))
+        respx.patch(url).mock(return_value=Response(200, json={**collection_payload, "name": "Renamed"}))
+        respx.delete(url).mock(return_value=Response(204))
+
+        await cached_client.collections.get(COLLECTION_ID)
+        await cached_client.collections.update(COLLECTION_ID, name="Renamed")
+        await cached_client.collections.get(COLLECTION_ID)
+        await cached_client.collections.delete(COLLECTION_ID)
+        await cached_client.collections.get(COLLECTION_ID)
+
+        assert get.call_count == 3
+
+    @respx.mock
+    async def test_reindex_and_rename_invalidate_files(
+        self,
+        cached_client: BiolevateClient,
+        base_url: str,
+        file_payload: dict,
+        provider_item_payload: dict,
+    ) -> None:
+        get = respx.get(f"{base_url}/api/core/files/{FILE_ID}").mock(return_value=Response(200, json=file_payload))
+        respx.post(f"{base_url}/api/core/files/{FILE_ID}/reindex").mock(return_value=Response(202))
+        respx.patch(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(200, json=provider_item_payload)
+        )
+
+        await cached_client.files.get(FILE_ID)
+        await cached_client.files.reindex(FILE_ID)
+        await cached_client.files.get(FILE_ID)
+        await cached_client.items.rename(PROVIDER_ID, key="documents/report.pdf", new_name="renamed.pdf")
+        await cached_client.files.get(FILE_ID)
+
+        assert get.call_count == 3
+
+    @respx.mock
+    async def test_wait_indexed_bypasses_cache(
+        self,
+        cached_client: BiolevateClient,
+        base_url: str,
+        file_payload: dict,
+    ) -> None:
+        pending = {**file_payload, "indexed": False, "lastIndexationInfos": {"status": "RUNNING"}}
+        ready = {**file_payload, "lastIndexationInfos": {"status": "SUCCESS"}}
+        respx.get(f"{base_url}/api/core/files/{FILE_ID}").mock(
+            side_effect=[Response(200, json=pending), Response(200, json=ready)]
+        )
+
+        await cached_client.files.get(FILE_ID)
+        result = await cached_client.files.wait_indexed([FILE_ID], poll_interval=0.001)
+
+        assert result.ready == {FILE_ID}
+        cached = await cached_client.files.get(FILE_ID)
+        assert cached.last_indexation_infos.status == "SUCCESS"
+
+
+@pytest.mark.asyncio
+class TestJobCache:
+    async def test_persists_artifacts_across_instances(self, tmp_path) -> None:
+        path = tmp_path / "jobs.db"
+        await JobCache(path).set("qa", JOB_ID, "outputs", b'{"results": []}')
+
+        cache = JobCache(path)
+
+        assert await cache.get("qa", JOB_ID, "outputs") == b'{"results": []}'
+        assert await cache.get("extraction", JOB_ID, "outputs") is None
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    async def test_evicts_least_recently_read_artifacts(self, tmp_path) -> None:
+        data = {job_id: os.urandom(1000) for job_id in "abc"}
+        cache = JobCache(tmp_path / "jobs.db", max_size=2500)
+        await cache.set("qa", "a", "outputs", data["a"])
+        await cache.set("qa", "b", "outputs", data["b"])
+        await cache.get("qa", "a", "outputs")
+
+        await cache.set("qa", "c", "outputs", data["c"])
+
+        assert await cache.get("qa", "b", "outputs") is None
+        assert await cache.get("qa", "a", "outputs") == data["a"]
+        assert cache.stats.evictions == 1
+        assert cache.size() <= 2500
+
+    async def test_clear(self, tmp_path) -> None:
+        cache = JobCache(tmp_path / "jobs.db")
+        await cache.set("qa", JOB_ID, "job", b"{}")
+
+        await cache.clear()
+
+        assert cache.size() == 0
+
+    async def test_keeps_the_total_size_up_to_date(self, tmp_path) -> None:
+        path = tmp_path / "jobs.db"
+        with contextlib.closing(sqlite3.connect(path)) as connection, connection:
+            # A database written before the total was kept.
+            connection.execute(
+                "CREATE TABLE artifacts (task TEXT NOT NULL, job_id TEXT NOT NULL, artifact TEXT NOT NULL,"
+                " data BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL,"
+                " PRIMARY KEY (task, job_id, artifact))"
+            )
+            connection.execute("INSERT INTO artifacts VALUES ('qa', 'old', 'job', x'00', 100, 0)")
+        cache = JobCache(path, max_size=2000)
+        assert cache.size() == 100
+
+        await cache.set("qa", "a", "outputs", os.urandom(1000))
+        await cache.set("qa", "a", "outputs", os.urandom(1200))
+        await cache.set("qa", "b", "outputs", os.urandom(1000))
+
+        with contextlib.closing(sqlite3.connect(path)) as connection:
+            assert cache.size() == connection.execute("SELECT SUM(size) FROM artifacts").fetchone()[0]
+        assert cache.stats.evictions == 2
+        await cache.clear()
+        assert cache.size() == 0
+
+    async def test_reuses_a_connection_per_thread(self, tmp_path) -> None:
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=1))
+        cache = JobCache(tmp_path / "jobs.db")
+        for job_id in "abc":
+            await cache.set("qa", job_id, "job", b"{}")
+            await cache.get("qa", job_id, "job")
+
+        # One connection opened by the constructor, and one by the worker thread.
+        assert len(cache._connections) == 2
+        cache.close()
+        assert cache._connections == []
+        assert await cache.get("qa", "a", "job") == b"{}"
+
+
+@pytest.mark.asyncio
+class TestClientJobCache:
+    @respx.mock
+    async def test_reads_terminal_job_results_without_api_calls(
+        self,
+        base_url: str,
+        token: str,
+        tmp_path,
+        job_payload: dict,
+        qa_job_outputs_payload: dict,
+        annotation_payload: dict,
+    ) -> None:
+        routes = [
+            respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}").mock(return_value=Response(200, json=job_payload)),
+            respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/results").mock(
+                return_value=Response(200, json=qa_job_outputs_payload)
+            ),
+            respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(
+                return_value=Response(200, json=[annotation_payload])
+            ),
+        ]
+        first = BiolevateClient(base_url=base_url, token=token, job_cache=tmp_path / "jobs.db")
+        await first.qa.wait(JOB_ID, fetch_outputs=True, fetch_annotations=True)
+        assert [route.call_count for route in routes] == [1, 1, 1]
+
+        second = BiolevateClient(base_url=base_url, token=token, job_cache=tmp_path / "jobs.db")
+        result = await second.qa.wait(JOB_ID, fetch_outputs=True, fetch_annotations=True)
+
+        assert [route.call_count for route in routes] == [1, 1, 1]
+        assert result.job.status == "SUCCESS"
+        assert result.outputs.results[0].raw_value == "Biolevate"
+        assert result.annotations[0].type == "DOCUMENT_STATEMENT"
+        assert result.annotations[0].data.actual_instance.document_name == "report.pdf"
+
+    @respx.mock
+    async def test_iterates_cached_annotations_without_api_calls(
+        self,
+        base_url: str,
+        token: str,
+        tmp_path,
+        job_payload: dict,
+        annotation_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}").mock(return_value=Response(200, json=job_payload))
+        route = respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(200, json=[annotation_payload])
+        )
+        client = BiolevateClient(base_url=base_url, token=token, job_cache=tmp_path / "jobs.db")
+
+        streamed = [annotation async for annotation in client.extraction.iter_job_annotations(JOB_ID)]
+        await client.extraction.get_job_annotations(JOB_ID)
+        cached = [annotation async for annotation in client.extraction.iter_job_annotations(JOB_ID)]
+
+        assert route.call_count == 2
+        assert streamed == cached
+        assert cached[0].data.actual_instance.document_name == "report.pdf"
+
+    @respx.mock
+    async def test_does_not_cache_running_jobs(
+        self,
+        base_url: str,
+        token: str,
+        tmp_path,
+        job_payload: dict,
+        extraction_job_outputs_payload: dict,
+    ) -> None:
+        job = respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}").mock(
+            return_value=Response(200, json={**job_payload, "status": "RUNNING"})
+        )
+        outputs = respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/results").mock(
+            return_value=Response(200, json=extraction_job_outputs_payload)
+        )
+        client = BiolevateClient(base_url=base_url, token=token, job_cache=tmp_path / "jobs.db")
+
+        await client.extraction.get_job(JOB_ID)
+        await client.extraction.get_job_outputs(JOB_ID)
+        await client.extraction.get_job_outputs(JOB_ID)
+
+        assert outputs.call_count == 2
+        assert job.call_count == 3
+
+    @respx.mock
+    async def test_does_not_cache_outputs_of_jobs_finishing_during_the_fetch(
+        self,
+        base_url: str,
+        token: str,
+        tmp_path,
+        job_payload: dict,
+        extraction_job_outputs_payload: dict,
+    ) -> None:
+        status = {"status": "RUNNING"}
+
+        def finish(_request):
+            # The job reaches its terminal status while its partial outputs are being fetched.
+            partial = {**extraction_job_outputs_payload, "results": []}
+            status["status"] = "SUCCESS"
+            return Response(200, json=partial)
+
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}").mock(
+            side_effect=lambda _request: Response(200, json={**job_payload, **status})
+        )
+        outputs = respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/results").mock(side_effect=finish)
+        client = BiolevateClient(base_url=base_url, token=token, job_cache=tmp_path / "jobs.db")
+
+        partial = await client.extraction.get_job_outputs(JOB_ID)
+        outputs.side_effect = None
+        outputs.return_value = Response(200, json=extraction_job_outputs_payload)
+        final = await client.extraction.get_job_outputs(JOB_ID)
+        cached = await client.extraction.get_job_outputs(JOB_ID)
+
+        assert not partial.results
+        assert final.results and cached == final
+        assert outputs.call_count == 2
+
+    @respx.mock
+    async def test_caches_inputs_of_running_jobs(
+        self,
+        base_url: str,
+        token: str,
+        tmp_path,
+        extraction_job_inputs_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/inputs").mock(
+            return_value=Response(200, json=extraction_job_inputs_payload)
+        )
+        client = BiolevateClient(base_url=base_url, token=token, job_cache=tmp_path / "jobs.db")
+
+        await client.extraction.get_job_inputs(JOB_ID)
+        inputs = await client.extraction.get_job_inputs(JOB_ID)
+
+        assert route.call_count == 1
+        assert inputs.metas[0].meta == "title"
@@ -1,10 +1,11 @@
 """Unit tests for CollectionsResource."""
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from biolevate import APIError, AuthenticationError, BiolevateClient, NotFoundError
+from biolevate import APIError, AuthenticationError, BiolevateClient, NotFoundError, RawPage
 
 COLLECTION_ID = "c0ffee00-dead-beef-cafe-123456789abc"
 FILE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
@@ -83,6 +84,102 @@ class TestCollectionsList:
             await client.collections.list()
 
 
+@pytest.mark.asyncio
+class TestCollectionsIter:
+    @respx.mock
+    async def test_yields_items_across_pages(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        collection_payload: dict,
+    ) -> None:
+        def page_response(request: httpx.Request) -> Response:
+            page = int(request.url.params["page"])
+            return Response(
+                200,
+                json={"data": [collection_payload] * 2, "totalPages": 3, "totalElements": 6, "hasNext": page < 2},
+            )
+
+        route = respx.get(f"{base_url}/api/core/collections").mock(side_effect=page_response)
+
+        items = [item async for item in client.collections.iter(page_size=2)]
+
+        assert len(items) == 6
+        assert sorted(int(c.request.url.params["page"]) for c in route.calls) == [0, 1, 2]
+
+    @respx.mock
+    async def test_raises_authentication_error_on_401(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/collections").mock(return_value=Response(401))
+
+        with pytest.raises(AuthenticationError):
+            async for _ in client.collections.iter(page_size=2):
+                pass
+
+
+@pytest.mark.asyncio
+class TestCollectionsListRaw:
+    @respx.mock
+    async def test_list_returns_parsed_items(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        collection_page_payload: dict,
+        collection_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/collections").mock(return_value=Response(200, json=collection_page_payload))
+
+        page = await client.collections.list(raw=True)
+
+        assert isinstance(page, RawPage)
+        assert page.data == [collection_payload]
+
+    @respx.mock
+    async def test_list_files_projects_fields(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        file_page_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/collections/{COLLECTION_ID}/files").mock(
+            return_value=Response(200, json=file_page_payload)
+        )
+
+        page = await client.collections.list_files(COLLECTION_ID, fields=["id.id", "name"])
+
+        assert page.data == [(FILE_ID, "report.pdf")]
+        assert page.data[0].id_id == FILE_ID
+
+    @respx.mock
+    async def test_list_files_raises_not_found_on_404(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/collections/{COLLECTION_ID}/files").mock(return_value=Response(404))
+
+        with pytest.raises(NotFoundError):
+            await client.collections.list_files(COLLECTION_ID, raw=True)
+
+    @respx.mock
+    async def test_iter_files_yields_records(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        file_page_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/collections/{COLLECTION_ID}/files").mock(
+            return_value=Response(200, json=file_page_payload)
+        )
+
+        names = [record.name async for record in client.collections.iter_files(COLLECTION_ID, fields=["name"])]
+
+        assert names == ["report.pdf"]
+
+
 @pytest.mark.asyncio
 class TestCollectionsCreate:
     @respx.mock
@@ -397,6 +494,42 @@ class TestCollectionsListFiles:
         assert exc_info.value.status_code == 500
 
 
+@pytest.mark.asyncio
+class TestCollectionsIterFiles:
+    @respx.mock
+    async def test_yields_items_across_pages(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        file_payload: dict,
+    ) -> None:
+        def page_response(request: httpx.Request) -> Response:
+            page = int(request.url.params["page"])
+            return Response(
+                200,
+                json={"data": [file_payload] * 2, "totalPages": 3, "totalElements": 6, "hasNext": page < 2},
+            )
+
+        route = respx.get(f"{base_url}/api/core/collections/{COLLECTION_ID}/files").mock(side_effect=page_response)
+
+        items = [item async for item in client.collections.iter_files(COLLECTION_ID, page_size=2)]
+
+        assert len(items) == 6
+        assert sorted(int(c.request.url.params["page"]) for c in route.calls) == [0, 1, 2]
+
+    @respx.mock
+    async def test_raises_authentication_error_on_401(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/collections/{COLLECTION_ID}/files").mock(return_value=Response(401))
+
+        with pytest.raises(AuthenticationError):
+            async for _ in client.collections.iter_files(COLLECTION_ID, page_size=2):
+                pass
+
+
 @pytest.mark.asyncio
 class TestCollectionsAddFile:
     @respx.mock
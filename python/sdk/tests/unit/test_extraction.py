@@ -1,10 +1,23 @@
 """Unit tests for ExtractionResource."""
 
+import json
+
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from biolevate import APIError, AuthenticationError, BiolevateClient, NotFoundError
+from biolevate import (
+    AdaptiveConcurrency,
+    APIError,
+    AuthenticationError,
+    BiolevateClient,
+    NotFoundError,
+    Retry,
+    WaitTimeoutError,
+)
+from biolevate._backoff import Backoff
+from biolevate_client.models import EliseDocumentStatement, PositionBboxDto
 
 JOB_ID = "f47ac10b-58cc-4372-a567-0e02b2c3d479"
 FILE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
@@ -70,6 +83,42 @@ class TestExtractionListJobs:
             await client.extraction.list_jobs()
 
 
+@pytest.mark.asyncio
+class TestExtractionIterJobs:
+    @respx.mock
+    async def test_yields_items_across_pages(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        def page_response(request: httpx.Request) -> Response:
+            page = int(request.url.params["page"])
+            return Response(
+                200,
+                json={"data": [job_payload] * 2, "totalPages": 3, "totalElements": 6, "hasNext": page < 2},
+            )
+
+        route = respx.get(f"{base_url}/api/core/extraction/jobs").mock(side_effect=page_response)
+
+        items = [item async for item in client.extraction.iter_jobs(page_size=2)]
+
+        assert len(items) == 6
+        assert sorted(int(c.request.url.params["page"]) for c in route.calls) == [0, 1, 2]
+
+    @respx.mock
+    async def test_raises_authentication_error_on_401(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs").mock(return_value=Response(401))
+
+        with pytest.raises(AuthenticationError):
+            async for _ in client.extraction.iter_jobs(page_size=2):
+                pass
+
+
 @pytest.mark.asyncio
 class TestExtractionCreateJob:
     @respx.mock
@@ -200,6 +249,98 @@ class TestExtractionGetJob:
         assert exc_info.value.status_code == 500
 
 
+@pytest.mark.asyncio
+class TestExtractionWait:
+    @respx.mock
+    async def test_polls_until_terminal_status(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}").mock(
+            side_effect=[
+                Response(200, json={**job_payload, "status": "PENDING"}),
+                Response(200, json={**job_payload, "status": "RUNNING"}),
+                Response(200, json={**job_payload, "status": "SUCCESS"}),
+            ]
+        )
+
+        result = await client.extraction.wait(JOB_ID, poll_interval=0.001)
+
+        assert result.succeeded
+        assert result.job.status == "SUCCESS"
+        assert result.outputs is None
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_fetches_outputs_and_annotations(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+        extraction_job_outputs_payload: dict,
+        annotation_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}").mock(return_value=Response(200, json=job_payload))
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/results").mock(
+            return_value=Response(200, json=extraction_job_outputs_payload)
+        )
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(200, json=[annotation_payload])
+        )
+
+        result = await client.extraction.wait(JOB_ID, fetch_outputs=True, fetch_annotations=True)
+
+        assert result.outputs is not None
+        assert len(result.outputs.results) == 1
+        assert result.annotations is not None
+        assert len(result.annotations) == 1
+
+    @respx.mock
+    async def test_skips_outputs_for_failed_job(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}").mock(
+            return_value=Response(200, json={**job_payload, "status": "FAILED", "errorMessage": "boom"})
+        )
+        outputs_route = respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/results")
+
+        result = await client.extraction.wait(JOB_ID, fetch_outputs=True)
+
+        assert not result.succeeded
+        assert result.job.error_message == "boom"
+        assert not outputs_route.called
+
+    @respx.mock
+    async def test_raises_wait_timeout_error(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}").mock(
+            return_value=Response(200, json={**job_payload, "status": "RUNNING"})
+        )
+
+        with pytest.raises(WaitTimeoutError):
+            await client.extraction.wait(JOB_ID, timeout=0.05, poll_interval=0.01)
+
+    @respx.mock
+    async def test_raises_not_found_on_404(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}").mock(return_value=Response(404))
+
+        with pytest.raises(NotFoundError):
+            await client.extraction.wait(JOB_ID)
+
+
 @pytest.mark.asyncio
 class TestExtractionGetJobInputs:
     @respx.mock
@@ -352,6 +493,10 @@ class TestExtractionGetJobAnnotations:
         assert isinstance(annotations, list)
         assert len(annotations) == 1
         assert annotations[0].type == "DOCUMENT_STATEMENT"
+        statement = annotations[0].data.actual_instance
+        assert isinstance(statement, EliseDocumentStatement)
+        assert statement.document_name == "report.pdf"
+        assert isinstance(statement.positions[0].actual_instance, PositionBboxDto)
 
     @respx.mock
     async def test_returns_empty_list(
@@ -412,3 +557,120 @@ class TestExtractionGetJobAnnotations:
             await client.extraction.get_job_annotations(JOB_ID)
 
         assert exc_info.value.status_code == 500
+
+
+@pytest.mark.asyncio
+class TestExtractionIterJobAnnotations:
+    @respx.mock
+    async def test_yields_annotations(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        annotation_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(200, json=[annotation_payload, {**annotation_payload, "status": "NOTVALID"}])
+        )
+
+        annotations = [annotation async for annotation in client.extraction.iter_job_annotations(JOB_ID)]
+
+        assert [annotation.status for annotation in annotations] == ["VALID", "NOTVALID"]
+        assert annotations[0].data.actual_instance.document_name == "report.pdf"
+
+    @respx.mock
+    async def test_parses_annotations_across_chunks(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        annotation_payload: dict,
+    ) -> None:
+        content = json.dumps([annotation_payload] * 3).encode()
+
+        async def chunks():
+            for start in range(0, len(content), 7):
+                yield content[start : start + 7]
+
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(200, content=chunks())
+        )
+
+        annotations = [annotation async for annotation in client.extraction.iter_job_annotations(JOB_ID)]
+
+        assert len(annotations) == 3
+        assert all(isinstance(annotation.data.actual_instance, EliseDocumentStatement) for annotation in annotations)
+
+    @respx.mock
+    async def test_streams_through_the_transport(
+        self,
+        base_url: str,
+        token: str,
+        annotation_payload: dict,
+    ) -> None:
+        content = json.dumps([annotation_payload] * 2).encode()
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/annotations").mock(
+            side_effect=[Response(503), Response(200, content=content)]
+        )
+        concurrency = AdaptiveConcurrency()
+        client = BiolevateClient(
+            base_url=base_url,
+            token=token,
+            retries=Retry(total=1, backoff=Backoff(initial=0.001, maximum=0.001, jitter=0)),
+            adaptive_concurrency=concurrency,
+        )
+
+        in_flight = [concurrency.in_flight async for _ in client.extraction.iter_job_annotations(JOB_ID)]
+
+        assert in_flight == [1, 1]
+        assert concurrency.in_flight == 0
+        assert (client.stats.requests, client.stats.retries) == (2, 1)
+        assert client.stats.bytes_received == client.stats.bytes_received_decoded == len(content)
+
+    @respx.mock
+    async def test_yields_nothing_for_empty_list(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/annotations").mock(return_value=Response(200, json=[]))
+
+        assert [annotation async for annotation in client.extraction.iter_job_annotations(JOB_ID)] == []
+
+    @respx.mock
+    async def test_raises_not_found_on_404(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(404, json={"error": "Not found"})
+        )
+
+        with pytest.raises(NotFoundError):
+            async for _ in client.extraction.iter_job_annotations(JOB_ID):
+                pass
+
+    @respx.mock
+    async def test_raises_authentication_error_on_401(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/annotations").mock(return_value=Response(401))
+
+        with pytest.raises(AuthenticationError):
+            async for _ in client.extraction.iter_job_annotations(JOB_ID):
+                pass
+
+    @respx.mock
+    async def test_raises_api_error_on_500(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_ID}/annotations").mock(return_value=Response(500))
+
+        with pytest.raises(APIError) as exc_info:
+            async for _ in client.extraction.iter_job_annotations(JOB_ID):
+                pass
+
+        assert exc_info.value.status_code == 500
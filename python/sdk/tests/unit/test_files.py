@@ -1,10 +1,11 @@
 """Unit tests for FilesResource."""
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from biolevate import APIError, AuthenticationError, BiolevateClient, NotFoundError
+from biolevate import APIError, AuthenticationError, BiolevateClient, NotFoundError, RawPage
 
 PROVIDER_ID = "550e8400-e29b-41d4-a716-446655440000"
 FILE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
@@ -76,6 +77,119 @@ class TestFilesList:
             await client.files.list(PROVIDER_ID)
 
 
+@pytest.mark.asyncio
+class TestFilesListRaw:
+    @respx.mock
+    async def test_returns_parsed_items(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        file_page_payload: dict,
+        file_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/files").mock(return_value=Response(200, json=file_page_payload))
+
+        page = await client.files.list(PROVIDER_ID, raw=True)
+
+        assert isinstance(page, RawPage)
+        assert page.data == [file_payload]
+        assert page.total_elements == 1
+        assert page.has_next is False
+
+    @respx.mock
+    async def test_projects_fields_on_records(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        file_payload: dict,
+    ) -> None:
+        file_payload["providerId"] = {"id": PROVIDER_ID}
+        file_payload["lastIndexationInfos"] = {"status": "SUCCESS"}
+        respx.get(f"{base_url}/api/core/files").mock(
+            return_value=Response(200, json={"data": [file_payload], "totalPages": 1, "hasNext": False})
+        )
+
+        page = await client.files.list(
+            PROVIDER_ID, fields=["id", "name", "provider_id", "last_indexation_infos.status", "size"]
+        )
+
+        record = page.data[0]
+        assert record.id == {"id": FILE_ID, "entityType": "FILE"}
+        assert record.name == "report.pdf"
+        assert record.provider_id == {"id": PROVIDER_ID}
+        assert record.last_indexation_infos_status == "SUCCESS"
+        assert record.size is None
+        assert not hasattr(record, "__dict__")
+
+    async def test_rejects_unknown_fields(self, client: BiolevateClient) -> None:
+        with pytest.raises(ValueError, match="Unknown field 'last_indexation_infos.color'"):
+            await client.files.list(PROVIDER_ID, fields=["last_indexation_infos.color"])
+
+    @respx.mock
+    async def test_raises_authentication_error_on_401(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/files").mock(return_value=Response(401, json={"error": "Unauthorized"}))
+
+        with pytest.raises(AuthenticationError):
+            await client.files.list(PROVIDER_ID, raw=True)
+
+    @respx.mock
+    async def test_iter_yields_records_across_pages(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        file_payload: dict,
+    ) -> None:
+        def page_response(request: httpx.Request) -> Response:
+            page = int(request.url.params["page"])
+            return Response(200, json={"data": [file_payload] * 2, "totalPages": 2, "hasNext": page < 1})
+
+        respx.get(f"{base_url}/api/core/files").mock(side_effect=page_response)
+
+        names = [record.name async for record in client.files.iter(PROVIDER_ID, page_size=2, fields=["name"])]
+
+        assert names == ["report.pdf"] * 4
+
+
+@pytest.mark.asyncio
+class TestFilesIter:
+    @respx.mock
+    async def test_yields_items_across_pages(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        file_payload: dict,
+    ) -> None:
+        def page_response(request: httpx.Request) -> Response:
+            page = int(request.url.params["page"])
+            return Response(
+                200,
+                json={"data": [file_payload] * 2, "totalPages": 3, "totalElements": 6, "hasNext": page < 2},
+            )
+
+        route = respx.get(f"{base_url}/api/core/files").mock(side_effect=page_response)
+
+        items = [item async for item in client.files.iter(PROVIDER_ID, page_size=2)]
+
+        assert len(items) == 6
+        assert sorted(int(c.request.url.params["page"]) for c in route.calls) == [0, 1, 2]
+
+    @respx.mock
+    async def test_raises_authentication_error_on_401(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/files").mock(return_value=Response(401))
+
+        with pytest.raises(AuthenticationError):
+            async for _ in client.files.iter(PROVIDER_ID, page_size=2):
+                pass
+
+
 @pytest.mark.asyncio
 class TestFilesCreate:
     @respx.mock
@@ -472,3 +586,104 @@ class TestFilesRecomputeOntologies:
             await client.files.recompute_ontologies(FILE_ID)
 
         assert exc_info.value.status_code == 500
+
+
+def _indexed_file(file_id: str, status: str, error: str | None = None) -> dict:
+    return {
+        "id": {"id": file_id, "entityType": "FILE"},
+        "lastIndexationInfos": {"status": status, "errorMessage": error},
+    }
+
+
+@pytest.mark.asyncio
+class TestFilesWaitIndexed:
+    @respx.mock
+    async def test_checks_many_files_through_the_listing(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        ids = [f"00000000-0000-4000-8000-{index:012d}" for index in range(4)]
+        listing = respx.get(f"{base_url}/api/core/files").mock(
+            side_effect=[
+                Response(
+                    200,
+                    json={
+                        "data": [
+                            _indexed_file(ids[0], "RUNNING"),
+                            _indexed_file(ids[1], "SUCCESS"),
+                            _indexed_file(ids[2], "FAILED", "Unsupported format"),
+                            _indexed_file(ids[3], "PENDING"),
+                        ],
+                        "hasNext": False,
+                    },
+                ),
+                Response(
+                    200,
+                    json={
+                        "data": [_indexed_file(ids[3], "SUCCESS"), _indexed_file(ids[0], "SUCCESS")],
+                        "hasNext": False,
+                    },
+                ),
+            ]
+        )
+        single = respx.get(url__regex=rf"{base_url}/api/core/files/.+")
+
+        result = await client.files.wait_indexed(ids, provider_id=PROVIDER_ID, poll_interval=0.001)
+
+        assert result.ready == {ids[0], ids[1], ids[3]}
+        assert result.failed == {ids[2]}
+        assert result.errors == {ids[2]: "Unsupported format"}
+        assert not result.pending
+        assert listing.call_count == 2
+        assert listing.calls[0].request.url.params["sortOrder"] == "desc"
+        assert not single.called
+
+    @respx.mock
+    async def test_falls_back_to_single_requests_for_files_missing_from_listing(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        other = "00000000-0000-4000-8000-000000000009"
+        respx.get(f"{base_url}/api/core/files").mock(
+            return_value=Response(200, json={"data": [_indexed_file(other, "SUCCESS")], "hasNext": False})
+        )
+        single = respx.get(f"{base_url}/api/core/files/{FILE_ID}").mock(
+            return_value=Response(200, json=_indexed_file(FILE_ID, "SUCCESS"))
+        )
+        missing = respx.get(f"{base_url}/api/core/files/{other.replace('9', '8')}").mock(return_value=Response(404))
+
+        result = await client.files.wait_indexed(
+            [FILE_ID, other.replace("9", "8"), other], provider_id=PROVIDER_ID, poll_interval=0.001
+        )
+
+        assert result.ready == {FILE_ID, other}
+        assert result.failed == {other.replace("9", "8")}
+        assert single.call_count == 1
+        assert missing.call_count == 1
+
+    @respx.mock
+    async def test_returns_pending_files_on_timeout(self, client: BiolevateClient, base_url: str) -> None:
+        respx.get(f"{base_url}/api/core/files/{FILE_ID}").mock(
+            return_value=Response(200, json=_indexed_file(FILE_ID, "PENDING"))
+        )
+
+        result = await client.files.wait_indexed([FILE_ID], timeout=0.01, poll_interval=0.001)
+
+        assert result.pending == {FILE_ID}
+        assert not result.all_ready
+
+    @respx.mock
+    async def test_treats_indexed_flag_as_ready(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        file_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/files/{FILE_ID}").mock(return_value=Response(200, json=file_payload))
+
+        result = await client.files.wait_indexed([FILE_ID])
+
+        assert result.all_ready
+        assert result.ready == {FILE_ID}
@@ -0,0 +1,72 @@
+"""Import-time regression tests: importing the SDK must only load what is used."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import biolevate
+import biolevate.models
+
+BENCHMARK = Path(__file__).parents[2] / "benchmarks" / "import_time.py"
+
+HEAVY_MODULES = {"pydantic", "httpx", "dateutil", "biolevate_client.api_client", "biolevate.client"}
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    """Return the modules loaded by a statement run in a fresh interpreter."""
+    code = f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return set(json.loads(output))
+
+
+class TestLazyImports:
+    def test_import_loads_no_dependency(self) -> None:
+        modules = _loaded_modules("import biolevate")
+
+        assert not modules & HEAVY_MODULES
+        assert not any(module.startswith("biolevate_client.models.") for module in modules)
+
+    def test_model_access_loads_only_that_model(self) -> None:
+        modules = _loaded_modules("from biolevate import File")
+
+        assert "biolevate_client.models.elise_file_info" in modules
+        assert "biolevate_client.models.elise_annotation" not in modules
+        assert "biolevate_client.api_client" not in modules
+
+    def test_client_import_loads_no_model(self) -> None:
+        modules = _loaded_modules("from biolevate import BiolevateClient")
+
+        assert "biolevate.client" in modules
+        assert "pydantic" not in modules
+        assert not any(module.startswith("biolevate_client.models.") for module in modules)
+
+    def test_every_public_name_resolves(self) -> None:
+        for name in biolevate.__all__:
+            assert getattr(biolevate, name) is not None
+        for name in biolevate.models.__all__:
+            assert getattr(biolevate.models, name) is not None
+        assert set(biolevate.__all__) <= set(dir(biolevate))
+
+    def test_aliases_are_the_generated_models(self) -> None:
+        from biolevate_client.models import EliseFileInfo
+
+        assert biolevate.File is EliseFileInfo
+        assert biolevate.models.File is EliseFileInfo
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        with pytest.raises(AttributeError):
+            _ = biolevate.NotAName
+        with pytest.raises(AttributeError):
+            _ = biolevate.models.NotAName
+
+
+class TestImportTime:
+    def test_imports_stay_within_their_budget(self) -> None:
+        result = subprocess.run(
+            [sys.executable, str(BENCHMARK), "--runs", "5"], check=False, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
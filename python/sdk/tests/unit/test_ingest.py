@@ -0,0 +1,243 @@
+"""Unit tests for the IngestPipeline."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from biolevate import APIError, BiolevateClient, IndexationError, WaitTimeoutError
+from biolevate.pipelines import IngestPipeline
+
+PROVIDER_ID = "550e8400-e29b-41d4-a716-446655440000"
+COLLECTION_ID = "c0113c71-0000-4000-8000-000000000001"
+FILE_IDS = {
+    name: f"f11e0000-0000-4000-8000-{index:012d}"
+    for index, name in enumerate(["a", "b", "ok", "broken", "rejected", "slow"])
+}
+
+
+def _file(file_id: str, status: str | None) -> dict:
+    payload = {"id": {"id": file_id, "entityType": "FILE"}, "name": file_id}
+    if status is not None:
+        payload["lastIndexationInfos"] = {
+            "status": status,
+            "errorMessage": "OCR failed" if status == "FAILED" else None,
+        }
+    return payload
+
+
+def _mock_api(base_url: str, statuses: dict[str, list[str]]) -> dict[str, respx.Route]:
+    """Mock upload, file creation and indexation; ``statuses`` maps file names to successive indexation statuses."""
+    created: list[str] = []
+
+    def status(file_id: str) -> str:
+        sequence = statuses[next(name for name, id_ in FILE_IDS.items() if id_ == file_id)]
+        return sequence.pop(0) if len(sequence) > 1 else sequence[0]
+
+    def upload_url(request):
+        key = json.loads(request.content)["key"]
+        return Response(200, json={"url": f"https://storage.test/{key}", "supported": True})
+
+    def confirm(request):
+        return Response(
+            200, json={"providerId": PROVIDER_ID, "key": json.loads(request.content)["key"], "type": "FILE"}
+        )
+
+    def create(request):
+        name = json.loads(request.content)["key"].rpartition("/")[2].removesuffix(".pdf")
+        created.append(FILE_IDS[name])
+        return Response(201, json=_file(FILE_IDS[name], "PENDING"))
+
+    def get(_request, file_id):
+        return Response(200, json=_file(file_id, status(file_id)))
+
+    def listing(_request):
+        data = [_file(file_id, status(file_id)) for file_id in reversed(created)]
+        return Response(200, json={"data": data, "totalPages": 1, "hasNext": False})
+
+    respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/upload-url").mock(side_effect=upload_url)
+    respx.put(url__startswith="https://storage.test/").mock(return_value=Response(200))
+    respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/confirm").mock(side_effect=confirm)
+    return {
+        "create": respx.post(f"{base_url}/api/core/files").mock(side_effect=create),
+        "get": respx.get(url__regex=rf"{base_url}/api/core/files/(?P<file_id>[^/]+)$").mock(side_effect=get),
+        "list": respx.get(f"{base_url}/api/core/files").mock(side_effect=listing),
+        "collection": respx.post(f"{base_url}/api/core/collections/{COLLECTION_ID}/files").mock(
+            return_value=Response(204)
+        ),
+    }
+
+
+def _write(tmp_path, *names: str) -> list:
+    paths = []
+    for name in names:
+        path = tmp_path / name
+        path.write_bytes(b"%PDF")
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.asyncio
+class TestIngestPipeline:
+    @respx.mock
+    async def test_uploads_indexes_and_collects_every_file(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        routes = _mock_api(base_url, {"a": ["RUNNING", "SUCCESS"], "b": ["SUCCESS"]})
+        pipeline = IngestPipeline(client, PROVIDER_ID, collection_id=COLLECTION_ID, poll_interval=0.001)
+
+        report = await pipeline.run(_write(tmp_path, "a.pdf", "b.pdf"), prefix="papers")
+
+        assert report.succeeded
+        assert report.file_ids == {"papers/a.pdf": FILE_IDS["a"], "papers/b.pdf": FILE_IDS["b"]}
+        added = sorted(json.loads(call.request.content)["fileId"] for call in routes["collection"].calls)
+        assert added == [FILE_IDS["a"], FILE_IDS["b"]]
+
+    @respx.mock
+    async def test_reports_failures_with_their_stage(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        respx.put("https://storage.test/rejected.pdf").mock(return_value=Response(500))
+        routes = _mock_api(base_url, {"ok": ["SUCCESS"], "broken": ["FAILED"]})
+        pipeline = IngestPipeline(client, PROVIDER_ID, collection_id=COLLECTION_ID, poll_interval=0.001)
+
+        report = await pipeline.run(_write(tmp_path, "ok.pdf", "broken.pdf", "rejected.pdf"))
+
+        assert report.file_ids == {"ok.pdf": FILE_IDS["ok"]}
+        failures = {failure.key: failure for failure in report.failures}
+        assert failures["rejected.pdf"].stage == "upload"
+        assert isinstance(failures["rejected.pdf"].error, APIError)
+        assert failures["broken.pdf"].stage == "index"
+        assert isinstance(failures["broken.pdf"].error, IndexationError)
+        assert failures["broken.pdf"].error.message == "OCR failed"
+        assert routes["collection"].call_count == 1
+
+    @respx.mock
+    async def test_reports_connection_errors_as_failures_of_their_stage(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        routes = _mock_api(base_url, {"a": ["SUCCESS"], "b": ["SUCCESS"]})
+        create = routes["create"].side_effect
+
+        def create_or_fail(request):
+            if b"a.pdf" in request.content:
+                raise httpx.ConnectError("connection reset")
+            return create(request)
+
+        routes["create"].side_effect = create_or_fail
+        pipeline = IngestPipeline(client, PROVIDER_ID, collection_id=COLLECTION_ID, upload_concurrency=1)
+
+        report = await pipeline.run(_write(tmp_path, "a.pdf", "b.pdf"))
+
+        assert report.file_ids == {"b.pdf": FILE_IDS["b"]}
+        assert report.failures[0].key == "a.pdf"
+        assert report.failures[0].stage == "upload"
+        assert isinstance(report.failures[0].error, httpx.ConnectError)
+
+    @respx.mock
+    async def test_unexpected_errors_stop_the_other_workers_of_the_stage(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        routes = _mock_api(base_url, {"a": ["SUCCESS"], "b": ["SUCCESS"]})
+        create = routes["create"].side_effect
+        created = []
+
+        async def create_or_crash(request):
+            if b"a.pdf" in request.content:
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.05)
+            created.append(request)
+            return create(request)
+
+        routes["create"].side_effect = create_or_crash
+        pipeline = IngestPipeline(client, PROVIDER_ID, upload_concurrency=2)
+
+        with pytest.raises(RuntimeError):
+            await pipeline.run(_write(tmp_path, "a.pdf", "b.pdf"))
+        await asyncio.sleep(0.1)
+
+        assert created == []
+
+    @respx.mock
+    async def test_checks_waiting_files_together(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        names = ["a", "b", "ok", "slow"]
+        routes = _mock_api(base_url, {name: ["RUNNING", "RUNNING", "SUCCESS"] for name in names})
+        pipeline = IngestPipeline(client, PROVIDER_ID, poll_interval=0.001)
+
+        report = await pipeline.run(_write(tmp_path, *(f"{name}.pdf" for name in names)))
+
+        assert report.succeeded
+        assert routes["list"].called
+        # Polling each file on its own takes three requests per file.
+        assert routes["list"].call_count + routes["get"].call_count < 3 * len(names)
+
+    @respx.mock
+    async def test_stops_after_indexation_without_collection(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        routes = _mock_api(base_url, {"a": ["SUCCESS"]})
+        pipeline = IngestPipeline(client, PROVIDER_ID)
+
+        results = [result async for result in pipeline.stream(_write(tmp_path, "a.pdf"))]
+
+        assert [result.file_id for result in results] == [FILE_IDS["a"]]
+        assert not routes["collection"].called
+
+    @respx.mock
+    async def test_times_out_waiting_for_indexation(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        tmp_path,
+    ) -> None:
+        _mock_api(base_url, {"slow": ["RUNNING"]})
+        pipeline = IngestPipeline(client, PROVIDER_ID, index_timeout=0.01, poll_interval=0.001)
+
+        report = await pipeline.run(_write(tmp_path, "slow.pdf"))
+
+        assert report.failures[0].stage == "index"
+        assert isinstance(report.failures[0].error, WaitTimeoutError)
+        assert report.failures[0].file_id == FILE_IDS["slow"]
+
+    @respx.mock
+    async def test_polls_indexation_past_the_metadata_cache(
+        self,
+        base_url: str,
+        token: str,
+        tmp_path,
+    ) -> None:
+        routes = _mock_api(base_url, {"a": ["PENDING", "SUCCESS"]})
+        client = BiolevateClient(base_url=base_url, token=token, cache=True)
+        pipeline = IngestPipeline(client, PROVIDER_ID, index_timeout=2, poll_interval=0.001)
+
+        report = await pipeline.run(_write(tmp_path, "a.pdf"))
+
+        assert report.succeeded
+        assert routes["get"].call_count == 2
+
+    async def test_rejects_invalid_concurrency(self, client: BiolevateClient) -> None:
+        with pytest.raises(ValueError):
+            IngestPipeline(client, PROVIDER_ID, index_concurrency=0)
@@ -0,0 +1,178 @@
+"""Unit tests for the JobWatcher pipeline."""
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+from pydantic import ValidationError
+
+from biolevate import BiolevateClient, NotFoundError
+from biolevate.pipelines import JobWatcher
+
+JOB_A = "f47ac10b-58cc-4372-a567-0e02b2c3d479"
+JOB_B = "0b1c2d3e-4f50-6172-8394-a5b6c7d8e9f0"
+
+
+def _fast_watcher(client: BiolevateClient, **kwargs) -> JobWatcher:
+    options = {
+        "max_requests_per_second": 1000,
+        "min_interval": 0.001,
+        "max_interval": 0.01,
+        "expected_duration": 0.001,
+    }
+    options.update(kwargs)
+    return JobWatcher(client, **options)
+
+
+@pytest.mark.asyncio
+class TestJobWatcher:
+    @respx.mock
+    async def test_yields_completions_for_extraction_and_qa_jobs(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_A}").mock(
+            side_effect=[
+                Response(200, json={**job_payload, "jobId": JOB_A, "status": "RUNNING"}),
+                Response(200, json={**job_payload, "jobId": JOB_A, "status": "SUCCESS"}),
+            ]
+        )
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_B}").mock(
+            return_value=Response(200, json={**job_payload, "jobId": JOB_B, "status": "FAILED"})
+        )
+
+        async with _fast_watcher(client) as watcher:
+            watcher.watch(JOB_A, "extraction")
+            watcher.watch(JOB_B, "qa")
+            completions = {c.job_id: c async for c in watcher.completions()}
+
+        assert completions[JOB_A].succeeded
+        assert completions[JOB_A].polls == 2
+        assert completions[JOB_B].job is not None
+        assert completions[JOB_B].job.status == "FAILED"
+        assert watcher.requests == 3
+        assert watcher.pending == 0
+
+    @respx.mock
+    async def test_ignores_duplicate_watch(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_A}").mock(
+            return_value=Response(200, json=job_payload)
+        )
+
+        async with _fast_watcher(client) as watcher:
+            watcher.watch(JOB_A, "extraction")
+            watcher.watch(JOB_A, "extraction")
+            completions = [c async for c in watcher.completions()]
+
+        assert len(completions) == 1
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_reports_missing_job_as_error(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_A}").mock(return_value=Response(404))
+
+        async with _fast_watcher(client) as watcher:
+            watcher.watch(JOB_A, "qa")
+            completions = [c async for c in watcher.completions()]
+
+        assert isinstance(completions[0].error, NotFoundError)
+        assert not completions[0].succeeded
+
+    @respx.mock
+    async def test_retries_transient_errors_then_gives_up(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/qa/jobs/{JOB_A}").mock(return_value=Response(503))
+
+        async with _fast_watcher(client, max_failures=2) as watcher:
+            watcher.watch(JOB_A, "qa")
+            completions = [c async for c in watcher.completions()]
+
+        assert completions[0].error is not None
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_retries_connection_errors(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_A}").mock(
+            side_effect=[httpx.ConnectError("refused"), Response(200, json=job_payload)]
+        )
+
+        async with _fast_watcher(client) as watcher:
+            watcher.watch(JOB_A, "qa")
+            completions = [c async for c in watcher.completions()]
+
+        assert completions[0].succeeded
+        assert completions[0].polls == 2
+
+    @respx.mock
+    async def test_reports_unexpected_errors_and_ends(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_A}").mock(
+            return_value=Response(200, json={**job_payload, "status": "UNKNOWN_STATUS"})
+        )
+
+        async with _fast_watcher(client) as watcher:
+            watcher.watch(JOB_A, "qa")
+            completions = [c async for c in watcher.completions()]
+
+        assert isinstance(completions[0].error, ValidationError)
+        assert not completions[0].succeeded
+
+    @respx.mock
+    async def test_checks_many_jobs_through_the_listing(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        recent = [f"00000000-0000-4000-8000-{index:012d}" for index in range(10)]
+        statuses = iter(["RUNNING", "SUCCESS"])
+
+        def listing(request):
+            assert request.url.params["sortProperty"] == "createdTime"
+            status = next(statuses)
+            data = [{**job_payload, "jobId": job_id, "status": status} for job_id in recent]
+            return Response(200, json={"data": data, "totalPages": 1, "hasNext": False})
+
+        pages = respx.get(f"{base_url}/api/core/extraction/jobs").mock(side_effect=listing)
+        old = respx.get(f"{base_url}/api/core/extraction/jobs/{JOB_A}").mock(
+            return_value=Response(200, json={**job_payload, "jobId": JOB_A})
+        )
+
+        async with _fast_watcher(client) as watcher:
+            for job_id in [*recent, JOB_A]:
+                watcher.watch(job_id, "extraction")
+            completions = {c.job_id: c async for c in watcher.completions()}
+
+        assert all(completion.succeeded for completion in completions.values())
+        assert completions[recent[0]].polls == 2
+        assert pages.call_count == 2
+        assert old.call_count == 1
+        # Polling each job on its own takes 21 requests.
+        assert watcher.requests == 3
+
+    async def test_rejects_invalid_rate(self, client: BiolevateClient) -> None:
+        with pytest.raises(ValueError):
+            JobWatcher(client, max_requests_per_second=0)
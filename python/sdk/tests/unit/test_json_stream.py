@@ -0,0 +1,82 @@
+"""Unit tests for the incremental JSON array parser."""
+
+import json
+
+import httpx
+import pytest
+
+from biolevate._json_stream import JSONArrayParser, iter_json_array
+from biolevate_client.exceptions import NotFoundException
+
+
+def _parse(chunks: list[bytes]) -> list:
+    parser = JSONArrayParser()
+    elements = [element for chunk in chunks for element in parser.feed(chunk)]
+    return elements + list(parser.close())
+
+
+class TestJSONArrayParser:
+    def test_parses_whole_document(self) -> None:
+        assert _parse([b'[{"a": 1}, [2, 3], "x", 4.5, true, null]']) == [{"a": 1}, [2, 3], "x", 4.5, True, None]
+
+    def test_parses_empty_array(self) -> None:
+        assert _parse([b" [ ] \n"]) == []
+
+    def test_parses_document_split_at_every_byte(self) -> None:
+        elements = [{"name": "résumé — 1", "values": [1, 2]}, 12345, "a,b]", -0.5e3, False]
+        body = json.dumps(elements, ensure_ascii=False).encode()
+
+        assert _parse([body[i : i + 1] for i in range(len(body))]) == elements
+
+    def test_yields_elements_as_they_complete(self) -> None:
+        parser = JSONArrayParser()
+
+        assert list(parser.feed(b'[{"a": 1}, {"b"')) == [{"a": 1}]
+        assert list(parser.feed(b": 2}, 3")) == [{"b": 2}]
+        assert list(parser.feed(b"]")) == [3]
+        assert list(parser.close()) == []
+
+    def test_keeps_only_the_pending_element(self) -> None:
+        parser = JSONArrayParser()
+        list(parser.feed(b'[{"a": 1}, {"b": 2}, {"c"'))
+
+        assert parser._buffer == '{"c"'
+
+    def test_rejects_non_array(self) -> None:
+        with pytest.raises(ValueError, match="Expected a JSON array"):
+            _parse([b'{"data": []}'])
+
+    def test_rejects_missing_separator(self) -> None:
+        with pytest.raises(ValueError, match="Expected ','"):
+            _parse([b"[1 2]"])
+
+    def test_rejects_invalid_element(self) -> None:
+        with pytest.raises(ValueError):
+            _parse([b"[1, nope]"])
+
+    def test_rejects_truncated_array(self) -> None:
+        with pytest.raises(ValueError, match="Truncated"):
+            _parse([b'[{"a": 1}, {"b": 2}'])
+
+    def test_rejects_trailing_data(self) -> None:
+        with pytest.raises(ValueError, match="Unexpected data"):
+            _parse([b"[1] 2"])
+
+
+@pytest.mark.asyncio
+class TestIterJSONArray:
+    async def test_yields_elements_of_streamed_response(self) -> None:
+        async def chunks():
+            yield b'[{"a": 1}, {'
+            yield b'"b": 2}]'
+
+        response = httpx.Response(200, content=chunks())
+
+        assert [element async for element in iter_json_array(response)] == [{"a": 1}, {"b": 2}]
+
+    async def test_raises_api_exception_on_error_status(self) -> None:
+        response = httpx.Response(404, content=b'{"error": "Not found"}')
+
+        with pytest.raises(NotFoundException):
+            async for _ in iter_json_array(response):
+                pass
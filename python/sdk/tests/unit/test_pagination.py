@@ -0,0 +1,92 @@
+"""Unit tests for the page prefetching helper."""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from biolevate._pagination import iterate_pages
+
+
+@dataclass
+class FakePage:
+    data: list[int] = field(default_factory=list)
+    total_pages: int | None = None
+    has_next: bool | None = None
+
+
+def make_fetcher(pages: int, per_page: int = 3, total_pages: int | None = None):
+    requested: list[int] = []
+
+    async def fetch(page: int) -> FakePage:
+        requested.append(page)
+        await asyncio.sleep(0)
+        start = page * per_page
+        return FakePage(
+            data=list(range(start, start + per_page)) if page < pages else [],
+            total_pages=total_pages,
+            has_next=page < pages - 1,
+        )
+
+    return fetch, requested
+
+
+@pytest.mark.asyncio
+class TestIteratePages:
+    async def test_yields_items_in_page_order(self) -> None:
+        fetch, _ = make_fetcher(pages=4)
+
+        items = [item async for item in iterate_pages(fetch, concurrency=3)]
+
+        assert items == list(range(12))
+
+    async def test_stops_on_has_next_false(self) -> None:
+        fetch, requested = make_fetcher(pages=1)
+
+        items = [item async for item in iterate_pages(fetch)]
+
+        assert items == [0, 1, 2]
+        assert requested == [0]
+
+    async def test_prefetches_next_page_while_consuming(self) -> None:
+        fetch, requested = make_fetcher(pages=5)
+        iterator = iterate_pages(fetch, concurrency=2)
+
+        assert await anext(iterator) == 0
+        await asyncio.sleep(0)
+
+        assert requested == [0, 1, 2]
+        await iterator.aclose()
+
+    async def test_does_not_request_past_total_pages(self) -> None:
+        fetch, requested = make_fetcher(pages=2, total_pages=2)
+
+        items = [item async for item in iterate_pages(fetch, concurrency=8)]
+
+        assert len(items) == 6
+        assert requested == [0, 1]
+
+    async def test_starts_at_given_page(self) -> None:
+        fetch, requested = make_fetcher(pages=3)
+
+        items = [item async for item in iterate_pages(fetch, start_page=2)]
+
+        assert items == [6, 7, 8]
+        assert requested == [2]
+
+    async def test_propagates_fetch_errors(self) -> None:
+        async def fetch(page: int) -> FakePage:
+            if page == 1:
+                raise RuntimeError("boom")
+            return FakePage(data=[page], has_next=True)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            async for _ in iterate_pages(fetch, concurrency=1):
+                pass
+
+    async def test_rejects_invalid_concurrency(self) -> None:
+        fetch, _ = make_fetcher(pages=1)
+
+        with pytest.raises(ValueError):
+            async for _ in iterate_pages(fetch, concurrency=0):
+                pass
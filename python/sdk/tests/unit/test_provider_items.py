@@ -1,12 +1,14 @@
 """Unit tests for ProviderItemsResource."""
 
 import io
+import json
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from biolevate import APIError, AuthenticationError, BiolevateClient, NotFoundError
+from biolevate import APIError, AuthenticationError, BiolevateClient, NotFoundError, RawItemsPage
 
 PROVIDER_ID = "550e8400-e29b-41d4-a716-446655440000"
 
@@ -83,6 +85,170 @@ class TestProviderItemsList:
         with pytest.raises(AuthenticationError):
             await client.items.list(PROVIDER_ID)
 
+    @respx.mock
+    async def test_sends_cursor_and_limit_params(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        list_items_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(200, json=list_items_payload)
+        )
+
+        await client.items.list(PROVIDER_ID, key="documents/", cursor="abc", limit=50)
+
+        params = route.calls.last.request.url.params
+        assert params["cursor"] == "abc"
+        assert params["limit"] == "50"
+
+
+def _item(key: str, item_type: str = "FILE") -> dict:
+    return {"providerId": PROVIDER_ID, "key": key, "type": item_type}
+
+
+@pytest.mark.asyncio
+class TestProviderItemsIter:
+    @respx.mock
+    async def test_follows_next_cursor(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        def listing(request: httpx.Request) -> Response:
+            if request.url.params.get("cursor") == "page-2":
+                return Response(200, json={"items": [_item("docs/c.pdf")], "nextCursor": None})
+            return Response(200, json={"items": [_item("docs/a.pdf"), _item("docs/b.pdf")], "nextCursor": "page-2"})
+
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(side_effect=listing)
+
+        keys = [item.key async for item in client.items.iter(PROVIDER_ID, key="docs/")]
+
+        assert keys == ["docs/a.pdf", "docs/b.pdf", "docs/c.pdf"]
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_does_not_descend_into_folders_by_default(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(200, json={"items": [_item("docs/", "FOLDER"), _item("a.pdf")]})
+        )
+
+        keys = [item.key async for item in client.items.iter(PROVIDER_ID)]
+
+        assert keys == ["docs/", "a.pdf"]
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_recursive_traversal_lists_sub_folders(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        tree = {
+            "/": [_item("docs/", "FOLDER"), _item("root.pdf")],
+            "docs/": [_item("docs/2024/", "FOLDER"), _item("docs/a.pdf")],
+            "docs/2024/": [_item("docs/2024/b.pdf")],
+        }
+
+        def listing(request: httpx.Request) -> Response:
+            return Response(200, json={"items": tree[request.url.params["key"]]})
+
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(side_effect=listing)
+
+        keys = {item.key async for item in client.items.iter(PROVIDER_ID, recursive=True, concurrency=2)}
+
+        assert keys == {"docs/", "root.pdf", "docs/2024/", "docs/a.pdf", "docs/2024/b.pdf"}
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_raises_not_found_on_404(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(return_value=Response(404))
+
+        with pytest.raises(NotFoundError):
+            async for _ in client.items.iter(PROVIDER_ID, key="missing/"):
+                pass
+
+    async def test_rejects_invalid_concurrency(self, client: BiolevateClient) -> None:
+        with pytest.raises(ValueError):
+            async for _ in client.items.iter(PROVIDER_ID, concurrency=0):
+                pass
+
+
+@pytest.mark.asyncio
+class TestProviderItemsRaw:
+    @respx.mock
+    async def test_list_returns_parsed_items(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_item_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(200, json={"items": [provider_item_payload], "nextCursor": "page-2"})
+        )
+
+        page = await client.items.list(PROVIDER_ID, raw=True)
+
+        assert isinstance(page, RawItemsPage)
+        assert page.items == [provider_item_payload]
+        assert page.next_cursor == "page-2"
+
+    @respx.mock
+    async def test_list_projects_fields(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_item_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(200, json={"items": [provider_item_payload]})
+        )
+
+        page = await client.items.list(PROVIDER_ID, fields=["key", "provider_id", "lastModified"])
+
+        assert page.items[0] == ("documents/report.pdf", PROVIDER_ID, None)
+        assert page.items[0].provider_id == PROVIDER_ID
+
+    @respx.mock
+    async def test_iter_recursive_traversal_yields_records(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        tree = {
+            "/": [_item("docs/", "FOLDER"), _item("root.pdf")],
+            "docs/": [_item("docs/a.pdf")],
+        }
+
+        def listing(request: httpx.Request) -> Response:
+            return Response(200, json={"items": tree[request.url.params["key"]]})
+
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(side_effect=listing)
+
+        records = [record async for record in client.items.iter(PROVIDER_ID, recursive=True, fields=["key"])]
+
+        assert {record.key for record in records} == {"docs/", "root.pdf", "docs/a.pdf"}
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_raises_not_found_on_404(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(return_value=Response(404))
+
+        with pytest.raises(NotFoundError):
+            await client.items.list(PROVIDER_ID, key="missing/", raw=True)
+
 
 @pytest.mark.asyncio
 class TestProviderItemsUpload:
@@ -103,6 +269,43 @@ class TestProviderItemsUpload:
         assert item.key == "documents/report.pdf"
         assert item.type == "FILE"
 
+    @respx.mock
+    async def test_sends_key_and_auth_header(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        token: str,
+        provider_item_payload: dict,
+    ) -> None:
+        route = respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(201, json=provider_item_payload)
+        )
+
+        await client.items.upload(PROVIDER_ID, key="documents/", file=io.BytesIO(b"x"), file_name="report.pdf")
+
+        request = route.calls.last.request
+        assert "key=documents" in str(request.url)
+        assert request.headers["Authorization"] == f"Bearer {token}"
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+
+    @respx.mock
+    async def test_reuses_pooled_http_client(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_item_payload: dict,
+    ) -> None:
+        respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(201, json=provider_item_payload)
+        )
+
+        await client.items.upload(PROVIDER_ID, key="/", file=io.BytesIO(b"a"), file_name="a.txt")
+        pool = client.items._client.rest_client.pool_manager
+        await client.items.upload(PROVIDER_ID, key="/", file=io.BytesIO(b"b"), file_name="b.txt")
+
+        assert pool is not None
+        assert client.items._client.rest_client.pool_manager is pool
+
     @respx.mock
     async def test_raises_authentication_error_on_401(
         self,
@@ -159,6 +362,21 @@ class TestProviderItemsCreateFolder:
 
         assert item.type == "FOLDER"
 
+    @respx.mock
+    async def test_sends_key_as_json_body(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_item_payload: dict,
+    ) -> None:
+        route = respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(201, json={**provider_item_payload, "type": "FOLDER"})
+        )
+
+        await client.items.create_folder(PROVIDER_ID, key="new-folder/")
+
+        assert json.loads(route.calls.last.request.content) == {"key": "new-folder/"}
+
     @respx.mock
     async def test_raises_not_found_on_404(
         self,
@@ -501,3 +719,253 @@ class TestProviderItemsConfirmUpload:
             await client.items.confirm_upload(PROVIDER_ID, key="x.pdf")
 
         assert exc_info.value.status_code == 500
+
+
+@pytest.mark.asyncio
+class TestProviderItemsUploadDirect:
+    @respx.mock
+    async def test_streams_file_to_presigned_url_and_confirms(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_item_payload: dict,
+        tmp_path,
+    ) -> None:
+        source = tmp_path / "report.pdf"
+        source.write_bytes(b"%PDF" * 1000)
+        upload_url = respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/upload-url").mock(
+            return_value=Response(
+                200,
+                json={
+                    "url": "https://bucket.s3.amazonaws.com/report.pdf?sig=x",
+                    "expiresInSeconds": 900,
+                    "supported": True,
+                },
+            )
+        )
+        storage = respx.put("https://bucket.s3.amazonaws.com/report.pdf").mock(return_value=Response(200))
+        confirm = respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/confirm").mock(
+            return_value=Response(200, json=provider_item_payload)
+        )
+
+        item = await client.items.upload_direct(PROVIDER_ID, "documents/report.pdf", source, chunk_size=512)
+
+        assert item.key == "documents/report.pdf"
+        assert json.loads(upload_url.calls.last.request.content) == {
+            "key": "documents/report.pdf",
+            "size": 4000,
+            "mediaType": "application/pdf",
+        }
+        request = storage.calls.last.request
+        assert request.content == b"%PDF" * 1000
+        assert request.headers["Content-Length"] == "4000"
+        assert "Authorization" not in request.headers
+        assert json.loads(confirm.calls.last.request.content) == {"key": "documents/report.pdf"}
+
+    @respx.mock
+    async def test_resolves_relative_proxy_url(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        token: str,
+        provider_item_payload: dict,
+    ) -> None:
+        respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/upload-url").mock(
+            return_value=Response(200, json={"url": "/api/storage/upload/abc", "supported": True})
+        )
+        storage = respx.put(f"{base_url}/api/storage/upload/abc").mock(return_value=Response(201))
+        respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/confirm").mock(
+            return_value=Response(200, json=provider_item_payload)
+        )
+
+        await client.items.upload_direct(PROVIDER_ID, "report.pdf", io.BytesIO(b"data"))
+
+        assert storage.calls.last.request.headers["Authorization"] == f"Bearer {token}"
+
+    @respx.mock
+    async def test_requests_fresh_url_when_about_to_expire(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_item_payload: dict,
+    ) -> None:
+        upload_url = respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/upload-url").mock(
+            side_effect=[
+                Response(200, json={"url": "https://storage.test/old", "expiresInSeconds": 1, "supported": True}),
+                Response(200, json={"url": "https://storage.test/new", "expiresInSeconds": 900, "supported": True}),
+            ]
+        )
+        storage = respx.put("https://storage.test/new").mock(return_value=Response(200))
+        respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/confirm").mock(
+            return_value=Response(200, json=provider_item_payload)
+        )
+
+        await client.items.upload_direct(PROVIDER_ID, "report.pdf", io.BytesIO(b"data"))
+
+        assert upload_url.call_count == 2
+        assert storage.called
+
+    @respx.mock
+    async def test_falls_back_to_proxied_upload_when_unsupported(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_item_payload: dict,
+    ) -> None:
+        respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/upload-url").mock(
+            return_value=Response(200, json={"url": None, "supported": False})
+        )
+        upload = respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items").mock(
+            return_value=Response(201, json=provider_item_payload)
+        )
+
+        item = await client.items.upload_direct(PROVIDER_ID, "documents/report.pdf", io.BytesIO(b"data"))
+
+        assert item.key == "documents/report.pdf"
+        request = upload.calls.last.request
+        assert request.url.params["key"] == "documents/"
+        assert b'filename="report.pdf"' in request.content
+
+    @respx.mock
+    async def test_uploads_directly_when_support_is_not_reported(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_item_payload: dict,
+    ) -> None:
+        respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/upload-url").mock(
+            return_value=Response(200, json={"url": "https://storage.test/obj"})
+        )
+        storage = respx.put("https://storage.test/obj").mock(return_value=Response(200))
+        upload = respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items")
+        respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/confirm").mock(
+            return_value=Response(200, json=provider_item_payload)
+        )
+
+        await client.items.upload_direct(PROVIDER_ID, "report.pdf", io.BytesIO(b"data"))
+
+        assert storage.called
+        assert not upload.called
+
+    @respx.mock
+    async def test_retries_once_with_fresh_url_when_storage_refuses_the_signature(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_item_payload: dict,
+    ) -> None:
+        upload_url = respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/upload-url").mock(
+            side_effect=[
+                Response(200, json={"url": "https://storage.test/expired", "supported": True}),
+                Response(200, json={"url": "https://storage.test/fresh", "supported": True}),
+            ]
+        )
+        respx.put("https://storage.test/expired").mock(return_value=Response(403, text="Request has expired"))
+        storage = respx.put("https://storage.test/fresh").mock(return_value=Response(200))
+        respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/confirm").mock(
+            return_value=Response(200, json=provider_item_payload)
+        )
+        source = io.BytesIO(b"skip" + b"data")
+        source.seek(4)
+
+        await client.items.upload_direct(PROVIDER_ID, "report.pdf", source)
+
+        assert upload_url.call_count == 2
+        assert storage.calls.last.request.content == b"data"
+
+    @respx.mock
+    async def test_raises_api_error_when_storage_rejects_upload(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/upload-url").mock(
+            return_value=Response(200, json={"url": "https://storage.test/obj", "supported": True})
+        )
+        respx.put("https://storage.test/obj").mock(return_value=Response(403, text="SignatureDoesNotMatch"))
+        confirm = respx.post(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/confirm")
+
+        with pytest.raises(APIError) as exc_info:
+            await client.items.upload_direct(PROVIDER_ID, "report.pdf", io.BytesIO(b"data"))
+
+        assert exc_info.value.status_code == 403
+        assert not confirm.called
+
+
+@pytest.mark.asyncio
+class TestProviderItemsDownload:
+    @respx.mock
+    async def test_streams_from_presigned_url(self, client: BiolevateClient, base_url: str) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/download-url").mock(
+            return_value=Response(200, json={"url": "https://storage.test/report.pdf?sig=x", "expiresInSeconds": 60})
+        )
+        storage = respx.get("https://storage.test/report.pdf").mock(return_value=Response(200, content=b"x" * 2500))
+        proxy = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/content")
+
+        chunks = [c async for c in client.items.iter_content(PROVIDER_ID, "report.pdf", chunk_size=1000)]
+
+        assert [len(c) for c in chunks] == [1000, 1000, 500]
+        assert "Authorization" not in storage.calls.last.request.headers
+        assert not proxy.called
+
+    @respx.mock
+    async def test_falls_back_to_content_endpoint(self, client: BiolevateClient, base_url: str, token: str) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/download-url").mock(return_value=Response(501))
+        proxy = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/content").mock(
+            return_value=Response(200, content=b"%PDF-1.7")
+        )
+
+        chunks = [c async for c in client.items.iter_content(PROVIDER_ID, "documents/report.pdf")]
+
+        assert b"".join(chunks) == b"%PDF-1.7"
+        request = proxy.calls.last.request
+        assert request.url.params["key"] == "documents/report.pdf"
+        assert request.headers["Authorization"] == f"Bearer {token}"
+
+    @respx.mock
+    async def test_skips_presigned_url_when_disabled(self, client: BiolevateClient, base_url: str) -> None:
+        presign = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/download-url")
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/content").mock(
+            return_value=Response(200, content=b"data")
+        )
+
+        chunks = [c async for c in client.items.iter_content(PROVIDER_ID, "report.pdf", presigned=False)]
+
+        assert chunks == [b"data"]
+        assert not presign.called
+
+    @respx.mock
+    async def test_writes_file_into_directory(self, client: BiolevateClient, base_url: str, tmp_path) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/download-url").mock(
+            return_value=Response(200, json={"url": "https://storage.test/obj"})
+        )
+        respx.get("https://storage.test/obj").mock(return_value=Response(200, content=b"abc" * 100))
+
+        path = await client.items.download(PROVIDER_ID, "documents/report.pdf", tmp_path, chunk_size=64)
+
+        assert path == tmp_path / "report.pdf"
+        assert path.read_bytes() == b"abc" * 100
+        assert not (tmp_path / "report.pdf.part").exists()
+
+    @respx.mock
+    async def test_leaves_no_file_when_download_fails(self, client: BiolevateClient, base_url: str, tmp_path) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/download-url").mock(
+            return_value=Response(200, json={"url": "https://storage.test/obj"})
+        )
+        respx.get("https://storage.test/obj").mock(return_value=Response(404))
+        target = tmp_path / "out.pdf"
+
+        with pytest.raises(NotFoundError):
+            await client.items.download(PROVIDER_ID, "ghost.pdf", target)
+
+        assert list(tmp_path.iterdir()) == []
+
+    @respx.mock
+    async def test_raises_api_error_on_storage_failure(self, client: BiolevateClient, base_url: str) -> None:
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}/items/content").mock(return_value=Response(500))
+
+        with pytest.raises(APIError) as exc_info:
+            async for _ in client.items.iter_content(PROVIDER_ID, "report.pdf", presigned=False):
+                pass
+
+        assert exc_info.value.status_code == 500
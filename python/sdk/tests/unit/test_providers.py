@@ -1,5 +1,6 @@
 """Unit tests for ProvidersResource."""
 
+import httpx
 import pytest
 import respx
 from httpx import Response
@@ -119,6 +120,42 @@ class TestProvidersList:
         assert exc_info.value.status_code == 500
 
 
+@pytest.mark.asyncio
+class TestProvidersIter:
+    @respx.mock
+    async def test_yields_items_across_pages(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        def page_response(request: httpx.Request) -> Response:
+            page = int(request.url.params["page"])
+            return Response(
+                200,
+                json={"data": [provider_payload] * 2, "totalPages": 3, "totalElements": 6, "hasNext": page < 2},
+            )
+
+        route = respx.get(f"{base_url}/api/core/providers").mock(side_effect=page_response)
+
+        items = [item async for item in client.providers.iter(page_size=2)]
+
+        assert len(items) == 6
+        assert sorted(int(c.request.url.params["page"]) for c in route.calls) == [0, 1, 2]
+
+    @respx.mock
+    async def test_raises_authentication_error_on_401(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/providers").mock(return_value=Response(401))
+
+        with pytest.raises(AuthenticationError):
+            async for _ in client.providers.iter(page_size=2):
+                pass
+
+
 @pytest.mark.asyncio
 class TestProvidersGet:
     @respx.mock
@@ -1,10 +1,11 @@
 """Unit tests for QuestionAnsweringResource."""
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from biolevate import APIError, AuthenticationError, BiolevateClient, NotFoundError
+from biolevate import APIError, AuthenticationError, BiolevateClient, NotFoundError, WaitTimeoutError
 
 JOB_ID = "f47ac10b-58cc-4372-a567-0e02b2c3d479"
 FILE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
@@ -68,6 +69,42 @@ class TestQAListJobs:
             await client.qa.list_jobs()
 
 
+@pytest.mark.asyncio
+class TestQAIterJobs:
+    @respx.mock
+    async def test_yields_items_across_pages(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        def page_response(request: httpx.Request) -> Response:
+            page = int(request.url.params["page"])
+            return Response(
+                200,
+                json={"data": [job_payload] * 2, "totalPages": 3, "totalElements": 6, "hasNext": page < 2},
+            )
+
+        route = respx.get(f"{base_url}/api/core/qa/jobs").mock(side_effect=page_response)
+
+        items = [item async for item in client.qa.iter_jobs(page_size=2)]
+
+        assert len(items) == 6
+        assert sorted(int(c.request.url.params["page"]) for c in route.calls) == [0, 1, 2]
+
+    @respx.mock
+    async def test_raises_authentication_error_on_401(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs").mock(return_value=Response(401))
+
+        with pytest.raises(AuthenticationError):
+            async for _ in client.qa.iter_jobs(page_size=2):
+                pass
+
+
 @pytest.mark.asyncio
 class TestQACreateJob:
     @respx.mock
@@ -196,6 +233,98 @@ class TestQAGetJob:
         assert exc_info.value.status_code == 500
 
 
+@pytest.mark.asyncio
+class TestQAWait:
+    @respx.mock
+    async def test_polls_until_terminal_status(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}").mock(
+            side_effect=[
+                Response(200, json={**job_payload, "status": "PENDING"}),
+                Response(200, json={**job_payload, "status": "RUNNING"}),
+                Response(200, json={**job_payload, "status": "SUCCESS"}),
+            ]
+        )
+
+        result = await client.qa.wait(JOB_ID, poll_interval=0.001)
+
+        assert result.succeeded
+        assert result.job.status == "SUCCESS"
+        assert result.outputs is None
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_fetches_outputs_and_annotations(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+        qa_job_outputs_payload: dict,
+        annotation_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}").mock(return_value=Response(200, json=job_payload))
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/results").mock(
+            return_value=Response(200, json=qa_job_outputs_payload)
+        )
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(200, json=[annotation_payload])
+        )
+
+        result = await client.qa.wait(JOB_ID, fetch_outputs=True, fetch_annotations=True)
+
+        assert result.outputs is not None
+        assert len(result.outputs.results) == 1
+        assert result.annotations is not None
+        assert len(result.annotations) == 1
+
+    @respx.mock
+    async def test_skips_outputs_for_failed_job(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}").mock(
+            return_value=Response(200, json={**job_payload, "status": "FAILED", "errorMessage": "boom"})
+        )
+        outputs_route = respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/results")
+
+        result = await client.qa.wait(JOB_ID, fetch_outputs=True)
+
+        assert not result.succeeded
+        assert result.job.error_message == "boom"
+        assert not outputs_route.called
+
+    @respx.mock
+    async def test_raises_wait_timeout_error(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}").mock(
+            return_value=Response(200, json={**job_payload, "status": "RUNNING"})
+        )
+
+        with pytest.raises(WaitTimeoutError):
+            await client.qa.wait(JOB_ID, timeout=0.05, poll_interval=0.01)
+
+    @respx.mock
+    async def test_raises_not_found_on_404(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}").mock(return_value=Response(404))
+
+        with pytest.raises(NotFoundError):
+            await client.qa.wait(JOB_ID)
+
+
 @pytest.mark.asyncio
 class TestQAGetJobInputs:
     @respx.mock
@@ -408,3 +537,79 @@ class TestQAGetJobAnnotations:
             await client.qa.get_job_annotations(JOB_ID)
 
         assert exc_info.value.status_code == 500
+
+
+@pytest.mark.asyncio
+class TestQAIterJobAnnotations:
+    @respx.mock
+    async def test_yields_annotations(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        annotation_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(200, json=[annotation_payload, {**annotation_payload, "status": "NOTVALID"}])
+        )
+
+        annotations = [annotation async for annotation in client.qa.iter_job_annotations(JOB_ID)]
+
+        assert [annotation.status for annotation in annotations] == ["VALID", "NOTVALID"]
+        assert annotations[0].data.actual_instance.document_name == "report.pdf"
+
+    @respx.mock
+    async def test_builds_trusted_models(
+        self,
+        base_url: str,
+        token: str,
+        annotation_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(200, json=[{**annotation_payload, "status": "ARCHIVED"}])
+        )
+        client = BiolevateClient(base_url=base_url, token=token, trusted_responses=True)
+
+        annotations = [annotation async for annotation in client.qa.iter_job_annotations(JOB_ID)]
+
+        assert annotations[0].status == "ARCHIVED"
+        assert annotations[0].data.actual_instance.document_name == "report.pdf"
+
+    @respx.mock
+    async def test_raises_not_found_on_404(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(
+            return_value=Response(404, json={"error": "Not found"})
+        )
+
+        with pytest.raises(NotFoundError):
+            async for _ in client.qa.iter_job_annotations(JOB_ID):
+                pass
+
+    @respx.mock
+    async def test_raises_authentication_error_on_401(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(return_value=Response(401))
+
+        with pytest.raises(AuthenticationError):
+            async for _ in client.qa.iter_job_annotations(JOB_ID):
+                pass
+
+    @respx.mock
+    async def test_raises_api_error_on_500(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/qa/jobs/{JOB_ID}/annotations").mock(return_value=Response(500))
+
+        with pytest.raises(APIError) as exc_info:
+            async for _ in client.qa.iter_job_annotations(JOB_ID):
+                pass
+
+        assert exc_info.value.status_code == 500
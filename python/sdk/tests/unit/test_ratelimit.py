@@ -0,0 +1,157 @@
+"""Unit tests for client-side rate limiting and adaptive concurrency."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from biolevate import AdaptiveConcurrency, BiolevateClient, RateLimit, RateLimiter
+from biolevate.ratelimit import endpoint_group
+
+BASE = "https://api.test.biolevate.com"
+
+
+class TestEndpointGroups:
+    @pytest.mark.parametrize(
+        ("path", "group"),
+        [
+            ("/api/core/extraction/jobs/1", "jobs"),
+            ("/api/core/qa/jobs", "jobs"),
+            ("/api/core/providers/p1/items?key=/", "items"),
+            ("/api/core/files/1", "files"),
+            ("/api/core/collections", "files"),
+            ("/api/core/providers", "providers"),
+            ("/api/other", "default"),
+        ],
+    )
+    def test_classifies_urls(self, path: str, group: str) -> None:
+        assert endpoint_group(BASE + path) == group
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_allows_burst_then_spaces_requests(self) -> None:
+        limiter = RateLimiter(RateLimit(rate=100, burst=2))
+
+        started = time.monotonic()
+        waits = [await limiter.acquire(f"{BASE}/api/core/files") for _ in range(4)]
+        elapsed = time.monotonic() - started
+
+        assert waits[:2] == [0.0, 0.0]
+        assert all(wait > 0 for wait in waits[2:])
+        assert elapsed >= 0.015
+
+    @pytest.mark.asyncio
+    async def test_limits_only_configured_groups(self) -> None:
+        limiter = RateLimiter({"jobs": RateLimit(rate=1, burst=1)})
+
+        await limiter.acquire(f"{BASE}/api/core/qa/jobs")
+
+        assert limiter.bucket(f"{BASE}/api/core/files") is None
+        assert await limiter.acquire(f"{BASE}/api/core/files") == 0.0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_default_group(self) -> None:
+        limiter = RateLimiter({"jobs": 1, "default": 50})
+
+        assert limiter.bucket(f"{BASE}/api/core/files") is limiter.bucket(f"{BASE}/api/other")
+
+    def test_rejects_non_positive_rate(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimit(rate=0)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_client_waits_for_rate_limit(
+        self,
+        base_url: str,
+        token: str,
+        provider_page_payload: dict,
+    ) -> None:
+        respx.get(f"{base_url}/api/core/providers").mock(return_value=Response(200, json=provider_page_payload))
+        client = BiolevateClient(base_url=base_url, token=token, rate_limit={"providers": RateLimit(rate=50, burst=1)})
+
+        for _ in range(3):
+            await client.providers.list()
+
+        assert client.stats.throttled_seconds > 0
+        assert client.stats.requests == 3
+
+
+class TestAdaptiveConcurrency:
+    def test_grows_additively_while_healthy(self) -> None:
+        controller = AdaptiveConcurrency(initial=2, maximum=3)
+
+        for _ in range(2):
+            controller.record(0.1, 200)
+        assert controller.limit == 3
+        for _ in range(10):
+            controller.record(0.1, 200)
+        assert controller.limit == 3
+
+    def test_backs_off_on_throttling(self) -> None:
+        controller = AdaptiveConcurrency(initial=16)
+
+        controller.record(0.1, 429)
+
+        assert controller.limit == 8
+
+    def test_backs_off_on_latency_spike(self) -> None:
+        controller = AdaptiveConcurrency(initial=16, latency_tolerance=2.0)
+        controller.record(0.01, 200)
+
+        controller.record(0.5, 200)
+
+        assert controller.limit == 8
+
+    def test_backs_off_on_failures_without_response(self) -> None:
+        controller = AdaptiveConcurrency(initial=16)
+        controller.record(0.1, 200)
+
+        controller.record(0.001, None)
+
+        assert controller.limit == 8
+        assert controller._baseline == 0.1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_client_backs_off_on_connection_errors(self) -> None:
+        controller = AdaptiveConcurrency(initial=16)
+        respx.get(f"{BASE}/api/core/providers").mock(side_effect=httpx.ConnectTimeout("timed out"))
+        client = BiolevateClient(base_url=BASE, token="t", adaptive_concurrency=controller)
+
+        with pytest.raises(httpx.ConnectTimeout):
+            await client.providers.list()
+
+        assert controller.limit == 8
+        assert controller.in_flight == 0
+
+    def test_never_goes_below_minimum(self) -> None:
+        controller = AdaptiveConcurrency(initial=2, minimum=2)
+
+        controller.record(0.1, 503)
+
+        assert controller.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_caps_requests_in_flight(self) -> None:
+        controller = AdaptiveConcurrency(initial=2)
+        peak = 0
+
+        async def request() -> None:
+            nonlocal peak
+            async with controller.slot():
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.001)
+
+        await asyncio.gather(*(request() for _ in range(10)))
+
+        assert peak == 2
+        assert controller.in_flight == 0
+
+    def test_rejects_inconsistent_bounds(self) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(initial=1, minimum=2)
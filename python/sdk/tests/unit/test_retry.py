@@ -0,0 +1,137 @@
+"""Unit tests for the retry policy and the retrying transport."""
+
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from biolevate import APIError, BiolevateClient, Retry, retry_policy
+from biolevate._backoff import Backoff
+
+PROVIDER_ID = "550e8400-e29b-41d4-a716-446655440000"
+FAST = Backoff(initial=0.001, maximum=0.001, jitter=0)
+
+
+@pytest.fixture
+def retrying_client(base_url: str, token: str) -> BiolevateClient:
+    return BiolevateClient(base_url=base_url, token=token, retries=Retry(total=2, backoff=FAST))
+
+
+class TestRetryPolicy:
+    def test_from_config(self) -> None:
+        assert Retry.from_config(None).total == 0
+        assert Retry.from_config(4).total == 4
+        policy = Retry(total=1)
+        assert Retry.from_config(policy) is policy
+
+    def test_only_retries_idempotent_methods_on_status(self) -> None:
+        policy = Retry(total=3)
+
+        assert policy.can_retry_status("GET", 503, 0)
+        assert not policy.can_retry_status("POST", 503, 0)
+        assert not policy.can_retry_status("GET", 500, 0)
+        assert not policy.can_retry_status("GET", 503, 3)
+
+    def test_retries_connection_failures_before_sending_for_any_method(self) -> None:
+        policy = Retry(total=1)
+
+        assert policy.can_retry_error("POST", httpx.ConnectError("refused"), 0)
+        assert not policy.can_retry_error("POST", httpx.ReadError("reset"), 0)
+        assert policy.can_retry_error("GET", httpx.ReadError("reset"), 0)
+
+    def test_honors_retry_after_seconds_and_dates(self) -> None:
+        policy = Retry(backoff=FAST, max_retry_after=30)
+
+        assert policy.delay(0, "2") == 2
+        assert policy.delay(0, "3600") == 30
+        assert 3 < policy.delay(0, formatdate(time.time() + 5, usegmt=True)) <= 5
+        assert policy.delay(0, "soon") == pytest.approx(0.001)
+        assert Retry(backoff=FAST, respect_retry_after=False).delay(0, "2") == pytest.approx(0.001)
+
+
+@pytest.mark.asyncio
+class TestTransportRetries:
+    @respx.mock
+    async def test_retries_transient_statuses(
+        self,
+        retrying_client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            side_effect=[
+                Response(503),
+                Response(429, headers={"Retry-After": "0"}),
+                Response(200, json=provider_payload),
+            ]
+        )
+
+        provider = await retrying_client.providers.get(PROVIDER_ID)
+
+        assert provider.name == provider_payload["name"]
+        assert route.call_count == 3
+        assert retrying_client.stats.requests == 3
+        assert retrying_client.stats.retries == 2
+
+    @respx.mock
+    async def test_gives_up_after_total_retries(self, retrying_client: BiolevateClient, base_url: str) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(return_value=Response(502))
+
+        with pytest.raises(APIError) as exc_info:
+            await retrying_client.providers.get(PROVIDER_ID)
+
+        assert exc_info.value.status_code == 502
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_retries_connection_errors(
+        self,
+        retrying_client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            side_effect=[httpx.ConnectError("refused"), Response(200, json=provider_payload)]
+        )
+
+        await retrying_client.providers.get(PROVIDER_ID)
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_does_not_retry_post_by_default(self, retrying_client: BiolevateClient, base_url: str) -> None:
+        route = respx.post(f"{base_url}/api/core/collections").mock(return_value=Response(503))
+
+        with pytest.raises(APIError):
+            await retrying_client.collections.create(name="Trials")
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_policy_can_be_overridden_per_operation(
+        self,
+        retrying_client: BiolevateClient,
+        base_url: str,
+        collection_payload: dict,
+    ) -> None:
+        route = respx.post(f"{base_url}/api/core/collections").mock(
+            side_effect=[Response(503), Response(201, json=collection_payload)]
+        )
+
+        with retry_policy(Retry(total=1, backoff=FAST, methods=frozenset({"POST"}))):
+            await retrying_client.collections.create(name="Trials")
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_retries_are_disabled_by_default(self, client: BiolevateClient, base_url: str) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(return_value=Response(503))
+
+        with pytest.raises(APIError):
+            await client.providers.get(PROVIDER_ID)
+
+        assert route.call_count == 1
+        assert client.stats.retries == 0
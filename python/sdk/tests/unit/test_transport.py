@@ -0,0 +1,174 @@
+"""Unit tests for the connection options of the transport."""
+
+import gzip
+import importlib.util
+import json
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from biolevate import BiolevateClient, ConnectionOptions, NotFoundError
+from biolevate._transport import Transport
+
+PROVIDER_ID = "550e8400-e29b-41d4-a716-446655440000"
+FILE_IDS = [f"f11e0000-0000-4000-8000-{index:012d}" for index in range(500)]
+
+
+def _question():
+    from biolevate_client.models import EliseQuestionInput
+
+    return EliseQuestionInput.model_validate(
+        {"question": "What is the company name?", "answerType": {"dataType": "STRING"}}
+    )
+
+
+def _transport(client: BiolevateClient) -> Transport:
+    transport = client._get_client().rest_client
+    assert isinstance(transport, Transport)
+    return transport
+
+
+class TestConnectionOptions:
+    def test_pool_uses_limits_and_timeouts(self, base_url: str, token: str) -> None:
+        options = ConnectionOptions(
+            max_connections=12,
+            max_keepalive_connections=6,
+            keepalive_expiry=10.0,
+            connect_timeout=2.0,
+            read_timeout=60.0,
+        )
+        client = BiolevateClient(base_url=base_url, token=token, connection=options)
+
+        pool = _transport(client)._create_pool_manager()
+        limits = pool._transport._pool._max_connections, pool._transport._pool._max_keepalive_connections
+
+        assert limits == (12, 6)
+        assert pool._transport._pool._keepalive_expiry == 10.0
+        assert pool.timeout.connect == 2.0
+        assert pool.timeout.read == 60.0
+        assert pool.timeout.write == 300.0
+
+    def test_max_connections_defaults_to_configuration(self, client: BiolevateClient) -> None:
+        pool = _transport(client)._create_pool_manager()
+
+        assert pool._transport._pool._max_connections == client._get_client().configuration.connection_pool_maxsize
+
+    def test_http2_requires_h2(self, base_url: str, token: str, monkeypatch) -> None:
+        monkeypatch.setattr(importlib.util, "find_spec", lambda _name: None)
+        client = BiolevateClient(base_url=base_url, token=token, connection=ConnectionOptions(http2=True))
+
+        with pytest.raises(ImportError, match="biolevate\\[http2\\]"):
+            _transport(client)._create_pool_manager()
+
+
+@pytest.mark.asyncio
+class TestTransportConnections:
+    @respx.mock
+    async def test_requests_use_configured_timeout(self, base_url: str, token: str) -> None:
+        route = respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            return_value=Response(404, json={"message": "not found"})
+        )
+        client = BiolevateClient(base_url=base_url, token=token, connection=ConnectionOptions(read_timeout=42.0))
+
+        with pytest.raises(NotFoundError):
+            await client.providers.get(PROVIDER_ID)
+
+        assert route.calls.last.request.extensions["timeout"]["read"] == 42.0
+
+    @respx.mock
+    async def test_prewarms_connections_on_enter(self, base_url: str, token: str) -> None:
+        route = respx.head(base_url).mock(return_value=Response(404))
+        client = BiolevateClient(base_url=base_url, token=token, connection=ConnectionOptions(prewarm_connections=3))
+
+        async with client:
+            assert route.call_count == 3
+
+    @respx.mock
+    async def test_prewarm_ignores_connection_errors(self, base_url: str, token: str) -> None:
+        respx.head(base_url).mock(side_effect=httpx.ConnectError("refused"))
+        client = BiolevateClient(base_url=base_url, token=token, connection=ConnectionOptions(prewarm_connections=2))
+
+        async with client:
+            pass
+
+    @respx.mock
+    async def test_does_not_prewarm_by_default(self, client: BiolevateClient, base_url: str) -> None:
+        route = respx.head(base_url).mock(return_value=Response(200))
+
+        async with client:
+            pass
+
+        assert not route.called
+
+
+@pytest.mark.asyncio
+class TestTransportCompression:
+    @respx.mock
+    async def test_counts_compressed_response_bytes(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        provider_payload: dict,
+    ) -> None:
+        body = json.dumps(provider_payload).encode()
+        respx.get(f"{base_url}/api/core/providers/{PROVIDER_ID}").mock(
+            return_value=Response(200, content=gzip.compress(body), headers={"Content-Encoding": "gzip"})
+        )
+
+        provider = await client.providers.get(PROVIDER_ID)
+
+        assert provider.name == provider_payload["name"]
+        assert client.stats.bytes_received_decoded == len(body)
+        assert 0 < client.stats.bytes_received < len(body) + 32
+
+    @respx.mock
+    async def test_compresses_large_json_bodies(
+        self,
+        base_url: str,
+        token: str,
+        job_payload: dict,
+    ) -> None:
+        route = respx.post(f"{base_url}/api/core/qa/jobs").mock(return_value=Response(200, json=job_payload))
+        client = BiolevateClient(base_url=base_url, token=token, connection=ConnectionOptions(compress_requests=True))
+
+        await client.qa.create_job(questions=[_question()], file_ids=FILE_IDS)
+
+        request = route.calls.last.request
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(gzip.decompress(request.content))["files"]["fileIds"] == FILE_IDS
+        assert client.stats.bytes_sent == len(request.content)
+        assert client.stats.bytes_sent < client.stats.bytes_sent_uncompressed
+        assert client.stats.compression_ratio < 1
+
+    @respx.mock
+    async def test_sends_small_bodies_uncompressed(
+        self,
+        base_url: str,
+        token: str,
+        job_payload: dict,
+    ) -> None:
+        route = respx.post(f"{base_url}/api/core/qa/jobs").mock(return_value=Response(200, json=job_payload))
+        client = BiolevateClient(base_url=base_url, token=token, connection=ConnectionOptions(compress_requests=True))
+
+        await client.qa.create_job(questions=[_question()], file_ids=FILE_IDS[:1])
+
+        request = route.calls.last.request
+        assert "Content-Encoding" not in request.headers
+        assert json.loads(request.content)["files"]["fileIds"] == FILE_IDS[:1]
+        assert client.stats.bytes_sent == client.stats.bytes_sent_uncompressed == len(request.content)
+
+    @respx.mock
+    async def test_does_not_compress_by_default(
+        self,
+        client: BiolevateClient,
+        base_url: str,
+        job_payload: dict,
+    ) -> None:
+        route = respx.post(f"{base_url}/api/core/qa/jobs").mock(return_value=Response(200, json=job_payload))
+
+        await client.qa.create_job(questions=[_question()], file_ids=FILE_IDS)
+
+        assert "Content-Encoding" not in route.calls.last.request.headers
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Patch the generated API methods to await the deserialization of responses.
+
+OpenAPI Generator's Python client calls the synchronous
+`ApiClient.response_deserialize` from its async API methods, so JSON
+decoding and model validation always run on the event loop. This patch adds
+an awaitable `ApiClient.response_deserialize_async`, which deserializes
+inline by default, and makes the API methods await it. A subclass can then
+move the deserialization of large responses off the event loop.
+
+Run after `make generate-python`.
+"""
+
+from pathlib import Path
+
+CLIENT_PACKAGE_DIR = Path(__file__).resolve().parent.parent / "python" / "client" / "biolevate_client"
+
+MARKER = "# Awaitable deserialization (patched, see tools/patch-async-deserialize.py)"
+
+OLD_CALL = """        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ){suffix}
+"""
+
+NEW_CALL = """        return {prefix}await self.api_client.response_deserialize_async(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ){suffix}
+"""
+
+OLD_METHOD_END = """        return ApiResponse(
+            status_code = response_data.status,
+            data = return_data,
+            headers = response_data.headers,
+            raw_data = response_data.data
+        )
+"""
+
+NEW_METHOD = '''
+    {marker}
+    async def response_deserialize_async(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Optional[Dict[str, ApiResponseT]]=None
+    ) -> ApiResponse[ApiResponseT]:
+        """Deserializes response into an object, awaitably.
+
+        Deserializes inline; subclasses may deserialize off the event loop.
+        :param response_data: RESTResponse object to be deserialized.
+        :param response_types_map: dict of response types.
+        :return: ApiResponse
+        """
+        return self.response_deserialize(response_data, response_types_map)
+'''
+
+
+def patch_api_client(path: Path) -> bool:
+    """Add response_deserialize_async to the generated ApiClient. Returns True if patched."""
+    content = path.read_text()
+    if MARKER in content or OLD_METHOD_END not in content:
+        return False
+    content = content.replace(OLD_METHOD_END, OLD_METHOD_END + NEW_METHOD.format(marker=MARKER), 1)
+    path.write_text(content)
+    return True
+
+
+def patch_api_module(path: Path) -> bool:
+    """Make the API methods of a module await the deserialization. Returns True if patched."""
+    content = path.read_text()
+    if MARKER in content:
+        return False
+
+    # Methods returning the data need parentheses, as `.data` binds tighter than `await`.
+    patched = content.replace(OLD_CALL.format(suffix=".data"), NEW_CALL.format(prefix="(", suffix=").data"))
+    patched = patched.replace(OLD_CALL.format(suffix=""), NEW_CALL.format(prefix="", suffix=""))
+    if patched == content:
+        return False
+    path.write_text(f"{MARKER}\n{patched}")
+    return True
+
+
+def main() -> int:
+    if not CLIENT_PACKAGE_DIR.is_dir():
+        print(f"Client package not found: {CLIENT_PACKAGE_DIR}")
+        return 1
+
+    patched = []
+    if patch_api_client(CLIENT_PACKAGE_DIR / "api_client.py"):
+        patched.append("api_client.py")
+    for py_file in sorted((CLIENT_PACKAGE_DIR / "api").glob("*_api.py")):
+        if patch_api_module(py_file):
+            patched.append(f"api/{py_file.name}")
+
+    if patched:
+        print(f"Patched {len(patched)} files with awaitable deserialization:")
+        for name in patched:
+            print(f"  - {name}")
+    else:
+        print("No files needed patching (already patched).")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
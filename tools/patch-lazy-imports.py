@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Patch the generated package __init__ files to import their members lazily.
+
+OpenAPI Generator's Python client imports every API class and every model
+from `biolevate_client`, `biolevate_client.api` and `biolevate_client.models`,
+so importing any of them loads pydantic, dateutil, httpx and the ~70 model
+modules. This patch replaces those imports with a PEP 562 module
+`__getattr__` that imports a member on first access. The original imports
+are kept under `if TYPE_CHECKING:` for type checkers and IDEs.
+
+Run after `make generate-python`.
+"""
+
+import re
+from pathlib import Path
+
+CLIENT_PACKAGE_DIR = Path(__file__).resolve().parent.parent / "python" / "client" / "biolevate_client"
+
+INIT_FILES = ["__init__.py", "api/__init__.py", "models/__init__.py"]
+
+MARKER = "# Lazy imports (patched, see tools/patch-lazy-imports.py)"
+
+IMPORT_RE = re.compile(r"^from (?P<module>[\w.]+) import (?P<name>\w+)(?: as (?P<alias>\w+))?$")
+
+LAZY_BLOCK = '''{marker}
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+_LAZY_IMPORTS = {{
+{entries}
+}}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if _TYPE_CHECKING:
+{imports}
+'''
+
+
+def patch_file(path: Path) -> bool:
+    """Patch a single file. Returns True if patched."""
+    content = path.read_text()
+
+    if MARKER in content:
+        return False
+
+    kept = []
+    imports = []
+    entries = []
+    for line in content.splitlines():
+        match = IMPORT_RE.match(line)
+        if match is None:
+            kept.append(line)
+            continue
+        name = match["alias"] or match["name"]
+        if name != match["name"]:
+            # Aliased imports would need a second mapping; the generator only emits "X as X".
+            kept.append(line)
+            continue
+        imports.append(f"    {line}")
+        entries.append(f'    "{name}": "{match["module"]}",')
+
+    if not imports:
+        return False
+
+    # Drop the generator's "# import ..." comments left without imports.
+    kept = [line for line in kept if not line.startswith("# import ")]
+    body = re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).rstrip() + "\n\n"
+    path.write_text(
+        body + LAZY_BLOCK.format(marker=MARKER, entries="\n".join(entries), imports="\n".join(imports))
+    )
+    return True
+
+
+def main() -> int:
+    if not CLIENT_PACKAGE_DIR.is_dir():
+        print(f"Package directory not found: {CLIENT_PACKAGE_DIR}")
+        return 1
+
+    patched = [name for name in INIT_FILES if patch_file(CLIENT_PACKAGE_DIR / name)]
+
+    if patched:
+        print(f"Patched {len(patched)} files with lazy imports:")
+        for name in patched:
+            print(f"  - {name}")
+    else:
+        print("No files needed patching (already patched).")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Patch generated oneOf classes to dispatch on their discriminator.
+
+OpenAPI Generator's Python client deserializes a oneOf by trying every
+candidate schema in turn and catching the ValidationError of each miss, and
+its from_dict first serializes the dict back to JSON. The spec declares a
+discriminator on the base schema of the candidates (e.g. `type` on
+EliseAnnotationConfig and PositionDto), but the generator ignores it because
+it is not repeated on the oneOf itself.
+
+This patch adds the discriminator mapping to each oneOf class whose
+candidates are exactly the targets of a discriminator, and makes from_dict
+and from_json build the single matching class directly. Payloads with a
+missing or unknown discriminator value keep the generated behavior.
+
+Run after `make generate-python`.
+"""
+
+import ast
+import json
+import re
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SPEC_PATH = ROOT_DIR / "openapi" / "biolevate-api.json"
+CLIENT_MODELS_DIR = ROOT_DIR / "python" / "client" / "biolevate_client" / "models"
+
+MARKER = "# Dispatch on the discriminator (patched, see tools/patch-oneof-discriminator.py)"
+
+ONE_OF_RE = re.compile(r"^(?P<prefix>\w+)_ONE_OF_SCHEMAS = (?P<schemas>\[.*\])$", re.MULTILINE)
+
+OLD_FROM_DICT = '''    def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        return cls.from_json(json.dumps(obj))
+'''
+
+NEW_FROM_DICT = '''    def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        {marker}
+        klass = {prefix}_DISCRIMINATOR_MAPPING.get(obj.get("{prop}")) if isinstance(obj, dict) and isinstance(obj.get("{prop}"), str) else None
+        if klass is not None:
+            return cls.model_construct(actual_instance=klass.from_dict(obj))
+        return cls.from_json(json.dumps(obj))
+'''
+
+OLD_FROM_JSON = '''        """Returns the object represented by the json string"""
+        instance = cls.model_construct()
+'''
+
+NEW_FROM_JSON = '''        """Returns the object represented by the json string"""
+        {marker}
+        obj = json.loads(json_str)
+        if isinstance(obj, dict) and isinstance(obj.get("{prop}"), str) and obj["{prop}"] in {prefix}_DISCRIMINATOR_MAPPING:
+            return cls.from_dict(obj)
+
+        instance = cls.model_construct()
+'''
+
+
+def class_name(schema_ref: str) -> str:
+    """Return the generated class name of a schema reference."""
+    return schema_ref.rsplit("/", 1)[-1].replace("_", "")
+
+
+def load_discriminators() -> dict[frozenset[str], tuple[str, dict[str, str]]]:
+    """Return the discriminators of the spec, keyed by the set of classes they map to."""
+    schemas = json.loads(SPEC_PATH.read_text())["components"]["schemas"]
+    discriminators = {}
+    for schema in schemas.values():
+        discriminator = schema.get("discriminator")
+        if not discriminator or "mapping" not in discriminator:
+            continue
+        mapping = {value: class_name(ref) for value, ref in discriminator["mapping"].items()}
+        discriminators[frozenset(mapping.values())] = (discriminator["propertyName"], mapping)
+    return discriminators
+
+
+def patch_file(path: Path, discriminators: dict[frozenset[str], tuple[str, dict[str, str]]]) -> bool:
+    """Patch a single file. Returns True if patched."""
+    content = path.read_text()
+
+    if MARKER in content:
+        return False
+
+    match = ONE_OF_RE.search(content)
+    if match is None:
+        return False
+    discriminator = discriminators.get(frozenset(ast.literal_eval(match["schemas"])))
+    if discriminator is None or OLD_FROM_DICT not in content or OLD_FROM_JSON not in content:
+        return False
+
+    prop, mapping = discriminator
+    prefix = match["prefix"]
+    entries = ", ".join(f'"{value}": {name}' for value, name in sorted(mapping.items()))
+    constants = f'{match[0]}\n{prefix}_DISCRIMINATOR = "{prop}"\n{prefix}_DISCRIMINATOR_MAPPING = {{{entries}}}'
+
+    content = content.replace(match[0], constants, 1)
+    content = content.replace(OLD_FROM_DICT, NEW_FROM_DICT.format(marker=MARKER, prefix=prefix, prop=prop), 1)
+    content = content.replace(OLD_FROM_JSON, NEW_FROM_JSON.format(marker=MARKER, prefix=prefix, prop=prop), 1)
+    path.write_text(content)
+    return True
+
+
+def main() -> int:
+    if not CLIENT_MODELS_DIR.is_dir():
+        print(f"Models directory not found: {CLIENT_MODELS_DIR}")
+        return 1
+
+    discriminators = load_discriminators()
+    patched = [py_file.name for py_file in CLIENT_MODELS_DIR.glob("*.py") if patch_file(py_file, discriminators)]
+
+    if patched:
+        print(f"Patched {len(patched)} files with discriminator dispatch:")
+        for name in sorted(patched):
+            print(f"  - {name}")
+    else:
+        print("No files needed patching (already patched or no discriminated oneOf).")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())